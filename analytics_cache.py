@@ -0,0 +1,307 @@
+"""
+Analytics Cache Module for YouTube Automation
+Persistent TTL cache with stale-while-revalidate for YouTube read calls
+"""
+
+import os
+import json
+import time
+import atexit
+import threading
+from typing import Dict, Any, List, Optional, Callable, Iterable
+
+# Seconds a cached response is served as fresh, per endpoint
+DEFAULT_TTLS = {
+    "channel_info": 3600,
+    "channel_analytics": 900,
+    "video_statistics": 600
+}
+
+# Quota units each cached endpoint costs when it hits the API
+ENDPOINT_QUOTA_COSTS = {
+    "channel_info": 1,
+    "channel_analytics": 1,
+    "video_statistics": 1
+}
+
+# Keys served per API call by batched endpoints
+KEYS_PER_CALL = 50
+
+
+class AnalyticsCache:
+    """
+    Caches YouTube read responses on disk with per-endpoint TTLs
+
+    Within its TTL an entry is returned directly. After the TTL, and for up
+    to ``max_stale`` more seconds, the stale value is still returned at once
+    while a background thread fetches a fresh one (stale-while-revalidate).
+    Older or missing entries are fetched synchronously. Entries are persisted
+    to ``cache_file`` so restarts start warm.
+    """
+
+    def __init__(self,
+                 cache_file: str,
+                 ttls: Optional[Dict[str, int]] = None,
+                 max_stale: int = 24 * 3600,
+                 flush_interval: float = 5.0):
+        """
+        Initialize the AnalyticsCache
+
+        Args:
+            cache_file: JSON file the cache is persisted to
+            ttls: Per-endpoint TTL overrides in seconds
+            max_stale: Seconds past the TTL a stale entry may still be served
+            flush_interval: Minimum seconds between writes to cache_file
+        """
+        self.cache_file = cache_file
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.max_stale = max_stale
+        self.flush_interval = flush_interval
+
+        self._lock = threading.RLock()
+        # Held across snapshot and write so flushes land on disk in order
+        self._write_lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._refreshing = set()
+        self._dirty = False
+        self._last_flush = 0.0
+        # Bumped by invalidate() so fetches started before it are not stored
+        self._generation = 0
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "background_refreshes": 0,
+            "refresh_errors": 0,
+            "quota_units_saved": 0
+        }
+        self._load()
+        atexit.register(self.flush)
+
+    def _load(self):
+        """Load persisted entries"""
+        if not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        self._entries = data.get("entries", {})
+        self._stats["quota_units_saved"] = data.get("quota_units_saved", 0)
+
+    def flush(self, force: bool = True):
+        """
+        Persist the cache to disk atomically
+
+        Snapshots are taken and written under the write lock, so a flush
+        can never replace the file with an older snapshot than the last one.
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                if not force and time.time() - self._last_flush < self.flush_interval:
+                    return
+                payload = json.dumps({"entries": self._entries,
+                                      "quota_units_saved": self._stats["quota_units_saved"]},
+                                     separators=(',', ':'))
+                self._dirty = False
+                self._last_flush = time.time()
+            directory = os.path.dirname(self.cache_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.cache_file}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.cache_file)
+
+    def _cache_key(self, endpoint: str, key: str) -> str:
+        return f"{endpoint}:{key}"
+
+    def _store(self, endpoint: str, key: str, value: Any, generation: Optional[int] = None):
+        """
+        Save a freshly fetched value
+
+        Args:
+            endpoint: Endpoint name
+            key: Cache key within the endpoint
+            value: Fetched value
+            generation: Invalidation generation read before fetching; the value
+                is dropped if invalidate() has run since
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[self._cache_key(endpoint, key)] = {"value": value, "fetched_at": time.time()}
+            self._dirty = True
+        self.flush(force=False)
+
+    def _lookup(self, endpoint: str, key: str):
+        """
+        Classify a cached entry
+
+        Returns:
+            Tuple of (state, value) where state is "fresh", "stale" or "missing"
+        """
+        entry = self._entries.get(self._cache_key(endpoint, key))
+        if entry is None:
+            return "missing", None
+        age = time.time() - entry["fetched_at"]
+        ttl = self.ttls.get(endpoint, 300)
+        if age <= ttl:
+            return "fresh", entry["value"]
+        if age <= ttl + self.max_stale:
+            return "stale", entry["value"]
+        return "missing", None
+
+    def _record_hit(self, endpoint: str, stale: bool, count: int = 1, calls: int = 1):
+        with self._lock:
+            self._stats["stale_hits" if stale else "hits"] += count
+            self._stats["quota_units_saved"] += ENDPOINT_QUOTA_COSTS.get(endpoint, 1) * calls
+
+    def _refresh_in_background(self, refresh_id: str, refresh_fn: Callable[[], None]):
+        """Run refresh_fn on a daemon thread unless the same refresh is in flight"""
+        with self._lock:
+            if refresh_id in self._refreshing:
+                return
+            self._refreshing.add(refresh_id)
+
+        def run():
+            try:
+                refresh_fn()
+                with self._lock:
+                    self._stats["background_refreshes"] += 1
+            except Exception as e:
+                print(f"Background refresh of {refresh_id} failed: {str(e)}")
+                with self._lock:
+                    self._stats["refresh_errors"] += 1
+            finally:
+                with self._lock:
+                    self._refreshing.discard(refresh_id)
+
+        threading.Thread(target=run, name=f"cache-refresh-{refresh_id}", daemon=True).start()
+
+    def get_or_fetch(self, endpoint: str, key: str, fetch_fn: Callable[..., Any],
+                     background_fetch_fn: Optional[Callable[..., Any]] = None) -> Any:
+        """
+        Get a cached value, fetching or revalidating it as needed
+
+        Args:
+            endpoint: Endpoint name (selects the TTL)
+            key: Cache key within the endpoint
+            fetch_fn: Callable returning a fresh value
+            background_fetch_fn: Callable used for background refreshes
+                (e.g. one using its own HTTP transport); defaults to fetch_fn
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        with self._lock:
+            state, value = self._lookup(endpoint, key)
+            generation = self._generation
+        if state == "fresh":
+            self._record_hit(endpoint, stale=False)
+            return value
+        if state == "stale":
+            self._record_hit(endpoint, stale=True)
+            refresher = background_fetch_fn or fetch_fn
+            self._refresh_in_background(
+                self._cache_key(endpoint, key),
+                lambda: self._store(endpoint, key, refresher(), generation)
+            )
+            return value
+
+        with self._lock:
+            self._stats["misses"] += 1
+        value = fetch_fn()
+        self._store(endpoint, key, value, generation)
+        return value
+
+    def get_or_fetch_many(self, endpoint: str, keys: Iterable[str],
+                          fetch_many_fn: Callable[[List[str]], Dict[str, Any]],
+                          background_fetch_many_fn: Optional[Callable[[List[str]], Dict[str, Any]]] = None
+                          ) -> Dict[str, Any]:
+        """
+        Get cached values for many keys, fetching the missing ones in one batch
+
+        Args:
+            endpoint: Endpoint name (selects the TTL)
+            keys: Cache keys within the endpoint
+            fetch_many_fn: Callable taking a list of keys and returning a dict of values
+            background_fetch_many_fn: Batch fetcher used for background refreshes
+
+        Returns:
+            Dict of key to value for every key that has one
+        """
+        results = {}
+        stale_keys = []
+        missing_keys = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                state, value = self._lookup(endpoint, key)
+                if state == "missing":
+                    missing_keys.append(key)
+                    continue
+                results[key] = value
+                if state == "stale":
+                    stale_keys.append(key)
+            generation = self._generation
+        fresh_count = len(results) - len(stale_keys)
+        if fresh_count:
+            self._record_hit(endpoint, stale=False, count=fresh_count,
+                             calls=-(-fresh_count // KEYS_PER_CALL))
+        if stale_keys:
+            self._record_hit(endpoint, stale=True, count=len(stale_keys),
+                             calls=-(-len(stale_keys) // KEYS_PER_CALL))
+            refresher = background_fetch_many_fn or fetch_many_fn
+
+            def refresh_stale():
+                for key, value in refresher(stale_keys).items():
+                    self._store(endpoint, key, value, generation)
+
+            self._refresh_in_background(f"{endpoint}:batch:{','.join(stale_keys)}", refresh_stale)
+
+        if missing_keys:
+            with self._lock:
+                self._stats["misses"] += len(missing_keys)
+            fetched = fetch_many_fn(missing_keys)
+            with self._lock:
+                if generation == self._generation:
+                    now = time.time()
+                    for key, value in fetched.items():
+                        self._entries[self._cache_key(endpoint, key)] = {"value": value, "fetched_at": now}
+                    self._dirty = True
+            self.flush(force=False)
+            results.update(fetched)
+        return results
+
+    def invalidate(self, endpoint: Optional[str] = None, key: Optional[str] = None):
+        """
+        Drop cached entries
+
+        Args:
+            endpoint: Endpoint to invalidate; all endpoints if None
+            key: Single key within the endpoint; the whole endpoint if None
+        """
+        with self._lock:
+            self._generation += 1
+            if endpoint is None:
+                self._entries.clear()
+            elif key is not None:
+                self._entries.pop(self._cache_key(endpoint, key), None)
+            else:
+                prefix = f"{endpoint}:"
+                for cache_key in [k for k in self._entries if k.startswith(prefix)]:
+                    del self._entries[cache_key]
+            self._dirty = True
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counts and the API quota units saved"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            return stats
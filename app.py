@@ -1,25 +1,325 @@
 # app.py (Streamlit frontend) 
 import streamlit as st
-import requests
-import json
 import os
 from datetime import datetime
-import time
-from youtube_api_implementation import setup_youtube_api
+import uuid
+import functools
 from fact_generation import FactGenerator
+from fact_store import FactStore
+from content_store import ContentStore, DEFAULT_PAGE_SIZE
+from event_log import (EventLog, EVENT_FACTS_GENERATED, EVENT_SCRIPT_CREATED, EVENT_VIDEO_ASSEMBLED,
+                       EVENT_VIDEO_PUBLISHED)
 from script_creation import ScriptGenerator
 from video_assembly import VideoAssembler
+from video_manifest import VideoManifest
+from render_scheduler import RenderScheduler
+from channel_registry import ChannelRegistry, DEFAULT_CHANNEL
+from upload_staging import UploadStaging
+from quota_ledger import QuotaBudgetExceeded
+from settings_store import (SettingsStore, VIDEO_QUALITIES, PUBLISHING_SCHEDULES, WEEKDAYS, FACT_SOURCES,
+                            MEDIA_SOURCES, NOTIFICATION_EVENTS, CLEANUP_OPTIONS)
+from publish_scheduler import PublishScheduler, STATUS_PUBLISHED, STATUS_FAILED as PUBLISH_FAILED, chain
+from task_runner import TaskRunner, STATUS_QUEUED, STATUS_RUNNING, STATUS_SUCCEEDED, STATUS_FAILED
 import config
 
-# Initialize YouTube API
+# Every channel's credentials, quota ledger, analytics cache and client, shared by all sessions;
+# the Google client libraries load when a channel's client is first used, not at startup
 @st.cache_resource
-def get_youtube_api():
+def get_channel_registry():
+    registry = ChannelRegistry(config.CHANNELS_FILE, config.CHANNELS_DIR, daily_limit=config.YOUTUBE_DAILY_QUOTA)
+    # The single-channel token from before channels could be added becomes the default channel
+    if os.path.exists(config.TOKEN_FILE) and registry.get_channel(DEFAULT_CHANNEL) is None:
+        registry.add_channel(
+            DEFAULT_CHANNEL,
+            "Default channel",
+            token_file=config.TOKEN_FILE,
+            client_secrets_file=config.CLIENT_SECRETS_FILE if os.path.exists(config.CLIENT_SECRETS_FILE) else None,
+            ledger_file=config.QUOTA_LEDGER_FILE,
+            cache_file=config.ANALYTICS_CACHE_FILE
+        )
+    return registry
+
+# Staging area for uploaded video files, shared by all sessions
+@st.cache_resource
+def get_upload_staging():
+    staging = UploadStaging(config.UPLOAD_STAGING_DIR)
+    staging.cleanup()
+    return staging
+
+# Content components are built once per server process and reused by every rerun;
+# "Restart Components" in Settings clears them
+@st.cache_resource
+def get_fact_generator():
+    return FactGenerator(api_key=config.OPENAI_API_KEY)
+
+# Generated facts, shared by all sessions and read by the Video Creation page
+@st.cache_resource
+def get_fact_store():
+    return FactStore(config.FACT_STORE_FILE)
+
+# Scripts, videos and uploads live in SQLite so pages list them a page at a time
+@st.cache_resource
+def get_content_store():
+    return ContentStore(config.CONTENT_DB_FILE)
+
+# Settings are parsed once and re-read only when settings.json changes
+@st.cache_resource
+def get_settings_store():
+    return SettingsStore(config.SETTINGS_FILE)
+
+# Pipeline events behind the Dashboard metrics; the backend appends to the same log
+@st.cache_resource
+def get_event_log():
+    return EventLog(config.EVENT_LOG_FILE)
+
+# Dashboard metrics and activity feed wording per event type
+EVENT_METRICS = [
+    (EVENT_FACTS_GENERATED, "Facts Generated", "Content generated"),
+    (EVENT_SCRIPT_CREATED, "Scripts Created", "Script created"),
+    (EVENT_VIDEO_ASSEMBLED, "Videos Assembled", "Video created"),
+    (EVENT_VIDEO_PUBLISHED, "Videos Published", "Video published")
+]
+
+@st.cache_resource
+def get_script_generator():
+    return ScriptGenerator()
+
+@st.cache_resource
+def get_video_assembler():
+    return VideoAssembler(output_dir=config.OUTPUT_DIR, assets_dir=config.ASSETS_DIR,
+                          manifest=VideoManifest(config.VIDEO_MANIFEST_DIR))
+
+# Shared scheduler so renders and uploads from all sessions share CPU, disk and network budgets
+@st.cache_resource
+def get_render_scheduler():
+    return RenderScheduler()
+
+# Shared runner for long actions, so they keep going across reruns and browser disconnects
+@st.cache_resource
+def get_task_runner():
+    return TaskRunner(config.TASKS_FILE, max_workers=8)
+
+# Seconds between refreshes of the background task panel
+TASK_POLL_SECONDS = 2
+
+# Background task bodies; they run on runner threads, so they take their components as
+# arguments and must not call Streamlit
+def generate_facts_task(progress, fact_generator, fact_store, event_log, categories, num_facts, fact_length, reliability):
+    progress(0.0, "Generating interesting facts...")
+    if fact_generator.api_key:
+        facts = fact_generator.generate_facts(categories, num_facts, fact_length=fact_length,
+                                              reliability=reliability)
+    else:
+        # Without an OpenAI key, fall back to the bundled sample facts
+        facts = fact_generator.get_sample_facts(categories, num_facts)
+    stored = fact_store.add_facts(facts)
+    event_log.record(EVENT_FACTS_GENERATED, f"{len(stored)} facts about {', '.join(categories)}", count=len(stored))
+    return {"facts": stored}
+
+def create_script_task(progress, script_generator, content_store, event_log, owner, facts, title, include_sources):
+    progress(0.0, "Creating engaging scripts...")
+    script_data = script_generator.create_script_with_sections(
+        facts=facts,
+        title=title,
+        include_sources=include_sources
+    )
+    script_id = content_store.add_script(owner, script_data)
+    event_log.record(EVENT_SCRIPT_CREATED, script_data["title"])
+    return {"script_id": script_id, "title": script_data["title"],
+            "estimated_duration": script_data["estimated_duration"]}
+
+def create_video_task(progress, scheduler, assembler, content_store, event_log, owner, script_id, output_path, **options):
+    script_data = content_store.get_script(script_id)
+    progress(0.0, "Waiting for a render slot...")
+    # Create video ahead of queued backfill renders
+    video_path = scheduler.submit_render(
+        assembler,
+        script_data,
+        output_path,
+        priority="interactive",
+        **options
+    ).result()
+    video_info = {
+        "path": video_path,
+        "title": script_data["title"],
+        "duration": script_data["estimated_duration"],
+        "script_id": script_id
+    }
+    video_info["id"] = content_store.add_video(owner, video_info)
+    event_log.record(EVENT_VIDEO_ASSEMBLED, video_info["title"])
+    return video_info
+
+def quick_video_task(progress, script_generator, scheduler, assembler, content_store, event_log, owner,
+                     facts, title, output_path, **options):
+    # Script and render in one task, for the Dashboard's Create Videos action
+    script = create_script_task(progress, script_generator, content_store, event_log, owner, facts, title, False)
+    return create_video_task(progress, scheduler, assembler, content_store, event_log, owner,
+                             script["script_id"], output_path, **options)
+
+def upload_video_task(progress, scheduler, youtube_api, staging, content_store, event_log, owner,
+                      file_path, title, description, **options):
+    progress(0.0, "Starting upload...")
+    
+    def record_progress(uploaded, total):
+        progress(uploaded / total if total else 0.0,
+                 f"Uploaded {uploaded // (1024 * 1024)} MB of {total // (1024 * 1024)} MB")
+    
+    response = scheduler.submit_upload(
+        youtube_api,
+        file_path,
+        title,
+        description,
+        priority="interactive",
+        progress_callback=record_progress,
+        **options
+    ).result()
+    # Drop the staged copy once uploaded; after a failure it is kept so a retry resumes
+    staging.release(file_path)
+    if response:
+        content_store.add_upload(owner, response)
+        event_log.record(EVENT_VIDEO_PUBLISHED, title)
+    return response
+
+# Scheduled publishing bodies; they run on the publish scheduler's threads
+def prestage_scheduled_video(scheduler, assembler, content_store, event_log, settings_store, item):
+    # Rendered before the slot (or after a restart), so only the upload is left when it comes
+    if item.get("path") and os.path.exists(item["path"]):
+        return {}
+    script_data = content_store.get_script(item["script_id"])
+    if script_data is None:
+        raise ValueError("The script for this video is no longer available")
+    output_path = os.path.join(assembler.output_dir, f"scheduled_{item['id'][:8]}.mp4")
+    render = scheduler.submit_render(assembler, script_data, output_path, priority="scheduled",
+                                     resolution=settings_store.get().workflow.resolution)
+
+    # Recorded when the render finishes, without holding a publish thread while it runs
+    def record(video_path):
+        video_info = {
+            "path": video_path,
+            "title": script_data["title"],
+            "duration": script_data["estimated_duration"],
+            "script_id": item["script_id"]
+        }
+        content_store.add_video(item.get("owner", item["channel"]), video_info, task_id=f"scheduled:{item['id']}")
+        event_log.record(EVENT_VIDEO_ASSEMBLED, video_info["title"])
+        return {"path": video_path}
+
+    return chain(render, record)
+
+def publish_scheduled_video(scheduler, channel_registry, content_store, event_log, item):
+    # Routed to the channel's own client, authenticated once per process
+    youtube_api = channel_registry.client(item["channel"])
+    response = scheduler.submit_upload(
+        youtube_api,
+        item["path"],
+        item["title"],
+        item["description"],
+        priority="scheduled",
+        tags=item.get("tags"),
+        category_id=item.get("category_id", "22"),
+        privacy_status=item.get("privacy_status", "private"),
+        notify_subscribers=item.get("notify_subscribers", False)
+    ).result()
+    if response:
+        content_store.add_upload(item.get("owner", item["channel"]), response, task_id=f"scheduled:{item['id']}")
+        event_log.record(EVENT_VIDEO_PUBLISHED, item["title"])
+    return response
+
+# Publishes queued videos at the Workflow Settings schedule, in the background of the server process
+@st.cache_resource
+def get_publish_scheduler():
+    return PublishScheduler(
+        config.PUBLISH_QUEUE_FILE,
+        prestage=functools.partial(prestage_scheduled_video, get_render_scheduler(), get_video_assembler(),
+                                   get_content_store(), get_event_log(), get_settings_store()),
+        publish=functools.partial(publish_scheduled_video, get_render_scheduler(), get_channel_registry(),
+                                  get_content_store(), get_event_log()),
+        schedule_for=lambda channel: get_settings_store().get().workflow
+    )
+
+def fill_seo_template(template, script_data):
+    """Fill {fact_number} and {facts} in an SEO template from a script"""
+    facts = "\n".join(f"• {fact.get('text') or fact.get('content', '')}" for fact in script_data.get("facts", []))
+    return template.replace("{fact_number}", str(script_data.get("fact_count", 0))).replace("{facts}", facts)
+
+def fetch_or_defer(youtube_api, method, fetch_fn):
+    """Run a low-priority fetch now, or queue it until the quota allows once only the upload reserve is left"""
     try:
-        return setup_youtube_api(token_file=config.TOKEN_FILE)
-    except Exception as e:
-        st.error(f"Error initializing YouTube API: {str(e)}")
+        return fetch_fn()
+    except QuotaBudgetExceeded:
+        if youtube_api.quota_ledger is None:
+            raise
+        # The deferred call fills the analytics cache, so a later visit shows its result
+        youtube_api.schedule(method, fetch_fn)
+        st.info("Only the upload reserve of today's YouTube quota is left; this refresh runs once the quota resets.")
         return None
 
+def connect_channel(channel_id):
+    """Route this session's YouTube calls to a registered channel and return its channel info"""
+    youtube_api = get_channel_registry().client(channel_id)
+    st.session_state.youtube_api = youtube_api
+    st.session_state.channel_id = channel_id
+    st.session_state.is_authenticated = True
+    st.session_state.channel_info = youtube_api.get_channel_info()
+    return st.session_state.channel_info
+
+def get_session_owner():
+    """Owner id of this browser's background tasks, kept in the URL so a reload finds them again"""
+    owner = st.query_params.get("session")
+    if not owner:
+        owner = uuid.uuid4().hex
+        st.query_params["session"] = owner
+    return owner
+
+def apply_finished_tasks(owner):
+    """Pick up results of newly succeeded tasks in this session, oldest first"""
+    # A new session restores earlier results quietly
+    restoring = "applied_tasks" not in st.session_state
+    applied = st.session_state.setdefault("applied_tasks", set())
+    for task in reversed(get_task_runner().list_tasks(owner, status=STATUS_SUCCEEDED)):
+        if task["id"] in applied:
+            continue
+        applied.add(task["id"])
+        if task["kind"] == "facts":
+            st.session_state.generated_facts = task["result"]["facts"]
+        if not restoring:
+            st.toast(f"Finished: {task['label']}")
+
+def page_offset(key, total, page_size=DEFAULT_PAGE_SIZE):
+    """Show a page picker for a list of total items and return the offset of the selected page"""
+    pages = max(1, -(-total // page_size))
+    if pages == 1:
+        return 0
+    page_number = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, key=key)
+    return (page_number - 1) * page_size
+
+def render_task_list(owner):
+    tasks = get_task_runner().list_tasks(owner)
+    if not tasks:
+        st.caption("No background tasks yet.")
+        return
+    applied = st.session_state.get("applied_tasks", set())
+    for task in tasks[:10]:
+        if task["status"] in (STATUS_QUEUED, STATUS_RUNNING):
+            st.progress(task["progress"], text=f"{task['label']}: {task['message'] or task['status']}")
+        elif task["status"] == STATUS_SUCCEEDED:
+            st.write(f"✅ {task['label']}")
+        elif task["status"] == STATUS_FAILED:
+            st.write(f"❌ {task['label']}: {task['error']}")
+        else:
+            st.write(f"⏹️ {task['label']} ({task['status']})")
+    if st.button("Clear finished", key="clear_finished_tasks"):
+        get_task_runner().clear_finished(owner)
+        st.rerun()
+    # Rerun the whole page once results are ready, so it shows them
+    if any(task["status"] == STATUS_SUCCEEDED and task["id"] not in applied for task in tasks):
+        st.rerun()
+
+# Polls the task list in place, without rerunning the page
+@st.fragment(run_every=TASK_POLL_SECONDS)
+def render_task_panel(owner):
+    render_task_list(owner)
+
 
 # Page configuration
 st.set_page_config(
@@ -28,23 +328,24 @@ st.set_page_config(
     layout="wide"
 )
 
+# Create the asset, output and cache directories
+config.ensure_dirs()
+
+# Current settings for this run
+settings = get_settings_store().get()
+
+# Start the publish scheduler with the server, so queued slots fire without visiting Publishing
+get_publish_scheduler()
+
 # Initialize session state variables if they don't exist
-if 'facts_generated' not in st.session_state:
-    st.session_state.facts_generated = 0
-if 'scripts_created' not in st.session_state:
-    st.session_state.scripts_created = 0
-if 'videos_assembled' not in st.session_state:
-    st.session_state.videos_assembled = 0
-if 'videos_published' not in st.session_state:
-    st.session_state.videos_published = 0
 if 'youtube_api' not in st.session_state:
     st.session_state.youtube_api = None
 if 'is_authenticated' not in st.session_state:
     st.session_state.is_authenticated = False
 if 'channel_info' not in st.session_state:
     st.session_state.channel_info = None
-if 'uploaded_videos' not in st.session_state:
-    st.session_state.uploaded_videos = []
+if 'channel_id' not in st.session_state:
+    st.session_state.channel_id = None
 
 # Sidebar navigation
 st.sidebar.title("YouTube Automation")
@@ -54,22 +355,60 @@ page = st.sidebar.radio(
     ["Dashboard", "Content Generation", "Video Creation", "Publishing", "Analytics", "Settings", "Help"]
 )
 
+# Background tasks started from this browser
+task_owner = get_session_owner()
+apply_finished_tasks(task_owner)
+with st.sidebar:
+    st.markdown("### Background Tasks")
+    render_task_panel(task_owner)
+
+# YouTube channel this session works with
+channels = get_channel_registry().list_channels()
+if channels:
+    channel_names = {channel["id"]: channel["name"] for channel in channels}
+    channel_ids = list(channel_names)
+    with st.sidebar:
+        st.markdown("### Channel")
+        active_channel = st.selectbox(
+            "Channel",
+            channel_ids,
+            index=channel_ids.index(st.session_state.channel_id) if st.session_state.channel_id in channel_names else 0,
+            format_func=channel_names.get,
+            label_visibility="collapsed"
+        )
+    if active_channel != st.session_state.channel_id:
+        try:
+            connect_channel(active_channel)
+        except Exception as e:
+            # Remember the choice so the failed connection isn't retried on every rerun
+            st.session_state.channel_id = active_channel
+            st.session_state.youtube_api = None
+            st.session_state.is_authenticated = False
+            st.session_state.channel_info = None
+            st.sidebar.error(f"Could not connect to {channel_names[active_channel]}: {str(e)}")
+
 # Dashboard page
 if page == "Dashboard":
     st.title("YouTube Content Automation Dashboard")
     
     # System Status
     st.header("System Status")
-    col1, col2, col3, col4 = st.columns(4)
+    event_log = get_event_log()
     
-    with col1:
-        st.metric("Facts Generated", st.session_state.facts_generated)
-    with col2:
-        st.metric("Scripts Created", st.session_state.scripts_created)
-    with col3:
-        st.metric("Videos Assembled", st.session_state.videos_assembled)
-    with col4:
-        st.metric("Videos Published", st.session_state.videos_published)
+    # Totals and today's counts come from rollups, not from scanning the event log
+    totals = event_log.totals()
+    for col, (event_type, metric_label, _) in zip(st.columns(4), EVENT_METRICS):
+        with col:
+            today = event_log.count_current(event_type, "day")
+            st.metric(metric_label, totals.get(event_type, 0), delta=f"+{today} today" if today else None)
+    
+    # Hourly activity over the last day
+    hourly = {metric_label: [bucket["count"] for bucket in event_log.series(event_type, "hour", 24)]
+              for event_type, metric_label, _ in EVENT_METRICS}
+    if any(any(counts) for counts in hourly.values()):
+        import pandas as pd
+        hours = [bucket["bucket"][-2:] + ":00" for bucket in event_log.series(EVENT_FACTS_GENERATED, "hour", 24)]
+        st.bar_chart(pd.DataFrame(hourly, index=hours))
     
     # YouTube Connection Status
     st.header("YouTube Connection Status")
@@ -92,22 +431,49 @@ if page == "Dashboard":
         st.warning("⚠️ Not connected to YouTube")
         st.write("Go to the Publishing page to configure your YouTube API credentials.")
     
+    if len(channels) > 1:
+        # Every channel's info, fetched in parallel with each channel's own client
+        st.subheader("All Channels")
+        channel_infos = get_channel_registry().map_channels(lambda youtube_api: youtube_api.get_channel_info())
+        channel_rows = []
+        for channel in channels:
+            try:
+                stats = (channel_infos[channel["id"]].result(timeout=30) or {}).get('statistics', {})
+            except Exception:
+                stats = {}
+            channel_rows.append({
+                "Channel": channel["name"],
+                "Subscribers": stats.get('subscriberCount', '-'),
+                "Videos": stats.get('videoCount', '-'),
+                "Views": stats.get('viewCount', '-')
+            })
+        st.dataframe(channel_rows, hide_index=True)
+    
     # Quick Actions
     st.header("Quick Actions")
     quick_action_cols = st.columns(4)
     
     with quick_action_cols[0]:
         if st.button("Generate Content"):
-            st.session_state.facts_generated += 10
-            st.success("Generated 10 new facts!")
-            st.balloons()
+            fact_count = settings.workflow.default_fact_count
+            get_task_runner().submit(task_owner, "facts", f"Generate {fact_count} facts",
+                                     generate_facts_task, get_fact_generator(), get_fact_store(), event_log,
+                                     ["Science", "History", "Nature"], fact_count, "Medium",
+                                     settings.workflow.fact_quality)
+            st.success(f"Queued {fact_count} new facts!")
     
     with quick_action_cols[1]:
         if st.button("Create Videos"):
-            if st.session_state.facts_generated > st.session_state.scripts_created:
-                st.session_state.scripts_created += 5
-                st.session_state.videos_assembled += 5
-                st.success("Created 5 new videos!")
+            facts_per_video = settings.workflow.facts_per_video
+            newest_facts = get_fact_store().list_facts(limit=facts_per_video)
+            if len(newest_facts) == facts_per_video:
+                output_path = os.path.join(get_video_assembler().output_dir, f"video_{uuid.uuid4().hex[:8]}.mp4")
+                get_task_runner().submit(task_owner, "video", "Video: Amazing Facts You Didn't Know",
+                                         quick_video_task, get_script_generator(), get_render_scheduler(),
+                                         get_video_assembler(), get_content_store(), event_log, task_owner,
+                                         newest_facts, "Amazing Facts You Didn't Know", output_path,
+                                         resolution=settings.workflow.resolution)
+                st.success(f"Queued a new video from your {facts_per_video} newest facts!")
             else:
                 st.warning("Generate more facts first!")
     
@@ -115,25 +481,19 @@ if page == "Dashboard":
         if st.button("Publish Videos"):
             if not st.session_state.is_authenticated:
                 st.error("Please connect to YouTube first in the Publishing page.")
-            elif st.session_state.videos_assembled > st.session_state.videos_published:
-                with st.spinner("Publishing videos to YouTube..."):
-                    # This would actually call the YouTube API in a real implementation
-                    if st.session_state.youtube_api:
-                        st.session_state.videos_published += 3
-                        st.success("Published 3 videos to YouTube!")
-                    else:
-                        st.error("YouTube API not initialized. Please authenticate in the Publishing page.")
             else:
-                st.warning("Create more videos first!")
+                st.info("Choose the videos to upload, with their titles and privacy, on the Publishing page.")
     
     with quick_action_cols[3]:
         if st.button("Run Analytics"):
             if st.session_state.is_authenticated and st.session_state.youtube_api:
                 with st.spinner("Fetching analytics from YouTube..."):
                     try:
-                        channel_analytics = st.session_state.youtube_api.get_channel_analytics()
-                        st.info("Analytics updated!")
-                        st.write("Channel statistics:", channel_analytics)
+                        youtube_api = st.session_state.youtube_api
+                        channel_analytics = fetch_or_defer(youtube_api, "channels.list", youtube_api.get_channel_analytics)
+                        if channel_analytics is not None:
+                            st.info("Analytics updated!")
+                            st.write("Channel statistics:", channel_analytics)
                     except Exception as e:
                         st.error(f"Error fetching analytics: {str(e)}")
             else:
@@ -142,24 +502,16 @@ if page == "Dashboard":
     # Recent Activity
     st.header("Recent Activity")
     
-    # Sample activity data
-    activities = [
-        {"time": "Today, 2:30 PM", "action": "Video published - 5 Amazing Facts About Deep Sea Creatures"},
-        {"time": "Today, 10:15 AM", "action": "Content generated - 10 new facts about Ancient History"},
-        {"time": "Yesterday, 4:45 PM", "action": "Analytics updated - Performance report for last week"},
-        {"time": "2 days ago", "action": "Video created - Fascinating Facts About the Human Brain"}
-    ]
-    
-    # Add real uploaded videos to activity if available
-    if st.session_state.uploaded_videos:
-        for video in st.session_state.uploaded_videos[:3]:
-            activities.insert(0, {
-                "time": datetime.now().strftime("%Y-%m-%d %H:%M"),
-                "action": f"Video published - {video.get('snippet', {}).get('title', 'Unknown')}"
-            })
+    # Latest pipeline events, kept in memory by the event log
+    actions = {event_type: action for event_type, _, action in EVENT_METRICS}
+    activities = event_log.recent(10)
     
     for activity in activities:
-        st.markdown(f"**{activity['time']}:** {activity['action']}")
+        activity_time = datetime.fromtimestamp(activity['t']).strftime("%Y-%m-%d %H:%M")
+        action = actions.get(activity['type'], activity['type'])
+        st.markdown(f"**{activity_time}:** {action} - {activity.get('label', '')}")
+    if not activities:
+        st.info("No activity yet. Generate some facts to get started.")
 
 # Content Generation page
 elif page == "Content Generation":
@@ -173,7 +525,8 @@ elif page == "Content Generation":
     col1, col2 = st.columns(2)
     
     with col1:
-        num_facts = st.number_input("Number of facts to generate", min_value=1, max_value=100, value=10)
+        num_facts = st.number_input("Number of facts to generate", min_value=1, max_value=100,
+                                    value=settings.workflow.default_fact_count)
         fact_length = st.select_slider("Fact length", options=["Short", "Medium", "Long"], value="Medium")
     
     with col2:
@@ -183,76 +536,39 @@ elif page == "Content Generation":
             ["Science", "History", "Nature"]
         )
         
-        reliability = st.slider("Source reliability", min_value=1, max_value=10, value=8)
+        reliability = st.slider("Source reliability", min_value=1, max_value=10, value=settings.workflow.fact_quality)
     
     if st.button("Generate Facts"):
-        with st.spinner("Generating interesting facts..."):
-            # Simulate API call delay
-            time.sleep(2)
-            
-            # Sample facts based on selected categories
-            sample_facts = {
-                "Science": [
-                    "The human body contains enough carbon to fill about 9,000 pencils.",
-                    "A teaspoonful of neutron star would weigh about 6 billion tons.",
-                    "The average person walks the equivalent of three times around the world in a lifetime."
-                ],
-                "History": [
-                    "The shortest war in history was between Britain and Zanzibar in 1896, lasting only 38 minutes.",
-                    "Ancient Egyptians used to use honey as an offering to their gods.",
-                    "The first recorded use of 'OMG' was in a 1917 letter to Winston Churchill."
-                ],
-                "Nature": [
-                    "Octopuses have three hearts, nine brains, and blue blood.",
-                    "Bananas are berries, but strawberries aren't.",
-                    "A group of flamingos is called a 'flamboyance'."
-                ],
-                "Space": [
-                    "There are more stars in the universe than grains of sand on all the beaches on Earth.",
-                    "A day on Venus is longer than a year on Venus.",
-                    "The Great Red Spot on Jupiter is a storm that has been raging for at least 400 years."
-                ],
-                "Technology": [
-                    "The first computer bug was an actual real-life bug - a moth was found in the Harvard Mark II computer in 1947.",
-                    "The average smartphone user touches their phone 2,617 times a day.",
-                    "The first message sent over the internet was 'LO'. It was supposed to be 'LOGIN' but the system crashed."
-                ]
-            }
-            
-            # Display generated facts
-            st.subheader("Generated Facts")
-            displayed_facts = []
-            
-            for category in categories:
-                if category in sample_facts:
-                    for fact in sample_facts[category]:
-                        displayed_facts.append(fact)
-                        if len(displayed_facts) >= num_facts:
-                            break
-                if len(displayed_facts) >= num_facts:
-                    break
-            
-            for i, fact in enumerate(displayed_facts[:num_facts]):
-                st.write(f"{i+1}. {fact}")
-            
-            # Update session state
-            st.session_state.facts_generated += len(displayed_facts[:num_facts])
-            
-            # Save button
-            if st.button("Save Facts for Video Creation"):
-                st.success(f"Saved {len(displayed_facts[:num_facts])} facts for video creation!")
+        if categories:
+            get_task_runner().submit(task_owner, "facts", f"Generate {num_facts} facts",
+                                     generate_facts_task, get_fact_generator(), get_fact_store(), get_event_log(),
+                                     categories, num_facts, fact_length, reliability)
+            st.info("Fact generation queued. Track it under Background Tasks in the sidebar.")
+        else:
+            st.error("Please select at least one fact category.")
+    
+    # Display the latest generated facts
+    if st.session_state.get('generated_facts'):
+        st.subheader("Generated Facts")
+        displayed_facts = st.session_state.generated_facts
+        
+        for i, fact in enumerate(displayed_facts):
+            st.write(f"{i+1}. {fact['text']}")
+        
+        st.caption(f"These facts are saved for video creation ({get_fact_store().count()} facts stored).")
 
 # Video Creation page
 elif page == "Video Creation":
     st.title("Video Creation")
     
-    # Initialize content generation components
-    fact_generator = FactGenerator()
-    script_generator = ScriptGenerator()
-    video_assembler = VideoAssembler()
+    # Shared content generation components
+    fact_store = get_fact_store()
+    content_store = get_content_store()
+    script_generator = get_script_generator()
+    video_assembler = get_video_assembler()
     
     # Check if facts are available
-    if st.session_state.facts_generated == 0:
+    if fact_store.count() == 0:
         st.warning("Please generate facts first in the Content Generation page.")
     else:
         # Tabs for different aspects of video creation
@@ -263,13 +579,9 @@ elif page == "Video Creation":
             st.header("Create Scripts")
             st.write("Convert your generated facts into engaging video scripts.")
             
-            # Get available facts (in a real implementation, these would be stored in session state or database)
-            # This is a placeholder - you would replace this with your actual facts from the Content Generation page
-            sample_facts = []
-            for category in ["Science", "History", "Nature", "Space", "Technology"]:
-                if category in st.session_state.get('selected_categories', ["Science", "History", "Nature"]):
-                    for fact in fact_generator.get_sample_facts([category], 3):
-                        sample_facts.append(fact)
+            # Facts generated on the Content Generation page, newest first
+            sample_facts = fact_store.list_facts()
+            st.caption(f"{len(sample_facts)} facts available.")
             
             # Script settings
             st.subheader("Script Settings")
@@ -281,55 +593,47 @@ elif page == "Video Creation":
                 include_sources = st.checkbox("Include Sources", value=False)
             
             with col2:
-                num_facts_per_video = st.slider("Facts per Video", min_value=3, max_value=10, value=5)
+                num_facts_per_video = st.slider("Facts per Video", min_value=3, max_value=10,
+                                                value=settings.workflow.facts_per_video)
                 
             # Create script button
             if st.button("Create Scripts"):
                 if len(sample_facts) >= num_facts_per_video:
-                    with st.spinner("Creating engaging scripts..."):
-                        # Initialize script generator
-                        script_generator = ScriptGenerator()
-                        
-                        # Select facts for this video
-                        selected_facts = sample_facts[:num_facts_per_video]
-                        
-                        # Create script
-                        script_data = script_generator.create_script_with_sections(
-                            facts=selected_facts,
-                            title=video_title,
-                            include_sources=include_sources
-                        )
-                        
-                        # Store in session state
-                        if 'scripts' not in st.session_state:
-                            st.session_state.scripts = []
-                        
-                        st.session_state.scripts.append(script_data)
-                        st.session_state.scripts_created += 1
-                        
-                        st.success(f"Script created successfully! Estimated video duration: {script_data['estimated_duration']} seconds")
-                        
-                        # Display script preview
-                        with st.expander("Script Preview", expanded=True):
-                            st.write(script_data["full_script"])
+                    # Select facts for this video
+                    selected_facts = sample_facts[:num_facts_per_video]
+                    
+                    get_task_runner().submit(task_owner, "script", f"Script: {video_title}",
+                                             create_script_task, script_generator, content_store, get_event_log(),
+                                             task_owner, selected_facts, video_title, include_sources)
+                    st.info("Script queued. It appears under Your Scripts when it is ready.")
                 else:
                     st.error(f"Not enough facts available. Please generate at least {num_facts_per_video} facts.")
             
-            # Display existing scripts
-            if 'scripts' in st.session_state and st.session_state.scripts:
-                st.subheader("Your Scripts")
-                for i, script in enumerate(st.session_state.scripts):
-                    with st.expander(f"Script {i+1}: {script['title']}"):
+            # Display existing scripts a page at a time; the full text loads on request
+            script_search = st.text_input("Search scripts", key="script_search")
+            script_total = content_store.count_scripts(task_owner, script_search)
+            if script_total:
+                st.subheader(f"Your Scripts ({script_total})")
+                offset = page_offset(f"script_page_{script_search}", script_total)
+                for script in content_store.list_scripts(task_owner, script_search, offset=offset):
+                    is_open = st.session_state.get('open_script_id') == script['id']
+                    with st.expander(f"Script #{script['id']}: {script['title']}", expanded=is_open):
                         st.write(f"Duration: {script['estimated_duration']} seconds")
                         st.write(f"Facts: {script['fact_count']}")
-                        st.write(script["full_script"])
+                        if is_open:
+                            st.write(content_store.get_script(script['id'])["full_script"])
+                        elif st.button("Show script", key=f"show_script_{script['id']}"):
+                            st.session_state.open_script_id = script['id']
+                            st.rerun()
+            elif script_search:
+                st.info("No scripts match your search.")
         
         # Assemble Videos tab
         with tabs[1]:
             st.header("Assemble Videos")
             st.write("Create videos from your scripts with customizable settings.")
             
-            if 'scripts' not in st.session_state or not st.session_state.scripts:
+            if content_store.count_scripts(task_owner) == 0:
                 st.warning("Please create scripts first in the Create Scripts tab.")
             else:
                 # Video settings
@@ -338,10 +642,13 @@ elif page == "Video Creation":
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    selected_script_index = st.selectbox(
+                    # Only the most recent matching scripts are offered; search to find older ones
+                    script_filter = st.text_input("Find Script", key="video_script_search")
+                    script_options = content_store.list_scripts(task_owner, script_filter, limit=50)
+                    selected_script = st.selectbox(
                         "Select Script", 
-                        range(len(st.session_state.scripts)), 
-                        format_func=lambda i: f"Script {i+1}: {st.session_state.scripts[i]['title']}"
+                        script_options, 
+                        format_func=lambda script: f"Script #{script['id']}: {script['title']}"
                     )
                     
                     visual_style = st.selectbox(
@@ -356,83 +663,70 @@ elif page == "Video Creation":
                 
                 # Create video button
                 if st.button("Create Video"):
-                    with st.spinner("Assembling your video..."):
-                        # Get selected script
-                        script_data = st.session_state.scripts[selected_script_index]
-                        
-                        # Initialize video assembler
-                        video_assembler = VideoAssembler()
-                        
-                        # Create temporary directory for output if it doesn't exist
-                        output_dir = "output"
-                        os.makedirs(output_dir, exist_ok=True)
-                        
-                        # Generate output filename
-                        output_filename = f"video_{len(st.session_state.get('videos', []))}.mp4"
-                        output_path = os.path.join(output_dir, output_filename)
-                        
-                        # Create video
-                        video_path = video_assembler.create_video(
-                            script_data=script_data,
-                            output_path=output_path,
-                            text_to_speech=text_to_speech,
-                            visual_style=visual_style
-                        )
-                        
-                        # Store in session state
-                        if 'videos' not in st.session_state:
-                            st.session_state.videos = []
-                        
-                        video_info = {
-                            "path": video_path,
-                            "title": script_data["title"],
-                            "duration": script_data["estimated_duration"],
-                            "script_index": selected_script_index
-                        }
-                        
-                        st.session_state.videos.append(video_info)
-                        st.session_state.videos_assembled += 1
+                    if selected_script is None:
+                        st.error("No script matches your search.")
+                    else:
+                        # Generate a unique output filename, as several renders can be queued at once
+                        output_filename = f"video_{uuid.uuid4().hex[:8]}.mp4"
+                        output_path = os.path.join(video_assembler.output_dir, output_filename)
                         
-                        st.success(f"Video created successfully at {video_path}")
+                        get_task_runner().submit(task_owner, "video", f"Video: {selected_script['title']}",
+                                                 create_video_task, get_render_scheduler(), video_assembler,
+                                                 content_store, get_event_log(), task_owner, selected_script['id'], output_path,
+                                                 text_to_speech=text_to_speech, visual_style=visual_style,
+                                                 resolution=settings.workflow.resolution)
+                        st.info("Video queued. It appears under Your Videos when it is ready.")
                 
-                # Display existing videos
-                if 'videos' in st.session_state and st.session_state.videos:
-                    st.subheader("Your Videos")
-                    for i, video in enumerate(st.session_state.videos):
-                        with st.expander(f"Video {i+1}: {video['title']}"):
+                # Display existing videos a page at a time
+                video_search = st.text_input("Search videos", key="video_search")
+                video_total = content_store.count_videos(task_owner, video_search)
+                if video_total:
+                    st.subheader(f"Your Videos ({video_total})")
+                    offset = page_offset(f"video_page_{video_search}", video_total)
+                    for video in content_store.list_videos(task_owner, video_search, offset=offset):
+                        with st.expander(f"Video #{video['id']}: {video['title']}"):
                             st.write(f"Duration: {video['duration']} seconds")
                             st.write(f"Path: {video['path']}")
                             
                             # In a real implementation, you would add video preview here
                             st.info("Video preview would be displayed here in the full implementation.")
+                elif video_search:
+                    st.info("No videos match your search.")
         
         # Preview tab
         with tabs[2]:
             st.header("Preview")
             st.write("Preview your videos before publishing.")
             
-            if 'videos' not in st.session_state or not st.session_state.videos:
+            if content_store.count_videos(task_owner) == 0:
                 st.warning("Please create videos first in the Assemble Videos tab.")
             else:
-                # Select video to preview
-                selected_video_index = st.selectbox(
+                # Select video to preview from the most recent ones
+                preview_filter = st.text_input("Find Video", key="preview_video_search")
+                video_options = content_store.list_videos(task_owner, preview_filter, limit=50)
+                video = st.selectbox(
                     "Select Video", 
-                    range(len(st.session_state.videos)), 
-                    format_func=lambda i: f"Video {i+1}: {st.session_state.videos[i]['title']}"
+                    video_options, 
+                    format_func=lambda video: f"Video #{video['id']}: {video['title']}"
                 )
                 
-                # Display video info
-                video = st.session_state.videos[selected_video_index]
-                st.subheader(video['title'])
-                st.write(f"Duration: {video['duration']} seconds")
-                
-                # In a real implementation, you would embed the video player here
-                st.info("Video player would be embedded here in the full implementation.")
-                
-                # Display associated script
-                script_data = st.session_state.scripts[video['script_index']]
-                with st.expander("View Script"):
-                    st.write(script_data["full_script"])
+                if video is None:
+                    st.info("No videos match your search.")
+                else:
+                    # Display video info
+                    st.subheader(video['title'])
+                    st.write(f"Duration: {video['duration']} seconds")
+                    
+                    # In a real implementation, you would embed the video player here
+                    st.info("Video player would be embedded here in the full implementation.")
+                    
+                    # Display associated script, loaded only when requested
+                    if st.toggle("View Script", key=f"preview_script_{video['id']}"):
+                        script_data = content_store.get_script(video['script_id'])
+                        if script_data:
+                            st.write(script_data["full_script"])
+                        else:
+                            st.info("The script for this video is no longer available.")
 
 
 # Publishing page
@@ -455,45 +749,38 @@ elif page == "Publishing":
         
         with col2:
             redirect_uri = st.text_input("Redirect URI", "https://youtube-automation-backwnd-4.onrender.com/oauth2callback") 
-            channel_id = st.text_input("Channel ID (optional)")
+            channel_id = st.text_input("Channel ID (optional)", help="Register several channels under different ids")
         
-if st.button("Authenticate"):
-    if client_id and client_secret:
-        try:
-            with st.spinner("Authenticating with YouTube..."):
-                # Save client credentials to a file
-                client_config = {
-                    "installed": {
-                        "client_id": client_id,
-                        "client_secret": client_secret,
-                        "redirect_uris": ["http://localhost:8501/oauth2callback"],
-                        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                        "token_uri": "https://oauth2.googleapis.com/token"
-                    }
-                }
-                
-                with open(config.CLIENT_SECRETS_FILE, "w")  as f:
-                    import json
-                    json.dump(client_config, f)
-                
-                # Now authenticate using the saved file
-                youtube_api = setup_youtube_api(client_secrets_file=config.CLIENT_SECRETS_FILE)
+        if st.button("Authenticate"):
+            if client_id and client_secret:
+                try:
+                    with st.spinner("Authenticating with YouTube..."):
+                        # Save client credentials to a file
+                        client_config = {
+                            "installed": {
+                                "client_id": client_id,
+                                "client_secret": client_secret,
+                                "redirect_uris": ["http://localhost:8501/oauth2callback"],
+                                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+                                "token_uri": "https://oauth2.googleapis.com/token"
+                            }
+                        }
                 
-                # Get channel info
-                channel_info = youtube_api.get_channel_info()
+                        # Each channel keeps its own client secrets, token and quota ledger
+                        channel_key = channel_id.strip() or DEFAULT_CHANNEL
+                        get_channel_registry().add_channel(channel_key, client_config=client_config)
                 
-                # Store in session state
-                st.session_state.youtube_api = youtube_api
-                st.session_state.is_authenticated = True
-                st.session_state.channel_info = channel_info
+                        # Authenticate and route this session to the channel
+                        channel_info = connect_channel(channel_key)
                 
-                channel_name = channel_info.get('snippet', {}).get('title', 'Your Channel')
-                st.success(f"Authentication successful! Connected to YouTube channel: {channel_name}")
-        except Exception as e:
-            st.error(f"Authentication failed: {str(e)}")
-            st.info("Please make sure your credentials are correct and you have a YouTube channel set up.")
-    else:
-        st.error("Please enter your Client ID and Client Secret.")
+                        channel_name = channel_info.get('snippet', {}).get('title', 'Your Channel')
+                        get_channel_registry().rename_channel(channel_key, channel_name)
+                        st.success(f"Authentication successful! Connected to YouTube channel: {channel_name}")
+                except Exception as e:
+                    st.error(f"Authentication failed: {str(e)}")
+                    st.info("Please make sure your credentials are correct and you have a YouTube channel set up.")
+            else:
+                st.error("Please enter your Client ID and Client Secret.")
 
     
     # Publish Videos tab
@@ -517,7 +804,7 @@ if st.button("Authenticate"):
             col1, col2 = st.columns(2)
             
             with col1:
-                video_tags = st.text_input("Tags (comma separated)", "facts, amazing, did you know, interesting")
+                video_tags = st.text_input("Tags (comma separated)", settings.seo.tags_template)
                 category_id = st.selectbox(
                     "Category",
                     [
@@ -558,66 +845,106 @@ if st.button("Authenticate"):
             uploaded_file = st.file_uploader("Upload Video File", type=["mp4", "mov", "avi"])
             
             if uploaded_file is not None:
-                # Save the uploaded file temporarily
-                temp_file_path = os.path.join(os.getcwd(), uploaded_file.name)
-                with open(temp_file_path, "wb") as f:
-                    f.write(uploaded_file.getbuffer())
+                # Stream the file into the staging area once; reruns reuse the staged copy
+                staged_files = st.session_state.setdefault("staged_files", {})
+                staging_key = getattr(uploaded_file, "file_id", None) or f"{uploaded_file.name}:{uploaded_file.size}"
+                temp_file_path = staged_files.get(staging_key)
+                if not temp_file_path or not os.path.exists(temp_file_path):
+                    temp_file_path = get_upload_staging().stage(uploaded_file, uploaded_file.name)
+                    staged_files[staging_key] = temp_file_path
                 
                 st.success(f"File uploaded: {uploaded_file.name}")
                 
                 # Upload button
                 if st.button("Upload to YouTube"):
-                    try:
-                        with st.spinner("Uploading video to YouTube..."):
-                            # Process tags
-                            tags_list = [tag.strip() for tag in video_tags.split(",") if tag.strip()]
-                            
-                            # Get category ID value
-                            selected_category_id = category_id[1]
-                            
-                            # Get privacy status value
-                            selected_privacy_status = privacy_status[1]
-                            
-                            # Upload video
-                            response = st.session_state.youtube_api.upload_video(
-                                file_path=temp_file_path,
-                                title=video_title,
-                                description=video_description,
-                                tags=tags_list,
-                                category_id=selected_category_id,
-                                privacy_status=selected_privacy_status,
-                                notify_subscribers=notify_subscribers
-                            )
-                            
-                            # Store uploaded video info
-                            if response:
-                                st.session_state.uploaded_videos.append(response)
-                                st.session_state.videos_published += 1
-                                
-                                video_id = response.get('id')
-                                video_url = f"https://www.youtube.com/watch?v={video_id}"
-                                
-                                st.success("Video uploaded successfully!")
-                                st.markdown(f"**Video URL:** [Watch on YouTube]({video_url})")
-                    except Exception as e:
-                        st.error(f"Upload failed: {str(e)}")
-                    finally:
-                        # Clean up the temporary file
-                        if os.path.exists(temp_file_path):
-                            os.remove(temp_file_path)
+                    # Process tags
+                    tags_list = [tag.strip() for tag in video_tags.split(",") if tag.strip()]
+                    
+                    get_task_runner().submit(
+                        task_owner, "upload", f"Upload: {video_title}",
+                        upload_video_task,
+                        get_render_scheduler(),
+                        st.session_state.youtube_api,
+                        get_upload_staging(),
+                        get_content_store(),
+                        get_event_log(),
+                        task_owner,
+                        temp_file_path,
+                        video_title,
+                        video_description,
+                        tags=tags_list,
+                        category_id=category_id[1],
+                        privacy_status=privacy_status[1],
+                        notify_subscribers=notify_subscribers
+                    )
+                    st.info("Upload queued. Track its progress under Background Tasks in the sidebar.")
             
-            # Existing videos section
+            # Existing videos section, a page at a time
             st.subheader("Your Videos")
             
-            if st.session_state.uploaded_videos:
-                for i, video in enumerate(st.session_state.uploaded_videos):
-                    video_id = video.get('id')
-                    video_title = video.get('snippet', {}).get('title', 'Unknown')
-                    video_url = f"https://www.youtube.com/watch?v={video_id}"
+            upload_search = st.text_input("Search uploads", key="upload_search")
+            upload_total = get_content_store().count_uploads(task_owner, upload_search)
+            if upload_total:
+                offset = page_offset(f"upload_page_{upload_search}", upload_total)
+                for i, video in enumerate(get_content_store().list_uploads(task_owner, upload_search, offset=offset)):
+                    video_url = f"https://www.youtube.com/watch?v={video['youtube_id']}"
                     
-                    st.write(f"{i+1}. [{video_title}]({video_url})")
+                    st.write(f"{offset + i + 1}. [{video['title']}]({video_url})")
+            elif upload_search:
+                st.info("No uploads match your search.")
             else:
                 st.info("No videos uploaded yet.")
+            
+            # Scheduled publishing, rendered ahead of each slot of the Workflow Settings schedule
+            st.subheader("Scheduled Publishing")
+            st.caption(f"Schedule: {settings.workflow.publishing_schedule} (change it in Settings > Workflow Settings)")
+            
+            scheduled_scripts = get_content_store().list_scripts(task_owner, limit=50)
+            if scheduled_scripts:
+                scheduled_script = st.selectbox(
+                    "Script to publish",
+                    scheduled_scripts,
+                    format_func=lambda script: f"{script['title']} ({script['fact_count']} facts)",
+                    key="scheduled_script"
+                )
+                if st.button("Add to Publishing Queue"):
+                    script_data = get_content_store().get_script(scheduled_script["id"])
+                    get_publish_scheduler().enqueue(
+                        st.session_state.channel_id,
+                        fill_seo_template(settings.seo.title_template, script_data),
+                        fill_seo_template(settings.seo.description_template, script_data),
+                        owner=task_owner,
+                        script_id=scheduled_script["id"],
+                        tags=[tag.strip() for tag in settings.seo.tags_template.split(",") if tag.strip()],
+                        category_id=category_id[1],
+                        privacy_status=privacy_status[1],
+                        notify_subscribers=notify_subscribers
+                    )
+                    st.success("Added to the publishing queue!")
+            else:
+                st.info("Create a script in the Video Creation page to schedule it.")
+            
+            publish_queue = get_publish_scheduler().list_queue(st.session_state.channel_id)
+            for item in publish_queue:
+                col1, col2 = st.columns([4, 1])
+                with col1:
+                    slot = datetime.fromtimestamp(item["slot"]).strftime("%a %Y-%m-%d %H:%M") if item["slot"] else "no slot"
+                    st.write(f"**{item['title']}** – {item['status']}, {slot}")
+                    if item.get("error"):
+                        st.caption(f"Attempt {item.get('attempts', 0)} failed: {item['error']}")
+                with col2:
+                    if item["status"] == PUBLISH_FAILED and st.button("Retry", key=f"retry_{item['id']}"):
+                        get_publish_scheduler().retry(st.session_state.channel_id, item["id"])
+                        st.rerun()
+                    if st.button("Remove", key=f"unschedule_{item['id']}"):
+                        get_publish_scheduler().remove(st.session_state.channel_id, item["id"])
+                        st.rerun()
+            
+            for entry in get_publish_scheduler().history(st.session_state.channel_id, limit=5):
+                if entry["status"] == STATUS_PUBLISHED:
+                    st.write(f"✅ {entry['title']}")
+                else:
+                    st.write(f"❌ {entry['title']}: {entry['error']}")
     
     # SEO Settings tab
     with tabs[2]:
@@ -627,25 +954,15 @@ if st.button("Authenticate"):
         # SEO settings form
         st.subheader("Default SEO Templates")
         
-        title_template = st.text_input(
-            "Title Template",
-            "🤯 {fact_number} Mind-Blowing Facts That Will Amaze You! | Did You Know?"
-        )
+        title_template = st.text_input("Title Template", settings.seo.title_template)
         
-        description_template = st.text_area(
-            "Description Template",
-            "Check out these amazing facts that will blow your mind!\n\n"
-            "{facts}\n\n"
-            "Don't forget to like and subscribe for more interesting content.\n\n"
-            "#DidYouKnow #AmazingFacts #Interesting"
-        )
+        description_template = st.text_area("Description Template", settings.seo.description_template)
         
-        tags_template = st.text_input(
-            "Default Tags",
-            "facts, amazing, did you know, interesting, mind-blowing, knowledge, learn"
-        )
+        tags_template = st.text_input("Default Tags", settings.seo.tags_template)
         
         if st.button("Save SEO Templates"):
+            get_settings_store().update("seo", title_template=title_template,
+                                        description_template=description_template, tags_template=tags_template)
             st.success("SEO templates saved successfully!")
 
 # Analytics page
@@ -655,10 +972,14 @@ elif page == "Analytics":
     if not st.session_state.is_authenticated:
         st.warning("Please authenticate with YouTube in the Publishing page first.")
     else:
+        if st.button("Refresh Analytics"):
+            # Drop cached statistics so this run reads them from the API
+            get_channel_registry().cache(st.session_state.channel_id).invalidate()
         try:
-            # Fetch channel analytics
+            # Served from the analytics cache; stale entries refresh in the background
             with st.spinner("Fetching analytics from YouTube..."):
-                channel_analytics = st.session_state.youtube_api.get_channel_analytics()
+                youtube_api = st.session_state.youtube_api
+                channel_analytics = fetch_or_defer(youtube_api, "channels.list", youtube_api.get_channel_analytics) or {}
                 
                 # Display channel analytics
                 st.header("Channel Overview")
@@ -677,13 +998,21 @@ elif page == "Analytics":
                 # Video performance
                 st.header("Video Performance")
                 
-                if st.session_state.uploaded_videos:
-                    for video in st.session_state.uploaded_videos:
-                        video_id = video.get('id')
-                        video_title = video.get('snippet', {}).get('title', 'Unknown')
+                upload_total = get_content_store().count_uploads(task_owner)
+                if upload_total:
+                    # Statistics are fetched for the shown page only, in one videos().list call
+                    offset = page_offset("analytics_page", upload_total)
+                    page_videos = get_content_store().list_uploads(task_owner, offset=offset)
+                    video_ids = [video['youtube_id'] for video in page_videos]
+                    all_video_analytics = fetch_or_defer(
+                        youtube_api, "videos.list", lambda: youtube_api.get_videos_statistics(video_ids)
+                    ) or {}
+                    
+                    for video in page_videos:
+                        video_id = video['youtube_id']
+                        video_title = video['title']
                         
-                        # Fetch video analytics
-                        video_analytics = st.session_state.youtube_api.get_video_analytics(video_id)
+                        video_analytics = all_video_analytics.get(video_id)
                         
                         st.subheader(video_title)
                         
@@ -702,6 +1031,18 @@ elif page == "Analytics":
                             st.info("No analytics available for this video yet.")
                 else:
                     st.info("No videos uploaded yet.")
+                
+                cache_stats = get_channel_registry().cache(st.session_state.channel_id).stats()
+                st.caption(
+                    f"Analytics cache: {cache_stats['hits'] + cache_stats['stale_hits']} hits, "
+                    f"{cache_stats['misses']} misses, "
+                    f"{cache_stats['quota_units_saved']} API quota units saved"
+                )
+                quota = get_channel_registry().ledger(st.session_state.channel_id).summary()
+                st.caption(
+                    f"API quota today: {quota['used']} of {quota['daily_limit']} units used, "
+                    f"resets {quota['resets_at']}"
+                )
         except Exception as e:
             st.error(f"Error fetching analytics: {str(e)}")
             st.info("YouTube typically takes 24-48 hours to process analytics data.")
@@ -715,17 +1056,20 @@ elif page == "Settings":
     
     # Workflow settings
     with tabs[0]:
+        workflow = settings.workflow
         st.header("Workflow Settings")
         st.write("Configure your content automation workflow.")
         
         # Content generation settings
         st.subheader("Content Generation")
         
-        fact_quality = st.slider("Fact Quality Threshold", min_value=1, max_value=10, value=7)
+        default_fact_count = st.number_input("Default Fact Count", min_value=1, max_value=100,
+                                             value=workflow.default_fact_count)
+        fact_quality = st.slider("Fact Quality Threshold", min_value=1, max_value=10, value=workflow.fact_quality)
         fact_sources = st.multiselect(
             "Fact Sources",
-            ["Academic Journals", "News Sites", "Wikipedia", "Books", "Scientific Publications"],
-            ["News Sites", "Wikipedia", "Scientific Publications"]
+            list(FACT_SOURCES),
+            list(workflow.fact_sources)
         )
         
         # Video creation settings
@@ -733,51 +1077,76 @@ elif page == "Settings":
         
         video_quality = st.select_slider(
             "Video Quality",
-            options=["Low (480p)", "Medium (720p)", "High (1080p)", "Ultra (4K)"],
-            value="High (1080p)"
+            options=list(VIDEO_QUALITIES),
+            value=workflow.video_quality
         )
         
-        video_length = st.slider("Target Video Length (seconds)", min_value=30, max_value=600, value=180, step=30)
+        video_length = st.slider("Target Video Length (seconds)", min_value=30, max_value=600,
+                                 value=workflow.video_length, step=30)
         
         media_sources = st.multiselect(
             "Media Sources",
-            ["Pixabay", "Pexels", "Unsplash", "Custom Library", "Generated Images"],
-            ["Pixabay", "Pexels", "Unsplash"]
+            list(MEDIA_SOURCES),
+            list(workflow.media_sources)
         )
         
         # Publishing settings
         st.subheader("Publishing")
         
+        schedule_options = list(PUBLISHING_SCHEDULES)
         publishing_schedule = st.radio(
             "Publishing schedule",
-            ["Publish immediately", "Daily at specific time", "Custom schedule"]
+            schedule_options,
+            index=schedule_options.index(workflow.publishing_schedule)
+            if workflow.publishing_schedule in schedule_options else 0
         )
         
+        publish_time = datetime.strptime(workflow.publish_time, "%H:%M").time()
+        days = list(workflow.publish_days)
         if publishing_schedule == "Daily at specific time":
-            publish_time = st.time_input("Publishing time")
+            publish_time = st.time_input("Publishing time", publish_time)
         elif publishing_schedule == "Custom schedule":
             st.write("Configure custom schedule:")
             days = st.multiselect(
                 "Publishing days",
-                ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
-                ["Monday", "Wednesday", "Friday"]
+                list(WEEKDAYS),
+                days
             )
-            publish_time = st.time_input("Publishing time")
+            publish_time = st.time_input("Publishing time", publish_time)
         
         st.subheader("Notifications")
         
-        email_notifications = st.checkbox("Enable email notifications", value=True)
+        email_notifications = st.checkbox("Enable email notifications", value=workflow.email_notifications)
         
+        email = workflow.email
+        notification_events = list(workflow.notification_events)
         if email_notifications:
-            email = st.text_input("Email address")
+            email = st.text_input("Email address", email)
             
             notification_events = st.multiselect(
                 "Notification events",
-                ["Content generation complete", "Video creation complete", "Publishing complete", "Error alerts", "Performance reports"],
-                ["Content generation complete", "Publishing complete", "Error alerts"]
+                list(NOTIFICATION_EVENTS),
+                notification_events
             )
         
         if st.button("Save Workflow Settings"):
+            get_settings_store().update(
+                "workflow",
+                default_fact_count=int(default_fact_count),
+                fact_quality=fact_quality,
+                fact_sources=fact_sources,
+                video_quality=video_quality,
+                video_length=video_length,
+                media_sources=media_sources,
+                publishing_schedule=publishing_schedule,
+                publish_time=publish_time.strftime("%H:%M"),
+                publish_days=days,
+                email_notifications=email_notifications,
+                email=email,
+                notification_events=notification_events
+            )
+            # Move queued videos to the new schedule's slots
+            get_publish_scheduler().reschedule()
             st.success("Workflow settings saved successfully!")
     
     # Component settings
@@ -789,36 +1158,31 @@ elif page == "Settings":
         components = [
             {
                 "name": "Fact Researcher",
-                "description": "Searches for interesting facts from various sources",
-                "enabled": True
+                "description": "Searches for interesting facts from various sources"
             },
             {
                 "name": "Script Generator",
-                "description": "Creates engaging scripts from facts",
-                "enabled": True
+                "description": "Creates engaging scripts from facts"
             },
             {
                 "name": "Media Selector",
-                "description": "Finds relevant images and videos for facts",
-                "enabled": True
+                "description": "Finds relevant images and videos for facts"
             },
             {
                 "name": "Video Assembler",
-                "description": "Combines scripts and media into videos",
-                "enabled": True
+                "description": "Combines scripts and media into videos"
             },
             {
                 "name": "YouTube Publisher",
-                "description": "Uploads and schedules videos on YouTube",
-                "enabled": True
+                "description": "Uploads and schedules videos on YouTube"
             },
             {
                 "name": "Analytics Optimizer",
-                "description": "Analyzes performance and suggests improvements",
-                "enabled": True
+                "description": "Analyzes performance and suggests improvements"
             }
         ]
         
+        enabled = {}
         for component in components:
             col1, col2 = st.columns([3, 1])
             
@@ -827,9 +1191,12 @@ elif page == "Settings":
                 st.write(component["description"])
             
             with col2:
-                enabled = st.checkbox("Enabled", value=component["enabled"], key=f"component_{component['name']}")
+                enabled[component["name"]] = st.checkbox("Enabled",
+                                                         value=settings.components.is_enabled(component["name"]),
+                                                         key=f"component_{component['name']}")
         
         if st.button("Save Component Settings"):
+            get_settings_store().update("components", enabled=enabled)
             st.success("Component settings saved successfully!")
     
     # System settings
@@ -840,13 +1207,13 @@ elif page == "Settings":
         # Storage settings
         st.subheader("Storage Settings")
         
-        storage_path = st.text_input("Storage Path", "/data/youtube_automation")
-        max_storage = st.slider("Maximum Storage (GB)", min_value=1, max_value=100, value=10)
+        storage_path = st.text_input("Storage Path", settings.system.storage_path)
+        max_storage = st.slider("Maximum Storage (GB)", min_value=1, max_value=100, value=settings.system.max_storage_gb)
         
         cleanup_options = st.multiselect(
             "Automatic Cleanup",
-            ["Remove published videos", "Remove unused media", "Archive old facts", "Compress log files"],
-            ["Remove published videos", "Remove unused media"]
+            list(CLEANUP_OPTIONS),
+            list(settings.system.cleanup_options)
         )
         
         # System maintenance
@@ -856,9 +1223,15 @@ elif page == "Settings":
         
         with col1:
             if st.button("Clear Cache"):
+                get_video_assembler().invalidate_asset_catalog()
+                get_fact_generator().clear_cache()
+                get_channel_registry().invalidate_caches()
                 st.success("Cache cleared successfully!")
             
             if st.button("Restart Components"):
+                get_fact_generator.clear()
+                get_script_generator.clear()
+                get_video_assembler.clear()
                 st.success("Components restarted successfully!")
         
         with col2:
@@ -869,6 +1242,8 @@ elif page == "Settings":
                 st.success("System backup created successfully!")
         
         if st.button("Save System Settings"):
+            get_settings_store().update("system", storage_path=storage_path, max_storage_gb=max_storage,
+                                        cleanup_options=cleanup_options)
             st.success("System settings saved successfully!")
 
 # Help page
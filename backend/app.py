@@ -1,10 +1,20 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-import json
 import os
+import sys
 import random
+import threading
 from datetime import datetime
 
+# Shared modules live in the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from http_transport import get_session, SESSION_TIMEOUT
+from publish_pipeline import PublishPipeline
+from event_log import EventLog, EVENT_VIDEO_PUBLISHED
+import config
+
+BACKEND_URL = os.environ.get('BACKEND_URL', 'http://localhost:5000')
+
 app = Flask(__name__)
 CORS(app)
 
@@ -14,6 +24,50 @@ SCRIPTS_DB = []
 VIDEOS_DB = []
 PUBLISHED_VIDEOS_DB = []
 
+_event_log = None
+_event_log_lock = threading.Lock()
+
+def get_event_log():
+    """
+    Get the event log shared with the Streamlit app, whose Dashboard counts these events
+
+    Opened on the first publish rather than at import, so importing the
+    backend doesn't replay the log or register a rollup snapshot at exit.
+    """
+    global _event_log
+    if _event_log is None:
+        with _event_log_lock:
+            if _event_log is None:
+                _event_log = EventLog(config.EVENT_LOG_FILE)
+    return _event_log
+
+def create_youtube_client():
+    """Authenticate the YouTube client used by the publish workers"""
+    from youtube_api_implementation import setup_youtube_api
+    return setup_youtube_api(token_file=config.TOKEN_FILE)
+
+def record_published_video(job):
+    """Write a finished upload back to the published videos list"""
+    PUBLISHED_VIDEOS_DB.append({
+        "id": len(PUBLISHED_VIDEOS_DB) + 1,
+        "video_id": job['metadata'].get('video_id'),
+        "job_id": job['id'],
+        "title": job['title'],
+        "privacy": job['privacy_status'],
+        "youtube_video_id": job['youtube_video_id'],
+        "youtube_url": job['youtube_url'],
+        "published_at": job['updated_at']
+    })
+    get_event_log().record(EVENT_VIDEO_PUBLISHED, job['title'])
+
+# Uploads run on worker threads; the publish endpoint only queues jobs
+PUBLISH_PIPELINE = PublishPipeline(
+    create_youtube_client,
+    workers=int(os.environ.get('PUBLISH_WORKERS', 2)),
+    jobs_file=config.PUBLISH_JOBS_FILE,
+    on_published=record_published_video
+)
+
 # Sample facts for initial data
 SAMPLE_FACTS = [
     "The human body contains enough carbon to fill about 9,000 pencils.",
@@ -41,9 +95,11 @@ def publish_to_youtube(video_id, youtube_credentials):
     # and upload the video
     
     # For now, just call your existing publish endpoint
-    response = requests.post(
+    # Reuse pooled keep-alive connections instead of a new connection per call
+    response = get_session().post(
         f"{BACKEND_URL}/api/publish",
-        json={"video_ids": [video_id]}
+        json={"video_ids": [video_id]},
+        timeout=SESSION_TIMEOUT
     )
     
     return response.json()
@@ -68,6 +124,7 @@ def home():
             "scripts": "/api/scripts",
             "videos": "/api/videos",
             "publish": "/api/publish",
+            "publish_jobs": "/api/publish/jobs",
             "analytics": "/api/analytics"
         }
     })
@@ -113,64 +170,64 @@ def generate_scripts():
     script_length = data.get('length', '60 seconds')
     
     # Different intro templates based on format
-intro_templates = {
-    'Conversational': [
-        "Hey there! Did you know that {fact}? That's pretty amazing, right?",
-        "Welcome back to our channel! Today we're exploring an incredible fact: {fact}",
-        "Here's something that might surprise you... {fact}. Let's dive deeper into this!",
-        "I bet you didn't know that {fact}. It's one of those fascinating tidbits that makes life interesting."
-    ],
-    'Educational': [
-        "Today we're exploring an important fact: {fact}. This has significant implications for how we understand our world.",
-        "In this educational video, we'll examine the following fact: {fact}. Let's analyze what this means.",
-        "Welcome to our learning series! Today's fascinating topic centers around this fact: {fact}",
-        "The following information might change your perspective: {fact}. Let's explore the science behind this."
-    ],
-    'Entertaining': [
-        "You won't believe this, but {fact}! Mind-blowing, right?",
-        "Prepare to have your mind blown! {fact} - and that's just the beginning of today's amazing facts!",
-        "This is going to sound crazy, but {fact}! Let's talk about why this is so incredible!",
-        "Wait until you tell your friends this one... {fact}! Their reactions will be priceless!"
-    ]
-}
-
-# Different main content templates
-main_content_templates = {
-    'Conversational': [
-        "Let's think about what this means. {fact} is fascinating because it shows us how complex our world really is. Many people don't realize the implications of this information.",
-        "When you consider that {fact}, it makes you wonder what other amazing things we still don't know about our world. Scientists continue to study this phenomenon.",
-        "I find it incredible that {fact}. It's these kinds of details that make learning about our world so rewarding. There's always something new to discover."
-    ],
-    'Educational': [
-        "To understand why {fact}, we need to examine the underlying principles. This phenomenon occurs because of specific conditions that create this remarkable outcome.",
-        "The fact that {fact} has been verified through multiple studies. Researchers have documented this through careful observation and experimentation.",
-        "When we analyze {fact} more carefully, we can see how this connects to broader patterns in our world. This is consistent with what we know about related phenomena."
-    ],
-    'Entertaining': [
-        "Can you imagine if {fact} wasn't true? Our world would be completely different! This is the kind of mind-blowing information that makes reality stranger than fiction.",
-        "I was shocked when I first learned that {fact}! It's one of those facts that sounds made up but is absolutely true. The universe is full of surprises!",
-        "The next time you're at a party, try telling people that {fact}. Watch their jaws drop! It's the perfect conversation starter."
-    ]
-}
-
-# Different outro templates
-outro_templates = {
-    'Conversational': [
-        "Thanks for watching! If you enjoyed learning about {fact}, make sure to like and subscribe for more fascinating content.",
-        "I hope you found this information about {fact} as interesting as I did. See you in the next video!",
-        "Now that you know {fact}, be sure to share this video with someone who would appreciate this knowledge!"
-    ],
-    'Educational': [
-        "Understanding that {fact} helps us build a more complete picture of our world. Join us next time for more educational content.",
-        "We hope this explanation of why {fact} has been informative. Don't forget to subscribe for more in-depth explorations.",
-        "Continue your learning journey with us as we explore more fascinating facts like {fact} in our upcoming videos."
-    ],
-    'Entertaining': [
-        "Wasn't that amazing? Now you can amaze your friends by telling them that {fact}! Don't forget to like and subscribe!",
-        "Mind = blown! {fact} is just one of the incredible facts we share on this channel. Stay tuned for more!",
-        "If you enjoyed learning that {fact}, smash that like button and subscribe for more mind-blowing content!"
-    ]
-}
+    intro_templates = {
+        'Conversational': [
+            "Hey there! Did you know that {fact}? That's pretty amazing, right?",
+            "Welcome back to our channel! Today we're exploring an incredible fact: {fact}",
+            "Here's something that might surprise you... {fact}. Let's dive deeper into this!",
+            "I bet you didn't know that {fact}. It's one of those fascinating tidbits that makes life interesting."
+        ],
+        'Educational': [
+            "Today we're exploring an important fact: {fact}. This has significant implications for how we understand our world.",
+            "In this educational video, we'll examine the following fact: {fact}. Let's analyze what this means.",
+            "Welcome to our learning series! Today's fascinating topic centers around this fact: {fact}",
+            "The following information might change your perspective: {fact}. Let's explore the science behind this."
+        ],
+        'Entertaining': [
+            "You won't believe this, but {fact}! Mind-blowing, right?",
+            "Prepare to have your mind blown! {fact} - and that's just the beginning of today's amazing facts!",
+            "This is going to sound crazy, but {fact}! Let's talk about why this is so incredible!",
+            "Wait until you tell your friends this one... {fact}! Their reactions will be priceless!"
+        ]
+    }
+
+    # Different main content templates
+    main_content_templates = {
+        'Conversational': [
+            "Let's think about what this means. {fact} is fascinating because it shows us how complex our world really is. Many people don't realize the implications of this information.",
+            "When you consider that {fact}, it makes you wonder what other amazing things we still don't know about our world. Scientists continue to study this phenomenon.",
+            "I find it incredible that {fact}. It's these kinds of details that make learning about our world so rewarding. There's always something new to discover."
+        ],
+        'Educational': [
+            "To understand why {fact}, we need to examine the underlying principles. This phenomenon occurs because of specific conditions that create this remarkable outcome.",
+            "The fact that {fact} has been verified through multiple studies. Researchers have documented this through careful observation and experimentation.",
+            "When we analyze {fact} more carefully, we can see how this connects to broader patterns in our world. This is consistent with what we know about related phenomena."
+        ],
+        'Entertaining': [
+            "Can you imagine if {fact} wasn't true? Our world would be completely different! This is the kind of mind-blowing information that makes reality stranger than fiction.",
+            "I was shocked when I first learned that {fact}! It's one of those facts that sounds made up but is absolutely true. The universe is full of surprises!",
+            "The next time you're at a party, try telling people that {fact}. Watch their jaws drop! It's the perfect conversation starter."
+        ]
+    }
+
+    # Different outro templates
+    outro_templates = {
+        'Conversational': [
+            "Thanks for watching! If you enjoyed learning about {fact}, make sure to like and subscribe for more fascinating content.",
+            "I hope you found this information about {fact} as interesting as I did. See you in the next video!",
+            "Now that you know {fact}, be sure to share this video with someone who would appreciate this knowledge!"
+        ],
+        'Educational': [
+            "Understanding that {fact} helps us build a more complete picture of our world. Join us next time for more educational content.",
+            "We hope this explanation of why {fact} has been informative. Don't forget to subscribe for more in-depth explorations.",
+            "Continue your learning journey with us as we explore more fascinating facts like {fact} in our upcoming videos."
+        ],
+        'Entertaining': [
+            "Wasn't that amazing? Now you can amaze your friends by telling them that {fact}! Don't forget to like and subscribe!",
+            "Mind = blown! {fact} is just one of the incredible facts we share on this channel. Stay tuned for more!",
+            "If you enjoyed learning that {fact}, smash that like button and subscribe for more mind-blowing content!"
+        ]
+    }
 
     
     generated_scripts = []
@@ -262,6 +319,7 @@ def assemble_videos():
             "duration": script['length'],
             "resolution": resolution,
             "voice_type": voice_type,
+            "file_path": data.get('file_paths', {}).get(str(script_id)),
             "status": "Ready",
             "created_at": datetime.now().isoformat()
         }
@@ -281,28 +339,55 @@ def publish_videos():
     
     video_ids = data['video_ids']
     privacy = data.get('privacy', 'Public')
+    # Retries with the same key (or of the same file without one) return the original job
+    request_key = request.headers.get('Idempotency-Key') or data.get('idempotency_key')
     
-    published_videos = []
+    videos = []
     for video_id in video_ids:
         # Find the video
         video = next((v for v in VIDEOS_DB if v['id'] == video_id), None)
         if not video:
             continue
-        
-        # Create published video (in a real app, this would upload to YouTube)
-        new_published_video = {
-            "id": len(PUBLISHED_VIDEOS_DB) + 1,
-            "video_id": video_id,
-            "title": video['title'],
-            "privacy": privacy,
-            "youtube_url": f"https://youtube.com/watch?v=example{video_id}",
-            "published_at": datetime.now() .isoformat()
-        }
-        
-        PUBLISHED_VIDEOS_DB.append(new_published_video)
-        published_videos.append(new_published_video)
+        file_path = video.get('file_path')
+        if not file_path or not os.path.isfile(file_path):
+            return jsonify({"error": f"Video {video_id} has no rendered file to publish"}), 400
+        videos.append((video_id, video, file_path))
+    
+    jobs = []
+    for video_id, video, file_path in videos:
+        if request_key:
+            key = f"{request_key}:{video_id}"
+        else:
+            # VIDEOS_DB ids restart with the process; the file's identity doesn't
+            stat = os.stat(file_path)
+            key = f"file:{os.path.realpath(file_path)}:{stat.st_size}:{stat.st_mtime_ns}:{privacy.lower()}"
+        job = PUBLISH_PIPELINE.submit(
+            key,
+            file_path,
+            video['title'],
+            description=data.get('description', ''),
+            tags=data.get('tags'),
+            privacy_status=privacy.lower(),
+            metadata={"video_id": video_id}
+        )
+        jobs.append(job)
     
-    return jsonify(published_videos), 201
+    return jsonify(jobs), 202
+
+@app.route('/api/publish/jobs', methods=['GET'])
+def get_publish_jobs():
+    return jsonify(PUBLISH_PIPELINE.list_jobs(request.args.get('status')))
+
+@app.route('/api/publish/jobs/<job_id>', methods=['GET'])
+def get_publish_job(job_id):
+    job = PUBLISH_PIPELINE.get(job_id)
+    if not job:
+        return jsonify({"error": "Publish job not found"}), 404
+    return jsonify(job)
+
+@app.route('/api/published', methods=['GET'])
+def get_published_videos():
+    return jsonify(PUBLISHED_VIDEOS_DB)
 
 @app.route('/api/analytics', methods=['GET'])
 def get_analytics():
@@ -320,5 +405,7 @@ def get_analytics():
     })
 
 if __name__ == '__main__':
+    # Resume publish jobs recovered from the jobs file (gunicorn does this in post_fork)
+    PUBLISH_PIPELINE.start()
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port)
@@ -0,0 +1,18 @@
+"""
+Gunicorn settings for the backend
+"""
+
+import os
+
+chdir = os.path.dirname(os.path.abspath(__file__))
+
+# One worker process owns the publish jobs file; requests are served on its threads
+workers = 1
+worker_class = "gthread"
+threads = int(os.environ.get('WEB_THREADS', 8))
+
+
+def post_fork(server, worker):
+    # Resume publish jobs recovered from the jobs file; threads started before a fork don't survive it
+    from app import PUBLISH_PIPELINE
+    PUBLISH_PIPELINE.start()
@@ -0,0 +1,171 @@
+"""
+Import Time Benchmark for YouTube Automation
+Measures cold-start imports of the Streamlit app and the backend with -X importtime and fails on regressions
+relative to a stdlib-only baseline measured in the same run
+"""
+
+import os
+import sys
+import ast
+import json
+import argparse
+import subprocess
+from typing import Dict, Any, List, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Framework imports excluded from the app target; the budget covers this repo's own imports
+FRAMEWORK_MODULES = ("streamlit",)
+
+# Standard library modules imported as the baseline; budgets are multiples of their import time,
+# so a slow or loaded machine raises the budgets along with the measurements
+BASELINE_MODULES = (
+    "json", "re", "threading", "subprocess", "datetime", "dataclasses", "typing",
+    "concurrent.futures", "http.client", "logging", "uuid"
+)
+
+# Cumulative import time allowed per target, as a multiple of the baseline
+IMPORT_BUDGET_RATIO = {
+    "app": 2.5,
+    "backend": 8
+}
+
+# Packages that must only be imported on first use, never at startup
+LAZY_PACKAGES = (
+    "googleapiclient", "google_auth_oauthlib", "google_auth_httplib2", "google.oauth2",
+    "google.auth", "oauthlib", "httplib2", "requests", "openai", "numpy", "PIL"
+)
+
+
+def app_startup_modules() -> List[str]:
+    """Modules app.py imports at module level, read from its source"""
+    with open(os.path.join(ROOT_DIR, "app.py"), 'r') as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            if name.split(".")[0] not in FRAMEWORK_MODULES and name not in modules:
+                modules.append(name)
+    return modules
+
+
+def startup_targets() -> Dict[str, Tuple[str, List[str]]]:
+    """Startup targets: name -> (working directory, modules imported at startup)"""
+    return {
+        "app": (ROOT_DIR, app_startup_modules()),
+        "backend": (os.path.join(ROOT_DIR, "backend"), ["app"])
+    }
+
+
+def measure_imports(cwd: str, modules: List[str]) -> Tuple[float, List[str]]:
+    """
+    Import modules in a fresh interpreter under -X importtime
+
+    Args:
+        cwd: Working directory of the interpreter (first on sys.path)
+        modules: Modules to import
+
+    Returns:
+        Cumulative import time of the modules in milliseconds, and every module imported
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        cwd=cwd, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {', '.join(modules)} failed:\n{result.stderr.strip()[-2000:]}")
+
+    total_us = 0
+    imported = []
+    for line in result.stderr.splitlines():
+        # "import time:       self [us] |  cumulative | imported package"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue
+        imported.append(name.strip())
+        # Only top-level entries; nested ones are already in their parent's cumulative time
+        if name.strip() in modules and not name.startswith("  ", 1):
+            total_us += int(cumulative)
+    return total_us / 1000, imported
+
+
+def eager_imports(imported: List[str]) -> List[str]:
+    """Packages from LAZY_PACKAGES that were imported, in whole or in part"""
+    return sorted(package for package in LAZY_PACKAGES
+                  if any(name == package or name.startswith(f"{package}.") for name in imported))
+
+
+def measure_baseline(runs: int) -> float:
+    """Fastest import time of BASELINE_MODULES in milliseconds"""
+    return min(measure_imports(ROOT_DIR, list(BASELINE_MODULES))[0] for _ in range(runs))
+
+
+def run_benchmark(runs: int) -> Dict[str, Any]:
+    """
+    Measure every target
+
+    Args:
+        runs: Fresh interpreters started per target and for the baseline; the fastest run is reported
+
+    Returns:
+        Baseline import time, and per-target import time, budget and eagerly imported packages
+    """
+    baseline_ms = measure_baseline(runs)
+    results = {}
+    for target, (cwd, modules) in startup_targets().items():
+        timings = []
+        eager = set()
+        for _ in range(runs):
+            milliseconds, imported = measure_imports(cwd, modules)
+            timings.append(milliseconds)
+            eager.update(eager_imports(imported))
+        results[target] = {
+            "milliseconds": min(timings),
+            "budget_ms": IMPORT_BUDGET_RATIO[target] * baseline_ms,
+            "eager_imports": sorted(eager)
+        }
+    return {"baseline_ms": baseline_ms, "targets": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold-start import time of the app and the backend")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per target")
+    parser.add_argument("--budget-scale", type=float, default=1.0,
+                        help="Multiplier applied to the budgets (for slow CI runners)")
+    parser.add_argument("--check", action="store_true", help="Exit non-zero when a target regresses")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    benchmark = run_benchmark(args.runs)
+    results = benchmark["targets"]
+    failures = []
+    for target, result in results.items():
+        budget = result["budget_ms"] * args.budget_scale
+        if result["milliseconds"] > budget:
+            failures.append(f"{target}: imports took {result['milliseconds']:.1f} ms, budget {budget:.0f} ms")
+        if result["eager_imports"]:
+            failures.append(f"{target}: imports {', '.join(result['eager_imports'])} at startup")
+
+    if args.json:
+        print(json.dumps({**benchmark, "failures": failures}, indent=2))
+    else:
+        print(f"stdlib baseline: {benchmark['baseline_ms']:.1f} ms")
+        for target, result in results.items():
+            print(f"{target}: {result['milliseconds']:.1f} ms (budget {result['budget_ms'] * args.budget_scale:.0f} ms)")
+        for failure in failures:
+            print(f"FAIL {failure}")
+
+    if args.check and failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+YouTube API Benchmark for YouTube Automation
+Measures upload throughput, retry behaviour and statistics lookups against the fake YouTube server
+"""
+
+import os
+import json
+import time
+import pickle
+import argparse
+import tempfile
+from typing import Dict, Any, List
+
+from google.oauth2.credentials import Credentials
+
+import youtube_api_implementation
+from youtube_api_implementation import YouTubeAPIRefreshToken
+from youtube_integration import YouTubeAPI
+from fake_youtube_server import FakeYouTubeServer
+
+
+def write_fake_token(token_file: str):
+    """Save access-token-only credentials the fake server accepts"""
+    with open(token_file, 'wb') as f:
+        pickle.dump(Credentials(token="fake-token"), f)
+
+
+def make_video_files(directory: str, count: int, size_bytes: int) -> List[str]:
+    """Create random files standing in for rendered videos"""
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"bench_{i}.mp4")
+        with open(path, 'wb') as f:
+            f.write(os.urandom(size_bytes))
+        paths.append(path)
+    return paths
+
+
+def bench_uploads(client: str, root_url: str, token_file: str, paths: List[str],
+                  parallel: int, chunk_size: int) -> Dict[str, Any]:
+    """
+    Upload every file once and time it
+
+    Args:
+        client: "refresh" (YouTubeAPIRefreshToken.upload_videos) or
+            "integration" (YouTubeAPI.upload_video, sequential)
+        root_url: Fake server URL
+        token_file: Token pickle to authenticate with
+        paths: Files to upload
+        parallel: Concurrent uploads (refresh client only)
+        chunk_size: Upload chunk size in bytes (refresh client only)
+
+    Returns:
+        Elapsed seconds and upload outcome counts
+    """
+    started = time.perf_counter()
+    if client == "refresh":
+        api = YouTubeAPIRefreshToken(token_file=token_file, root_url=root_url)
+        api.authenticate()
+        batch = [{"file_path": path, "title": os.path.basename(path), "description": "benchmark",
+                  "chunk_size": chunk_size} for path in paths]
+        results = api.upload_videos(batch, max_parallel=parallel)
+        failed = sum(1 for result in results if result["status"] == "failed")
+    else:
+        api = YouTubeAPI(root_url=root_url)
+        api.authenticate(token_path=token_file)
+        failed = 0
+        for path in paths:
+            try:
+                api.upload_video(path, os.path.basename(path), "benchmark")
+            except Exception as e:
+                print(f"Upload of {path} failed: {str(e)}")
+                failed += 1
+    return {"seconds": time.perf_counter() - started, "uploaded": len(paths) - failed, "failed": failed}
+
+
+def bench_statistics(client: str, root_url: str, token_file: str, video_ids: List[str]) -> Dict[str, Any]:
+    """Time a batched statistics lookup for video_ids"""
+    if client == "refresh":
+        api = YouTubeAPIRefreshToken(token_file=token_file, root_url=root_url)
+        api.authenticate()
+    else:
+        api = YouTubeAPI(root_url=root_url)
+        api.authenticate(token_path=token_file)
+    started = time.perf_counter()
+    statistics = api.get_videos_statistics(video_ids)
+    return {"seconds": time.perf_counter() - started, "videos": len(statistics)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the YouTube clients against a local fake server")
+    parser.add_argument("--client", choices=("refresh", "integration"), default="refresh")
+    parser.add_argument("--uploads", type=int, default=4, help="Videos uploaded per run")
+    parser.add_argument("--size-mb", type=float, default=16, help="Size of each video")
+    parser.add_argument("--chunk-mb", type=float, default=8, help="Upload chunk size (multiple of 0.25)")
+    parser.add_argument("--parallel", default="1,2,4", help="Comma-separated upload concurrency levels")
+    parser.add_argument("--latency", type=float, default=0.02, help="Fake server latency per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of an injected 5xx error")
+    parser.add_argument("--max-backoff", type=float, default=1.0,
+                        help="Cap on retry backoff in seconds (production uses 64)")
+    parser.add_argument("--stats-videos", type=int, default=500, help="Videos in the statistics lookup")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    # Keep injected-error runs short; the retry path itself is unchanged
+    youtube_api_implementation.MAX_RETRY_BACKOFF = args.max_backoff
+
+    results = {"uploads": [], "statistics": None}
+    with tempfile.TemporaryDirectory() as workdir:
+        token_file = os.path.join(workdir, "token.pickle")
+        write_fake_token(token_file)
+        size_bytes = int(args.size_mb * 1024 * 1024)
+        paths = make_video_files(workdir, args.uploads, size_bytes)
+        chunk_size = int(args.chunk_mb * 1024 * 1024)
+
+        levels = [int(level) for level in args.parallel.split(",")] if args.client == "refresh" else [1]
+        for parallel in levels:
+            with FakeYouTubeServer(latency=args.latency, error_rate=args.error_rate) as server:
+                run = bench_uploads(args.client, server.url, token_file, paths, parallel, chunk_size)
+                stats = server.stats()
+            megabytes = stats["upload_bytes"] / (1024 * 1024)
+            run.update({
+                "parallel": parallel,
+                "throughput_mb_s": megabytes / run["seconds"] if run["seconds"] else 0.0,
+                "requests": stats["requests"],
+                "upload_chunks": stats["upload_chunks"],
+                "injected_errors": stats["injected_errors"]
+            })
+            results["uploads"].append(run)
+
+        with FakeYouTubeServer(latency=args.latency) as server:
+            video_ids = server.add_videos(args.stats_videos)
+            run = bench_statistics(args.client, server.url, token_file, video_ids)
+            run["requests"] = server.stats()["requests"]
+            results["statistics"] = run
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Uploads ({args.client} client, {args.uploads} x {args.size_mb:g} MB, "
+          f"latency {args.latency * 1000:.0f} ms, error rate {args.error_rate:.0%})")
+    for run in results["uploads"]:
+        print(f"  parallel={run['parallel']}: {run['seconds']:.2f}s, {run['throughput_mb_s']:.1f} MB/s, "
+              f"{run['uploaded']} ok / {run['failed']} failed, {run['requests']} requests, "
+              f"{run['injected_errors']} injected errors retried")
+    run = results["statistics"]
+    print(f"Statistics for {args.stats_videos} videos: {run['seconds'] * 1000:.0f} ms, "
+          f"{run['requests']} requests, {run['videos']} returned")
+
+
+if __name__ == "__main__":
+    main()
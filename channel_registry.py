@@ -0,0 +1,331 @@
+"""
+Channel Registry Module for YouTube Automation
+Per-channel YouTube credentials, quota ledgers, analytics caches and authenticated clients
+"""
+
+import os
+import re
+import json
+import threading
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable, Iterable
+
+from analytics_cache import AnalyticsCache
+from quota_ledger import QuotaLedger, DEFAULT_DAILY_QUOTA
+
+# Id of the channel that was set up before channels could be added
+DEFAULT_CHANNEL = "default"
+
+# Channel ids name directories, so only these characters are allowed
+CHANNEL_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+# Calls per channel that run at once in a batch, so one busy channel can't take every worker
+DEFAULT_PER_CHANNEL_LIMIT = 2
+
+# Worker threads per batch
+DEFAULT_BATCH_WORKERS = 8
+
+
+def create_youtube_client(channel: Dict[str, Any], cache: AnalyticsCache, ledger: QuotaLedger):
+    """Authenticate a YouTube client from a channel's saved token (or its client secrets on first use)"""
+    from youtube_api_implementation import setup_youtube_api
+    return setup_youtube_api(client_secrets_file=channel.get("client_secrets_file"),
+                             token_file=channel["token_file"], cache=cache, quota_ledger=ledger)
+
+
+class ChannelRegistry:
+    """
+    YouTube channels the automation publishes to
+
+    Every channel has its own token file, client secrets, quota ledger and
+    analytics cache, stored under ``channels_dir/<channel id>/`` unless
+    other paths are given. ``client(channel_id)`` authenticates a channel's
+    client once and reuses it for every later call from any thread, so
+    operations are routed by channel id without re-authenticating.
+    ``run_batch()`` runs work for many channels on a shared pool, taking
+    channels in turn and capping the calls per channel, so each channel
+    progresses at the same pace whatever the size of its share.
+    """
+
+    def __init__(self,
+                 registry_file: str,
+                 channels_dir: str,
+                 daily_limit: int = DEFAULT_DAILY_QUOTA,
+                 client_factory: Callable[[Dict[str, Any], AnalyticsCache, QuotaLedger], Any] = create_youtube_client):
+        """
+        Initialize the ChannelRegistry
+
+        Args:
+            registry_file: JSON file the channel records are persisted to
+            channels_dir: Directory holding each channel's files
+            daily_limit: Daily quota of each channel's ledger
+            client_factory: Callable creating an authenticated client from a channel record, cache and ledger
+        """
+        self.registry_file = registry_file
+        self.channels_dir = channels_dir
+        self.daily_limit = daily_limit
+        self.client_factory = client_factory
+
+        self._lock = threading.Lock()
+        self._channels: Dict[str, Dict[str, Any]] = self._load()
+        self._ledgers: Dict[str, QuotaLedger] = {}
+        self._caches: Dict[str, AnalyticsCache] = {}
+        self._clients: Dict[str, Any] = {}
+        self._client_locks: Dict[str, threading.Lock] = {}
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load the channel records"""
+        if os.path.exists(self.registry_file):
+            try:
+                with open(self.registry_file, 'r') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Error loading channels from {self.registry_file}: {str(e)}")
+        return {}
+
+    def _save(self):
+        """Write the channel records atomically; the caller holds the lock"""
+        directory = os.path.dirname(self.registry_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.registry_file}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self._channels, f, indent=2)
+        os.replace(tmp_path, self.registry_file)
+
+    def _record(self, channel_id: str) -> Dict[str, Any]:
+        """A channel's record; the caller holds the lock"""
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            raise KeyError(f"Unknown channel: {channel_id}")
+        return channel
+
+    def _forget(self, channel_id: str):
+        """Drop a channel's cached objects so they are rebuilt from its record; the caller holds the lock"""
+        self._clients.pop(channel_id, None)
+        self._ledgers.pop(channel_id, None)
+        cache = self._caches.pop(channel_id, None)
+        if cache is not None:
+            cache.flush()
+
+    def add_channel(self,
+                    channel_id: str,
+                    name: Optional[str] = None,
+                    client_config: Optional[Dict[str, Any]] = None,
+                    **paths) -> Dict[str, Any]:
+        """
+        Register a channel, or update a registered one
+
+        Args:
+            channel_id: Id the channel is routed by (letters, digits, "_" and "-")
+            name: Display name
+            client_config: OAuth client configuration saved as the channel's client secrets
+            **paths: token_file, client_secrets_file, ledger_file or cache_file overriding the defaults
+
+        Returns:
+            Copy of the channel record
+        """
+        if not CHANNEL_ID_PATTERN.match(channel_id):
+            raise ValueError(f"Invalid channel id: {channel_id!r}")
+        directory = os.path.join(self.channels_dir, channel_id)
+        with self._lock:
+            previous = self._channels.get(channel_id)
+            channel = dict(previous) if previous else {
+                "id": channel_id,
+                "name": channel_id,
+                "token_file": os.path.join(directory, "token.pickle"),
+                "client_secrets_file": None,
+                "ledger_file": os.path.join(directory, "quota_ledger.json"),
+                "cache_file": os.path.join(directory, "analytics_cache.json"),
+                "added_at": datetime.now().isoformat()
+            }
+            if name:
+                channel["name"] = name
+            channel.update({key: value for key, value in paths.items() if value})
+            if client_config is not None:
+                secrets_file = os.path.join(directory, "client_secret.json")
+                os.makedirs(directory, exist_ok=True)
+                tmp_path = f"{secrets_file}.tmp"
+                with open(tmp_path, 'w') as f:
+                    json.dump(client_config, f)
+                os.replace(tmp_path, secrets_file)
+                channel["client_secrets_file"] = secrets_file
+            self._channels[channel_id] = channel
+            if previous is None or previous["ledger_file"] != channel["ledger_file"]:
+                self._ledgers.pop(channel_id, None)
+            if previous is None or previous["cache_file"] != channel["cache_file"]:
+                cache = self._caches.pop(channel_id, None)
+                if cache is not None:
+                    cache.flush()
+            # New credentials or secrets take effect on the next call; usage already counted stays
+            self._clients.pop(channel_id, None)
+            self._save()
+            return dict(channel)
+
+    def rename_channel(self, channel_id: str, name: str):
+        """Change a channel's display name"""
+        with self._lock:
+            self._record(channel_id)["name"] = name
+            self._save()
+
+    def remove_channel(self, channel_id: str) -> bool:
+        """Unregister a channel; its token and ledger files are left on disk"""
+        with self._lock:
+            if self._channels.pop(channel_id, None) is None:
+                return False
+            self._forget(channel_id)
+            self._client_locks.pop(channel_id, None)
+            self._save()
+            return True
+
+    def get_channel(self, channel_id: str) -> Optional[Dict[str, Any]]:
+        """Copy of a channel record, or None"""
+        with self._lock:
+            channel = self._channels.get(channel_id)
+            return dict(channel) if channel else None
+
+    def list_channels(self) -> List[Dict[str, Any]]:
+        """Copies of every channel record, oldest first"""
+        with self._lock:
+            channels = [dict(channel) for channel in self._channels.values()]
+        return sorted(channels, key=lambda channel: channel["added_at"])
+
+    def ledger(self, channel_id: str) -> QuotaLedger:
+        """The channel's quota ledger"""
+        with self._lock:
+            ledger = self._ledgers.get(channel_id)
+            if ledger is None:
+                ledger = QuotaLedger(self._record(channel_id)["ledger_file"], daily_limit=self.daily_limit)
+                self._ledgers[channel_id] = ledger
+            return ledger
+
+    def cache(self, channel_id: str) -> AnalyticsCache:
+        """The channel's analytics cache"""
+        with self._lock:
+            cache = self._caches.get(channel_id)
+            if cache is None:
+                cache = AnalyticsCache(self._record(channel_id)["cache_file"])
+                self._caches[channel_id] = cache
+            return cache
+
+    def client(self, channel_id: str):
+        """
+        The channel's authenticated YouTube client, created on first use
+
+        Args:
+            channel_id: Registered channel id
+
+        Returns:
+            Client shared by every caller routed to this channel
+        """
+        with self._lock:
+            client = self._clients.get(channel_id)
+            if client is not None:
+                return client
+            channel = dict(self._record(channel_id))
+            client_lock = self._client_locks.setdefault(channel_id, threading.Lock())
+        cache = self.cache(channel_id)
+        ledger = self.ledger(channel_id)
+        # Per-channel lock: a slow authentication holds up only callers of the same channel
+        with client_lock:
+            with self._lock:
+                client = self._clients.get(channel_id)
+            if client is None:
+                client = self.client_factory(channel, cache, ledger)
+                with self._lock:
+                    if channel_id in self._channels:
+                        self._clients[channel_id] = client
+            return client
+
+    def reset_client(self, channel_id: str):
+        """Drop a channel's client so the next call authenticates again (e.g. after new credentials)"""
+        with self._lock:
+            self._clients.pop(channel_id, None)
+
+    def invalidate_caches(self):
+        """Drop every channel's cached analytics"""
+        with self._lock:
+            caches = list(self._caches.values())
+        for cache in caches:
+            cache.invalidate()
+
+    def run_batch(self,
+                  jobs: Dict[str, Iterable[Callable[[Any], Any]]],
+                  max_workers: int = DEFAULT_BATCH_WORKERS,
+                  per_channel: int = DEFAULT_PER_CHANNEL_LIMIT) -> Dict[str, List[Future]]:
+        """
+        Run work for many channels in parallel, sharing the workers fairly
+
+        Workers take channels in round-robin order and skip channels that
+        already have ``per_channel`` calls running, so a channel with a long
+        batch can't hold up the others.
+
+        Args:
+            jobs: Callables per channel id; each is called with the channel's client
+            max_workers: Worker threads for the whole batch
+            per_channel: Maximum calls running at once for one channel
+
+        Returns:
+            Futures per channel id, in the order of its callables
+        """
+        pending = {channel_id: deque((fn, Future()) for fn in fns) for channel_id, fns in jobs.items()}
+        futures = {channel_id: [future for _, future in queue] for channel_id, queue in pending.items()}
+        rotation = deque(channel_id for channel_id, queue in pending.items() if queue)
+        running = {channel_id: 0 for channel_id in pending}
+        cond = threading.Condition()
+
+        def next_job():
+            """Next call of the first channel in turn with a free slot; the caller holds cond"""
+            for _ in range(len(rotation)):
+                channel_id = rotation[0]
+                rotation.rotate(-1)
+                if pending[channel_id] and running[channel_id] < per_channel:
+                    running[channel_id] += 1
+                    return channel_id, pending[channel_id].popleft()
+            return None
+
+        def work():
+            while True:
+                with cond:
+                    job = next_job()
+                    while job is None and any(pending.values()):
+                        cond.wait()
+                        job = next_job()
+                if job is None:
+                    return
+                channel_id, (fn, future) = job
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(self.client(channel_id)))
+                    except Exception as e:
+                        future.set_exception(e)
+                with cond:
+                    running[channel_id] -= 1
+                    cond.notify_all()
+
+        total = sum(len(queue) for queue in pending.values())
+        for i in range(min(max_workers, total)):
+            threading.Thread(target=work, name=f"channel-batch-{i}", daemon=True).start()
+        return futures
+
+    def map_channels(self,
+                     fn: Callable[[Any], Any],
+                     channel_ids: Optional[Iterable[str]] = None,
+                     max_workers: int = DEFAULT_BATCH_WORKERS) -> Dict[str, Future]:
+        """
+        Call fn with the client of each channel, in parallel
+
+        Args:
+            fn: Callable receiving a channel's client
+            channel_ids: Channels to call; defaults to every registered channel
+            max_workers: Worker threads
+
+        Returns:
+            Future per channel id
+        """
+        if channel_ids is None:
+            channel_ids = [channel["id"] for channel in self.list_channels()]
+        futures = self.run_batch({channel_id: [fn] for channel_id in channel_ids}, max_workers=max_workers)
+        return {channel_id: channel_futures[0] for channel_id, channel_futures in futures.items()}
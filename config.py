@@ -6,20 +6,38 @@ ASSETS_DIR = os.path.join(BASE_DIR, "assets")
 OUTPUT_DIR = os.path.join(BASE_DIR, "output")
 TOKEN_FILE = os.path.join(BASE_DIR, "youtube_token.pickle")
 CLIENT_SECRETS_FILE = os.path.join(BASE_DIR, "client_secret.json")
-
-# Create directories if they don't exist
-os.makedirs(ASSETS_DIR, exist_ok=True)
-os.makedirs(os.path.join(ASSETS_DIR, "images"), exist_ok=True)
-os.makedirs(os.path.join(ASSETS_DIR, "music"), exist_ok=True)
-os.makedirs(OUTPUT_DIR, exist_ok=True)  # Fixed this line
+SETTINGS_FILE = os.path.join(BASE_DIR, "settings.json")
+VIDEO_MANIFEST_DIR = os.path.join(OUTPUT_DIR, "manifest")
+CACHE_DIR = os.path.join(BASE_DIR, "cache")
+ANALYTICS_CACHE_FILE = os.path.join(CACHE_DIR, "analytics_cache.json")
+QUOTA_LEDGER_FILE = os.path.join(CACHE_DIR, "quota_ledger.json")
+PUBLISH_JOBS_FILE = os.path.join(CACHE_DIR, "publish_jobs.json")
+PUBLISH_QUEUE_FILE = os.path.join(CACHE_DIR, "publish_queue.json")
+UPLOAD_STAGING_DIR = os.path.join(CACHE_DIR, "uploads")
+TASKS_FILE = os.path.join(CACHE_DIR, "tasks.json")
+FACT_STORE_FILE = os.path.join(CACHE_DIR, "facts.json")
+CONTENT_DB_FILE = os.path.join(CACHE_DIR, "content.db")
+EVENT_LOG_FILE = os.path.join(CACHE_DIR, "events.jsonl")
+CHANNELS_FILE = os.path.join(CACHE_DIR, "channels.json")
+CHANNELS_DIR = os.path.join(CACHE_DIR, "channels")
 
 # YouTube API settings
 YOUTUBE_API_SCOPES = [
     'https://www.googleapis.com/auth/youtube.upload',
-    'https://www.googleapis.com/auth/youtube.readonly'
+    'https://www.googleapis.com/auth/youtube.readonly',
+    'https://www.googleapis.com/auth/youtube.force-ssl'
 ]
+YOUTUBE_DAILY_QUOTA = 10000
 
 # Content generation settings
+OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 DEFAULT_FACT_COUNT = 10
 DEFAULT_SCRIPT_FORMAT = "Conversational"
 DEFAULT_VIDEO_STYLE = "standard"
+
+
+def ensure_dirs():
+    """Create the asset, output and cache directories if they don't exist"""
+    for directory in (os.path.join(ASSETS_DIR, "images"), os.path.join(ASSETS_DIR, "music"),
+                      OUTPUT_DIR, CACHE_DIR):
+        os.makedirs(directory, exist_ok=True)
@@ -0,0 +1,253 @@
+"""
+Content Store Module for YouTube Automation
+SQLite store of created scripts, assembled videos and YouTube uploads with paged, searchable listings
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Sequence
+
+# Items per page when listing content
+DEFAULT_PAGE_SIZE = 10
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scripts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    owner TEXT NOT NULL,
+    task_id TEXT UNIQUE,
+    title TEXT NOT NULL,
+    fact_count INTEGER NOT NULL DEFAULT 0,
+    estimated_duration INTEGER NOT NULL DEFAULT 0,
+    full_script TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scripts_owner ON scripts (owner, id);
+
+CREATE TABLE IF NOT EXISTS videos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    owner TEXT NOT NULL,
+    task_id TEXT UNIQUE,
+    script_id INTEGER,
+    title TEXT NOT NULL,
+    path TEXT NOT NULL,
+    duration INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS videos_owner ON videos (owner, id);
+
+CREATE TABLE IF NOT EXISTS uploads (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    owner TEXT NOT NULL,
+    task_id TEXT UNIQUE,
+    youtube_id TEXT,
+    title TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS uploads_owner ON uploads (owner, id);
+"""
+
+SCRIPT_SUMMARY_COLUMNS = ("id", "title", "fact_count", "estimated_duration", "created_at")
+VIDEO_COLUMNS = ("id", "script_id", "title", "path", "duration", "created_at")
+UPLOAD_SUMMARY_COLUMNS = ("id", "youtube_id", "title", "created_at")
+
+
+class ContentStore:
+    """
+    Scripts, videos and uploads created by each owner
+
+    Listings are paged and filtered in SQL and return summary rows only, so
+    the cost of rendering a page doesn't grow with history. The full script
+    text and the raw YouTube response are loaded one item at a time with
+    ``get_script()`` and ``get_upload()``. Rows written on behalf of a task
+    carry its id; writing the same task again is ignored, so results can be
+    recorded more than once safely.
+    """
+
+    def __init__(self, db_path: str = ":memory:"):
+        """
+        Initialize the ContentStore
+
+        Args:
+            db_path: SQLite database file, or ":memory:"
+        """
+        self.db_path = db_path
+        if db_path != ":memory:":
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        # One connection shared by the script threads and the task runner
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def _insert(self, table: str, row: Dict[str, Any]) -> Optional[int]:
+        """Insert a row unless its task_id is already stored; returns the row id"""
+        columns = ", ".join(row)
+        placeholders = ", ".join("?" for _ in row)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"INSERT OR IGNORE INTO {table} ({columns}) VALUES ({placeholders})", tuple(row.values())
+            )
+            if cursor.rowcount:
+                return cursor.lastrowid
+            found = self._conn.execute(f"SELECT id FROM {table} WHERE task_id = ?", (row.get("task_id"),)).fetchone()
+            return found["id"] if found else None
+
+    def _where(self, owner: str, search_columns: Sequence[str], search: Optional[str]):
+        """Build the WHERE clause for an owner's rows matching search"""
+        clause = "owner = ?"
+        params: List[Any] = [owner]
+        if search:
+            pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            clause += " AND (" + " OR ".join(f"{column} LIKE ? ESCAPE '\\'" for column in search_columns) + ")"
+            params.extend(pattern for _ in search_columns)
+        return clause, params
+
+    def _list(self, table: str, columns: Sequence[str], owner: str, search_columns: Sequence[str],
+              search: Optional[str], offset: int, limit: int) -> List[Dict[str, Any]]:
+        clause, params = self._where(owner, search_columns, search)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(columns)} FROM {table} WHERE {clause} ORDER BY id DESC LIMIT ? OFFSET ?",
+                params + [limit, offset]
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def _count(self, table: str, owner: str, search_columns: Sequence[str], search: Optional[str]) -> int:
+        clause, params = self._where(owner, search_columns, search)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {table} WHERE {clause}", params).fetchone()[0]
+
+    def add_script(self, owner: str, script_data: Dict[str, Any], task_id: Optional[str] = None) -> Optional[int]:
+        """
+        Store a script
+
+        Args:
+            owner: Owner the script is listed under
+            script_data: Script data from ScriptGenerator
+            task_id: Id of the task that created it
+
+        Returns:
+            Id of the stored script
+        """
+        return self._insert("scripts", {
+            "owner": owner,
+            "task_id": task_id,
+            "title": script_data.get("title", "Untitled"),
+            "fact_count": script_data.get("fact_count", 0),
+            "estimated_duration": script_data.get("estimated_duration", 0),
+            "full_script": script_data.get("full_script", ""),
+            "data": json.dumps(script_data, default=str),
+            "created_at": datetime.now().isoformat()
+        })
+
+    def get_script(self, script_id: int) -> Optional[Dict[str, Any]]:
+        """Load a script's full data, with "id" set to its store id"""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM scripts WHERE id = ?", (script_id,)).fetchone()
+        if row is None:
+            return None
+        return dict(json.loads(row["data"]), id=script_id)
+
+    def list_scripts(self, owner: str, search: Optional[str] = None,
+                     offset: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> List[Dict[str, Any]]:
+        """
+        List script summaries, newest first
+
+        Args:
+            owner: Owner whose scripts are listed
+            search: Only scripts whose title or text contains this
+            offset: Number of matching scripts skipped
+            limit: Maximum number of scripts returned
+
+        Returns:
+            Summary dictionaries without the script text
+        """
+        return self._list("scripts", SCRIPT_SUMMARY_COLUMNS, owner, ("title", "full_script"), search, offset, limit)
+
+    def count_scripts(self, owner: str, search: Optional[str] = None) -> int:
+        """Number of an owner's scripts matching search"""
+        return self._count("scripts", owner, ("title", "full_script"), search)
+
+    def add_video(self, owner: str, video_info: Dict[str, Any], task_id: Optional[str] = None) -> Optional[int]:
+        """
+        Store an assembled video
+
+        Args:
+            owner: Owner the video is listed under
+            video_info: Dictionary with "path", "title", "duration" and "script_id"
+            task_id: Id of the task that created it
+
+        Returns:
+            Id of the stored video
+        """
+        return self._insert("videos", {
+            "owner": owner,
+            "task_id": task_id,
+            "script_id": video_info.get("script_id"),
+            "title": video_info.get("title", "Untitled"),
+            "path": video_info["path"],
+            "duration": video_info.get("duration", 0),
+            "created_at": datetime.now().isoformat()
+        })
+
+    def get_video(self, video_id: int) -> Optional[Dict[str, Any]]:
+        """Load a stored video"""
+        with self._lock:
+            row = self._conn.execute(f"SELECT {', '.join(VIDEO_COLUMNS)} FROM videos WHERE id = ?",
+                                     (video_id,)).fetchone()
+        return dict(row) if row else None
+
+    def list_videos(self, owner: str, search: Optional[str] = None,
+                    offset: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> List[Dict[str, Any]]:
+        """List videos, newest first, optionally only those whose title contains search"""
+        return self._list("videos", VIDEO_COLUMNS, owner, ("title",), search, offset, limit)
+
+    def count_videos(self, owner: str, search: Optional[str] = None) -> int:
+        """Number of an owner's videos matching search"""
+        return self._count("videos", owner, ("title",), search)
+
+    def add_upload(self, owner: str, response: Dict[str, Any], task_id: Optional[str] = None) -> Optional[int]:
+        """
+        Store a YouTube upload
+
+        Args:
+            owner: Owner the upload is listed under
+            response: videos.insert response
+            task_id: Id of the task that uploaded it
+
+        Returns:
+            Id of the stored upload
+        """
+        return self._insert("uploads", {
+            "owner": owner,
+            "task_id": task_id,
+            "youtube_id": response.get("id"),
+            "title": response.get("snippet", {}).get("title", "Unknown"),
+            "data": json.dumps(response, default=str),
+            "created_at": datetime.now().isoformat()
+        })
+
+    def get_upload(self, upload_id: int) -> Optional[Dict[str, Any]]:
+        """Load the full videos.insert response of an upload"""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM uploads WHERE id = ?", (upload_id,)).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def list_uploads(self, owner: str, search: Optional[str] = None,
+                     offset: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> List[Dict[str, Any]]:
+        """List upload summaries, newest first, optionally only those whose title contains search"""
+        return self._list("uploads", UPLOAD_SUMMARY_COLUMNS, owner, ("title",), search, offset, limit)
+
+    def count_uploads(self, owner: str, search: Optional[str] = None) -> int:
+        """Number of an owner's uploads matching search"""
+        return self._count("uploads", owner, ("title",), search)
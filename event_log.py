@@ -0,0 +1,203 @@
+"""
+Event Log Module for YouTube Automation
+Append-only log of pipeline events with incrementally maintained per-minute, hour and day rollups
+"""
+
+import os
+import json
+import time
+import atexit
+import threading
+from collections import deque
+from typing import Dict, Any, List, Optional
+
+# Pipeline event types
+EVENT_FACTS_GENERATED = "facts_generated"
+EVENT_SCRIPT_CREATED = "script_created"
+EVENT_VIDEO_ASSEMBLED = "video_assembled"
+EVENT_VIDEO_PUBLISHED = "video_published"
+
+# Rollup resolutions: (bucket length in seconds, strftime format of the bucket key, buckets kept)
+RESOLUTIONS = {
+    "minute": (60, "%Y-%m-%dT%H:%M", 24 * 60),
+    "hour": (3600, "%Y-%m-%dT%H", 30 * 24),
+    "day": (86400, "%Y-%m-%d", 365)
+}
+
+# Most recent events kept for activity feeds
+RECENT_EVENTS = 50
+
+
+class EventLog:
+    """
+    Append-only JSON-lines event log with rollups
+
+    ``record()`` appends one compact line per event. Totals, per-bucket
+    counts at every resolution in ``RESOLUTIONS`` (local time) and the most
+    recent events are updated as each line is applied, so reads never scan
+    the log. Rollups are snapshotted to ``rollup_file`` together with the
+    log offset they cover; on startup only the lines written after the
+    snapshot are replayed. Reads also apply lines appended by other
+    processes (e.g. the backend) since the last read.
+    """
+
+    def __init__(self,
+                 log_file: str,
+                 rollup_file: Optional[str] = None,
+                 snapshot_every: int = 100):
+        """
+        Initialize the EventLog
+
+        Args:
+            log_file: JSON-lines file events are appended to
+            rollup_file: JSON file rollups are snapshotted to; defaults to log_file + ".rollup.json"
+            snapshot_every: Events applied between rollup snapshots
+        """
+        self.log_file = log_file
+        self.rollup_file = rollup_file or f"{log_file}.rollup.json"
+        self.snapshot_every = snapshot_every
+
+        self._lock = threading.Lock()
+        self._offset = 0
+        self._unsaved = 0
+        self._totals: Dict[str, int] = {}
+        self._buckets: Dict[str, Dict[str, Dict[str, int]]] = {resolution: {} for resolution in RESOLUTIONS}
+        self._recent: deque = deque(maxlen=RECENT_EVENTS)
+        self._load()
+        atexit.register(self.snapshot)
+
+    def _load(self):
+        """Load the rollup snapshot, then replay the rest of the log"""
+        if os.path.exists(self.rollup_file):
+            try:
+                with open(self.rollup_file, 'r') as f:
+                    data = json.load(f)
+                self._offset = data["offset"]
+                self._totals = data["totals"]
+                self._buckets.update(data["buckets"])
+                self._recent.extend(data["recent"])
+            except (OSError, ValueError, KeyError):
+                self._offset = 0
+        with self._lock:
+            if os.path.exists(self.log_file) and os.path.getsize(self.log_file) < self._offset:
+                # The log was truncated or replaced; rebuild from scratch
+                self._offset = 0
+                self._totals = {}
+                self._buckets = {resolution: {} for resolution in RESOLUTIONS}
+                self._recent.clear()
+            self._catch_up()
+
+    def snapshot(self):
+        """Persist the rollups and the log offset they cover, atomically"""
+        with self._lock:
+            self._catch_up()
+            payload = json.dumps({
+                "offset": self._offset,
+                "totals": self._totals,
+                "buckets": self._buckets,
+                "recent": list(self._recent)
+            }, separators=(',', ':'))
+            self._unsaved = 0
+        directory = os.path.dirname(self.rollup_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.rollup_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(payload)
+        os.replace(tmp_path, self.rollup_file)
+
+    def _catch_up(self):
+        """Apply log lines written since the last read; the caller holds the lock"""
+        try:
+            if os.path.getsize(self.log_file) <= self._offset:
+                return
+        except OSError:
+            return
+        with open(self.log_file, 'rb') as f:
+            f.seek(self._offset)
+            data = f.read()
+        # A line still being written has no newline yet; it is applied on a later read
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError):
+                continue
+            self._unsaved += 1
+        self._offset += end
+
+    def _apply(self, event: Dict[str, Any]):
+        """Add one event to the rollups; the caller holds the lock"""
+        event_type = event["type"]
+        count = event.get("n", 1)
+        self._totals[event_type] = self._totals.get(event_type, 0) + count
+        local_time = time.localtime(event["t"])
+        for resolution, (_, key_format, keep) in RESOLUTIONS.items():
+            buckets = self._buckets[resolution].setdefault(event_type, {})
+            key = time.strftime(key_format, local_time)
+            buckets[key] = buckets.get(key, 0) + count
+            # Buckets are created in time order, so the first one is the oldest
+            while len(buckets) > keep:
+                del buckets[next(iter(buckets))]
+        self._recent.append(event)
+
+    def record(self, event_type: str, label: Optional[str] = None, count: int = 1):
+        """
+        Append an event
+
+        Args:
+            event_type: One of the EVENT_* types
+            label: Short description shown in activity feeds
+            count: Number of items the event stands for (e.g. facts generated)
+        """
+        event = {"t": round(time.time(), 3), "type": event_type, "n": count}
+        if label:
+            event["label"] = label
+        line = json.dumps(event, separators=(',', ':')) + "\n"
+        with self._lock:
+            directory = os.path.dirname(self.log_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # One write per line in append mode, so concurrent writers don't interleave lines
+            with open(self.log_file, 'a') as f:
+                f.write(line)
+            self._catch_up()
+            save = self._unsaved >= self.snapshot_every
+        if save:
+            self.snapshot()
+
+    def totals(self) -> Dict[str, int]:
+        """Count per event type over the whole log"""
+        with self._lock:
+            self._catch_up()
+            return dict(self._totals)
+
+    def series(self, event_type: str, resolution: str = "hour", periods: int = 24) -> List[Dict[str, Any]]:
+        """
+        Counts of an event type per bucket, oldest first, ending with the current bucket
+
+        Args:
+            event_type: Event type to count
+            resolution: "minute", "hour" or "day"
+            periods: Number of buckets returned
+
+        Returns:
+            List of {"bucket": key, "count": n}
+        """
+        seconds, key_format, _ = RESOLUTIONS[resolution]
+        now = time.time()
+        keys = [time.strftime(key_format, time.localtime(now - i * seconds)) for i in reversed(range(periods))]
+        with self._lock:
+            self._catch_up()
+            buckets = self._buckets[resolution].get(event_type, {})
+            return [{"bucket": key, "count": buckets.get(key, 0)} for key in keys]
+
+    def count_current(self, event_type: str, resolution: str = "day") -> int:
+        """Count of an event type in the current minute, hour or day"""
+        return self.series(event_type, resolution, periods=1)[0]["count"]
+
+    def recent(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Most recent events, newest first"""
+        with self._lock:
+            self._catch_up()
+            return [dict(event) for event in reversed(self._recent)][:limit]
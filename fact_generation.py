@@ -4,23 +4,133 @@ Uses OpenAI API to generate interesting facts for videos
 """
 
 import os
+import time
 import random
 import json
+import threading
 from typing import List, Dict, Any, Optional
 
+# Seconds generated facts are reused for identical requests
+FACT_CACHE_TTL = 3600
+
+# Fallback facts served by get_sample_facts, built once at import
+SAMPLE_FACTS = {
+    "Science": [
+        {
+            "text": "The human body contains enough carbon to fill about 9,000 pencils.",
+            "source": "Scientific American",
+            "category": "Science"
+        },
+        {
+            "text": "A teaspoonful of neutron star would weigh about 6 billion tons.",
+            "source": "NASA Astrophysics",
+            "category": "Science"
+        },
+        {
+            "text": "The average person walks the equivalent of three times around the world in a lifetime.",
+            "source": "Health Research Institute",
+            "category": "Science"
+        }
+    ],
+    "History": [
+        {
+            "text": "The shortest war in history was between Britain and Zanzibar in 1896, lasting only 38 minutes.",
+            "source": "Historical Archives",
+            "category": "History"
+        },
+        {
+            "text": "Ancient Egyptians used to use honey as an offering to their gods.",
+            "source": "Archaeological Studies",
+            "category": "History"
+        },
+        {
+            "text": "The first recorded use of 'OMG' was in a 1917 letter to Winston Churchill.",
+            "source": "British Library Archives",
+            "category": "History"
+        }
+    ],
+    "Nature": [
+        {
+            "text": "Octopuses have three hearts, nine brains, and blue blood.",
+            "source": "Marine Biology Journal",
+            "category": "Nature"
+        },
+        {
+            "text": "Bananas are berries, but strawberries aren't.",
+            "source": "Botanical Classification",
+            "category": "Nature"
+        },
+        {
+            "text": "A group of flamingos is called a 'flamboyance'.",
+            "source": "Ornithological Society",
+            "category": "Nature"
+        }
+    ],
+    "Space": [
+        {
+            "text": "There are more stars in the universe than grains of sand on all the beaches on Earth.",
+            "source": "Astronomical Society",
+            "category": "Space"
+        },
+        {
+            "text": "A day on Venus is longer than a year on Venus.",
+            "source": "Planetary Science Institute",
+            "category": "Space"
+        },
+        {
+            "text": "The Great Red Spot on Jupiter is a storm that has been raging for at least 400 years.",
+            "source": "NASA Jupiter Mission",
+            "category": "Space"
+        }
+    ],
+    "Technology": [
+        {
+            "text": "The first computer bug was an actual real-life bug - a moth was found in the Harvard Mark II computer in 1947.",
+            "source": "Computer History Museum",
+            "category": "Technology"
+        },
+        {
+            "text": "The average smartphone user touches their phone 2,617 times a day.",
+            "source": "Digital Behavior Research",
+            "category": "Technology"
+        },
+        {
+            "text": "The first message sent over the internet was 'LO'. It was supposed to be 'LOGIN' but the system crashed.",
+            "source": "Internet History Archives",
+            "category": "Technology"
+        }
+    ]
+}
+
 class FactGenerator:
     """Generates interesting facts using OpenAI API"""
     
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize the fact generator with OpenAI API key"""
-        self.api_key = api_key
+    def __init__(self, api_key: Optional[str] = None, cache_ttl: float = FACT_CACHE_TTL):
+        """
+        Initialize the fact generator with OpenAI API key
+        
+        Args:
+            api_key: OpenAI API key
+            cache_ttl: Seconds generate_facts() results are reused for the same parameters
+        """
+        self.api_key = None
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[tuple, tuple] = {}
+        self._cache_lock = threading.Lock()
         if api_key:
-            openai.api_key = api_key
+            self.set_api_key(api_key)
             
     def set_api_key(self, api_key: str):
         """Set or update the OpenAI API key"""
+        import openai
         self.api_key = api_key
         openai.api_key = api_key
+        self.clear_cache()
+    
+    def clear_cache(self):
+        """Forget memoized generate_facts() results"""
+        with self._cache_lock:
+            self._cache.clear()
         
     def generate_facts(self, 
                       categories: List[str], 
@@ -39,7 +149,6 @@ class FactGenerator:
         Returns:
             List of dictionaries containing generated facts and metadata
         """
-        import openai                 
         if not self.api_key:
             raise ValueError("OpenAI API key is required. Use set_api_key() to set it.")
             
@@ -48,6 +157,13 @@ class FactGenerator:
             raise ValueError("At least one category must be specified")
         if num_facts < 1:
             raise ValueError("Number of facts must be at least 1")
+        
+        # Identical requests within cache_ttl reuse the earlier facts
+        cache_key = (tuple(sorted(categories)), num_facts, fact_length, reliability)
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return [dict(fact) for fact in cached[1]]
             
         # Map fact length to word count
         length_map = {
@@ -88,8 +204,14 @@ class FactGenerator:
                 
         # Shuffle facts to mix categories
         random.shuffle(all_facts)
+        all_facts = all_facts[:num_facts]
+        
+        # Placeholder facts from failed calls are not cached, so a retry calls the API again
+        if not any(fact.get("error") for fact in all_facts):
+            with self._cache_lock:
+                self._cache[cache_key] = (time.monotonic() + self.cache_ttl, all_facts)
         
-        return all_facts[:num_facts]
+        return [dict(fact) for fact in all_facts]
     
     def _get_system_message(self, reliability: int) -> str:
         """Generate system message based on reliability score"""
@@ -119,6 +241,8 @@ class FactGenerator:
                                system_message: str) -> List[Dict[str, Any]]:
         """Generate facts for a specific category"""
         try:
+            import openai
+            
             # Create prompt for the category
             user_message = (
                 f"Generate {num_facts} interesting, surprising 'Did You Know' facts about {category}. "
@@ -170,93 +294,7 @@ class FactGenerator:
         Get sample facts when API is not available
         This is a fallback method that doesn't require an API key
         """
-        sample_facts = {
-            "Science": [
-                {
-                    "text": "The human body contains enough carbon to fill about 9,000 pencils.",
-                    "source": "Scientific American",
-                    "category": "Science"
-                },
-                {
-                    "text": "A teaspoonful of neutron star would weigh about 6 billion tons.",
-                    "source": "NASA Astrophysics",
-                    "category": "Science"
-                },
-                {
-                    "text": "The average person walks the equivalent of three times around the world in a lifetime.",
-                    "source": "Health Research Institute",
-                    "category": "Science"
-                }
-            ],
-            "History": [
-                {
-                    "text": "The shortest war in history was between Britain and Zanzibar in 1896, lasting only 38 minutes.",
-                    "source": "Historical Archives",
-                    "category": "History"
-                },
-                {
-                    "text": "Ancient Egyptians used to use honey as an offering to their gods.",
-                    "source": "Archaeological Studies",
-                    "category": "History"
-                },
-                {
-                    "text": "The first recorded use of 'OMG' was in a 1917 letter to Winston Churchill.",
-                    "source": "British Library Archives",
-                    "category": "History"
-                }
-            ],
-            "Nature": [
-                {
-                    "text": "Octopuses have three hearts, nine brains, and blue blood.",
-                    "source": "Marine Biology Journal",
-                    "category": "Nature"
-                },
-                {
-                    "text": "Bananas are berries, but strawberries aren't.",
-                    "source": "Botanical Classification",
-                    "category": "Nature"
-                },
-                {
-                    "text": "A group of flamingos is called a 'flamboyance'.",
-                    "source": "Ornithological Society",
-                    "category": "Nature"
-                }
-            ],
-            "Space": [
-                {
-                    "text": "There are more stars in the universe than grains of sand on all the beaches on Earth.",
-                    "source": "Astronomical Society",
-                    "category": "Space"
-                },
-                {
-                    "text": "A day on Venus is longer than a year on Venus.",
-                    "source": "Planetary Science Institute",
-                    "category": "Space"
-                },
-                {
-                    "text": "The Great Red Spot on Jupiter is a storm that has been raging for at least 400 years.",
-                    "source": "NASA Jupiter Mission",
-                    "category": "Space"
-                }
-            ],
-            "Technology": [
-                {
-                    "text": "The first computer bug was an actual real-life bug - a moth was found in the Harvard Mark II computer in 1947.",
-                    "source": "Computer History Museum",
-                    "category": "Technology"
-                },
-                {
-                    "text": "The average smartphone user touches their phone 2,617 times a day.",
-                    "source": "Digital Behavior Research",
-                    "category": "Technology"
-                },
-                {
-                    "text": "The first message sent over the internet was 'LO'. It was supposed to be 'LOGIN' but the system crashed.",
-                    "source": "Internet History Archives",
-                    "category": "Technology"
-                }
-            ]
-        }
+        sample_facts = SAMPLE_FACTS
         
         # Collect facts from selected categories
         all_facts = []
@@ -274,4 +312,4 @@ class FactGenerator:
                         
         # Shuffle and return requested number of facts
         random.shuffle(all_facts)
-        return all_facts[:num_facts]
+        return [dict(fact) for fact in all_facts[:num_facts]]
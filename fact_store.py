@@ -0,0 +1,120 @@
+"""
+Fact Store Module for YouTube Automation
+Shared, persisted collection of generated facts that scripts are written from
+"""
+
+import os
+import json
+import uuid
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+
+class FactStore:
+    """
+    Facts generated on the Content Generation page
+
+    Facts are kept newest first and deduplicated by text, so generating the
+    same facts again doesn't grow the store. The store is persisted to
+    ``store_file`` and shared by every session, so the Video Creation page
+    reads what any session generated.
+    """
+
+    def __init__(self, store_file: Optional[str] = None, max_facts: int = 1000):
+        """
+        Initialize the FactStore
+
+        Args:
+            store_file: Optional JSON file the facts are persisted to
+            max_facts: Maximum facts kept; the oldest are dropped first
+        """
+        self.store_file = store_file
+        self.max_facts = max_facts
+
+        self._lock = threading.Lock()
+        self._facts: List[Dict[str, Any]] = []
+        self._load()
+
+    def _load(self):
+        """Load persisted facts"""
+        if not self.store_file or not os.path.exists(self.store_file):
+            return
+        try:
+            with open(self.store_file, 'r') as f:
+                self._facts = json.load(f)
+        except (OSError, ValueError):
+            self._facts = []
+
+    def _save(self):
+        """Persist all facts atomically; the caller holds the lock"""
+        if not self.store_file:
+            return
+        directory = os.path.dirname(self.store_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.store_file}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self._facts, f)
+        os.replace(tmp_path, self.store_file)
+
+    def add_facts(self, facts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Add generated facts
+
+        Facts whose text is already stored are moved to the front instead of
+        being added again. Placeholder facts from failed generations (those
+        with an "error" field) are skipped.
+
+        Args:
+            facts: Fact dictionaries with "text", "source" and "category"
+
+        Returns:
+            Copies of the stored facts, with "id" and "created_at" set
+        """
+        now = datetime.now().isoformat()
+        stored = []
+        with self._lock:
+            existing = {fact["text"]: fact for fact in self._facts}
+            for fact in facts:
+                if fact.get("error") or not fact.get("text"):
+                    continue
+                record = existing.get(fact["text"])
+                if record is None:
+                    record = dict(fact, id=uuid.uuid4().hex)
+                    existing[fact["text"]] = record
+                else:
+                    self._facts.remove(record)
+                record["created_at"] = now
+                self._facts.insert(0, record)
+                stored.append(dict(record))
+            del self._facts[self.max_facts:]
+            self._save()
+        return stored
+
+    def list_facts(self, categories: Optional[List[str]] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        List stored facts, newest first
+
+        Args:
+            categories: Only return facts in these categories
+            limit: Maximum number of facts returned
+
+        Returns:
+            Copies of the matching facts
+        """
+        with self._lock:
+            facts = [dict(fact) for fact in self._facts
+                     if categories is None or fact.get("category") in categories]
+        return facts if limit is None else facts[:limit]
+
+    def count(self) -> int:
+        """Number of stored facts"""
+        with self._lock:
+            return len(self._facts)
+
+    def clear(self):
+        """Remove all stored facts"""
+        with self._lock:
+            self._facts = []
+            self._save()
@@ -0,0 +1,420 @@
+"""
+Fake YouTube Server Module for YouTube Automation
+Local stand-in for the YouTube Data API endpoints the clients use, for offline load testing
+"""
+
+import json
+import time
+import random
+import string
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional, Iterable
+from urllib.parse import urlparse, parse_qs
+
+from quota_ledger import QUOTA_COSTS
+
+API_PREFIX = "/youtube/v3/"
+UPLOAD_PREFIX = "/upload/youtube/v3/"
+
+# Same limit the real videos().list enforces
+VIDEOS_LIST_MAX_IDS = 50
+
+
+def _random_id(prefix: str = "", length: int = 11) -> str:
+    """Generate a YouTube-style id"""
+    alphabet = string.ascii_letters + string.digits + "-_"
+    return prefix + "".join(random.choice(alphabet) for _ in range(length))
+
+
+def _error_body(status: int, reason: str, message: str) -> Dict[str, Any]:
+    """Build an error payload in the Google API format"""
+    return {
+        "error": {
+            "code": status,
+            "message": message,
+            "errors": [{"domain": "youtube", "reason": reason, "message": message}]
+        }
+    }
+
+
+class FakeYouTubeServer:
+    """
+    In-process HTTP server implementing a subset of the YouTube Data API
+
+    Supports channels.list, videos.list, videos.update and videos.insert via
+    the resumable upload protocol (session start, chunked PUTs with
+    Content-Range, 308 Resume Incomplete and ``bytes */total`` status
+    queries). Every request can be delayed by ``latency`` (plus up to
+    ``jitter``) seconds, fails with one of ``error_codes`` at ``error_rate``,
+    and is charged against ``daily_quota``, returning 403 quotaExceeded once
+    it runs out. Point a client at ``server.url`` through its ``root_url``
+    option.
+    """
+
+    def __init__(self,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 latency: float = 0.0,
+                 jitter: float = 0.0,
+                 error_rate: float = 0.0,
+                 error_codes: Iterable[int] = (500, 503),
+                 daily_quota: Optional[int] = None,
+                 seed: Optional[int] = None):
+        """
+        Initialize the FakeYouTubeServer
+
+        Args:
+            host: Interface to listen on
+            port: Port to listen on; 0 picks a free one
+            latency: Seconds added to every response
+            jitter: Maximum extra random seconds added to every response
+            error_rate: Probability (0-1) that a request fails with an injected error
+            error_codes: HTTP status codes used for injected errors
+            daily_quota: Quota units available before requests get 403 quotaExceeded
+            seed: Seed for the error-injection random generator
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_codes = list(error_codes)
+        self.daily_quota = daily_quota
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._forced_errors: List[int] = []
+        self._videos: Dict[str, Dict[str, Any]] = {}
+        self._sessions: Dict[str, Dict[str, Any]] = {}
+        self._channel_id = _random_id("UC", 22)
+        self._stats = {
+            "requests": 0,
+            "injected_errors": 0,
+            "quota_errors": 0,
+            "quota_used": 0,
+            "upload_chunks": 0,
+            "upload_bytes": 0,
+            "uploads_completed": 0,
+            "calls": {}
+        }
+
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Root URL to pass to clients as root_url"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "FakeYouTubeServer":
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-youtube", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeYouTubeServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def add_videos(self, count: int) -> List[str]:
+        """
+        Seed the channel with videos that have random statistics
+
+        Args:
+            count: Number of videos to create
+
+        Returns:
+            Ids of the new videos
+        """
+        ids = []
+        with self._lock:
+            for i in range(count):
+                video = self._new_video({"snippet": {"title": f"Seeded video {i + 1}"}})
+                video["statistics"] = {
+                    "viewCount": str(random.randint(0, 100000)),
+                    "likeCount": str(random.randint(0, 5000)),
+                    "favoriteCount": "0",
+                    "commentCount": str(random.randint(0, 500))
+                }
+                ids.append(video["id"])
+        return ids
+
+    def get_video(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """Get a stored video resource"""
+        with self._lock:
+            video = self._videos.get(video_id)
+            return json.loads(json.dumps(video)) if video else None
+
+    def fail_next(self, count: int = 1, status: int = 503):
+        """Fail the next count requests with status, regardless of error_rate"""
+        with self._lock:
+            self._forced_errors.extend([status] * count)
+
+    def reset_quota(self):
+        """Start a new quota day"""
+        with self._lock:
+            self._stats["quota_used"] = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get request, error, quota and upload counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["calls"] = dict(self._stats["calls"])
+            stats["videos"] = len(self._videos)
+            return stats
+
+    def _new_video(self, resource: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a new video resource; the caller holds the lock"""
+        snippet = dict(resource.get("snippet", {}))
+        snippet.setdefault("title", "Untitled")
+        snippet.setdefault("description", "")
+        snippet.setdefault("categoryId", "22")
+        snippet["channelId"] = self._channel_id
+        snippet["publishedAt"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        status = dict(resource.get("status", {}))
+        status.setdefault("privacyStatus", "private")
+        status["uploadStatus"] = "uploaded"
+        video = {
+            "kind": "youtube#video",
+            "id": _random_id(),
+            "snippet": snippet,
+            "status": status,
+            "statistics": {"viewCount": "0", "likeCount": "0", "favoriteCount": "0", "commentCount": "0"}
+        }
+        self._videos[video["id"]] = video
+        return video
+
+    def _admit(self, method: Optional[str]) -> Optional[tuple]:
+        """
+        Count a request and decide whether to fail it
+
+        Returns:
+            (status, payload) of an injected or quota error, or None to proceed
+        """
+        with self._lock:
+            self._stats["requests"] += 1
+            if method:
+                self._stats["calls"][method] = self._stats["calls"].get(method, 0) + 1
+            status = None
+            if self._forced_errors:
+                status = self._forced_errors.pop(0)
+            elif self.error_codes and self._random.random() < self.error_rate:
+                status = self._random.choice(self.error_codes)
+            if status is not None:
+                self._stats["injected_errors"] += 1
+                return status, _error_body(status, "backendError", "Injected error")
+
+            cost = QUOTA_COSTS.get(method, 0) if method else 0
+            if self.daily_quota is not None and self._stats["quota_used"] + cost > self.daily_quota:
+                self._stats["quota_errors"] += 1
+                return 403, _error_body(403, "quotaExceeded",
+                                        "The request cannot be completed because you have exceeded your quota.")
+            self._stats["quota_used"] += cost
+        return None
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, like googleapis.com, so clients reuse connections
+            protocol_version = "HTTP/1.1"
+            # Headers and body are separate writes; don't let Nagle delay the body
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def _read_body(self) -> bytes:
+                length = int(self.headers.get("Content-Length") or 0)
+                return self.rfile.read(length) if length else b""
+
+            def _send(self, status: int, payload: Optional[Dict[str, Any]] = None,
+                      headers: Optional[Dict[str, str]] = None):
+                body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+                self.send_response(status)
+                if payload is not None:
+                    self.send_header("Content-Type", "application/json; charset=UTF-8")
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _handle(self, http_method: str):
+                body = self._read_body()
+                parsed = urlparse(self.path)
+                query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+                delay = server.latency + (server._random.uniform(0, server.jitter) if server.jitter else 0)
+                if delay:
+                    time.sleep(delay)
+
+                route = (http_method, parsed.path)
+                if route == ("GET", API_PREFIX + "channels"):
+                    method, handler = "channels.list", server._channels_list
+                elif route == ("GET", API_PREFIX + "videos"):
+                    method, handler = "videos.list", server._videos_list
+                elif route == ("PUT", API_PREFIX + "videos"):
+                    method, handler = "videos.update", server._videos_update
+                elif route == ("POST", UPLOAD_PREFIX + "videos"):
+                    method, handler = "videos.insert", server._upload_start
+                elif route == ("PUT", UPLOAD_PREFIX + "videos") and "upload_id" in query:
+                    method, handler = None, server._upload_chunk
+                else:
+                    return self._send(404, _error_body(404, "notFound", f"No fake endpoint for {http_method} {parsed.path}"))
+
+                failure = server._admit(method)
+                if failure is not None:
+                    return self._send(*failure)
+                try:
+                    status, payload, headers = handler(query, self.headers, body)
+                except ValueError as e:
+                    status, payload, headers = 400, _error_body(400, "badRequest", str(e)), None
+                self._send(status, payload, headers)
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_POST(self):
+                self._handle("POST")
+
+            def do_PUT(self):
+                self._handle("PUT")
+
+        return Handler
+
+    def _select_parts(self, resource: Dict[str, Any], part: str) -> Dict[str, Any]:
+        """Return only the requested parts of a resource"""
+        parts = {p.strip() for p in part.split(",") if p.strip()}
+        selected = {"kind": resource["kind"], "id": resource["id"]}
+        for name in parts:
+            if name in resource:
+                selected[name] = json.loads(json.dumps(resource[name]))
+        return selected
+
+    def _channels_list(self, query, headers, body):
+        if query.get("mine") != "true":
+            raise ValueError("Only mine=true is supported")
+        with self._lock:
+            views = sum(int(v["statistics"]["viewCount"]) for v in self._videos.values())
+            channel = {
+                "kind": "youtube#channel",
+                "id": self._channel_id,
+                "snippet": {"title": "Fake Channel", "description": "Local test channel"},
+                "contentDetails": {"relatedPlaylists": {"uploads": "UU" + self._channel_id[2:]}},
+                "statistics": {
+                    "viewCount": str(views),
+                    "subscriberCount": "0",
+                    "hiddenSubscriberCount": False,
+                    "videoCount": str(len(self._videos))
+                }
+            }
+        return 200, {"kind": "youtube#channelListResponse",
+                     "items": [self._select_parts(channel, query.get("part", ""))]}, None
+
+    def _videos_list(self, query, headers, body):
+        ids = [video_id for video_id in query.get("id", "").split(",") if video_id]
+        if len(ids) > VIDEOS_LIST_MAX_IDS:
+            raise ValueError(f"At most {VIDEOS_LIST_MAX_IDS} ids may be requested at once")
+        with self._lock:
+            items = [self._select_parts(self._videos[video_id], query.get("part", ""))
+                     for video_id in ids if video_id in self._videos]
+        return 200, {"kind": "youtube#videoListResponse", "items": items,
+                     "pageInfo": {"totalResults": len(items), "resultsPerPage": len(items)}}, None
+
+    def _videos_update(self, query, headers, body):
+        resource = json.loads(body or b"{}")
+        parts = [p.strip() for p in query.get("part", "").split(",") if p.strip()]
+        with self._lock:
+            video = self._videos.get(resource.get("id"))
+            if video is None:
+                return 404, _error_body(404, "videoNotFound", "Video not found"), None
+            for part in parts:
+                if part in ("snippet", "status") and part in resource:
+                    # Read-only fields survive an update, like on YouTube
+                    preserved = {k: video[part][k] for k in ("channelId", "publishedAt", "uploadStatus")
+                                 if k in video[part]}
+                    video[part] = dict(resource[part], **preserved)
+            return 200, self._select_parts(video, ",".join(parts)), None
+
+    def _upload_start(self, query, headers, body):
+        if query.get("uploadType") != "resumable":
+            raise ValueError("Only uploadType=resumable is supported")
+        total = headers.get("X-Upload-Content-Length")
+        upload_id = _random_id("", 24)
+        with self._lock:
+            self._sessions[upload_id] = {
+                "metadata": json.loads(body or b"{}"),
+                "total": int(total) if total else None,
+                "received": 0
+            }
+        location = f"{self.url}upload/youtube/v3/videos?uploadType=resumable&upload_id={upload_id}"
+        return 200, None, {"Location": location}
+
+    def _upload_chunk(self, query, headers, body):
+        with self._lock:
+            session = self._sessions.get(query["upload_id"])
+            if session is None:
+                return 404, _error_body(404, "notFound", "Upload session not found"), None
+            self._stats["upload_chunks"] += 1
+
+            content_range = headers.get("Content-Range", "")
+            if not content_range.startswith("bytes "):
+                raise ValueError("Content-Range header is required")
+            span, _, total = content_range[len("bytes "):].partition("/")
+            if total != "*":
+                session["total"] = int(total)
+            if span != "*":
+                start, _, end = span.partition("-")
+                if int(start) == session["received"]:
+                    session["received"] = int(end) + 1
+                    self._stats["upload_bytes"] += len(body)
+                # A chunk that doesn't start at the committed offset is ignored;
+                # the 308 below tells the client where to resume
+
+            if session["total"] is not None and session["received"] >= session["total"]:
+                video = self._new_video(session["metadata"])
+                del self._sessions[query["upload_id"]]
+                self._stats["uploads_completed"] += 1
+                return 200, self._select_parts(video, "snippet,status"), None
+
+            range_header = {"Range": f"bytes=0-{session['received'] - 1}"} if session["received"] else {}
+            return 308, None, range_header
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local fake YouTube Data API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Maximum random extra seconds per response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of an injected 5xx error")
+    parser.add_argument("--daily-quota", type=int, default=None, help="Quota units before 403 quotaExceeded")
+    parser.add_argument("--videos", type=int, default=0, help="Number of seeded videos")
+    args = parser.parse_args()
+
+    server = FakeYouTubeServer(args.host, args.port, latency=args.latency, jitter=args.jitter,
+                               error_rate=args.error_rate, daily_quota=args.daily_quota)
+    server.add_videos(args.videos)
+    print(f"Fake YouTube Data API listening on {server.url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+        print(json.dumps(server.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
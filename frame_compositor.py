@@ -0,0 +1,299 @@
+"""
+Frame Compositor Module for YouTube Automation
+Composites frames in reusable NumPy buffers and streams them into FFmpeg as raw video
+"""
+
+import os
+import queue
+import shutil
+import threading
+import subprocess
+from collections import deque
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from text_overlay import OverlayCache, composite
+
+# Bytes of FFmpeg error output kept for error messages
+STDERR_TAIL_BYTES = 64 * 1024
+
+
+class FramePool:
+    """
+    Fixed set of preallocated frame buffers
+
+    ``acquire()`` blocks while every buffer is in flight, which is what
+    throttles the compositor to the encoder's pace. Memory use is
+    ``size * width * height * 3`` bytes no matter how long the video is.
+    """
+
+    def __init__(self, size: int, frame_size: Tuple[int, int]):
+        """
+        Initialize the FramePool
+
+        Args:
+            size: Number of buffers
+            frame_size: (width, height) of each frame
+        """
+        width, height = frame_size
+        self._free = queue.Queue()
+        for _ in range(size):
+            self._free.put(np.empty((height, width, 3), dtype=np.uint8))
+
+    def acquire(self, timeout: Optional[float] = None) -> np.ndarray:
+        """Take a free buffer, waiting until one is returned"""
+        return self._free.get(timeout=timeout)
+
+    def release(self, buffer: np.ndarray):
+        """Return a buffer to the pool"""
+        self._free.put(buffer)
+
+
+class FFmpegFrameWriter:
+    """
+    Streams raw RGB frames into an FFmpeg process over stdin
+
+    Frames are handed over as pool buffers and written with a memoryview,
+    so no copy is made between the compositor and the pipe. At most
+    ``max_in_flight`` frames wait for the writer thread; ``write()`` blocks
+    beyond that.
+    """
+
+    def __init__(self,
+                 output_path: str,
+                 frame_size: Tuple[int, int],
+                 fps: int = 30,
+                 max_in_flight: int = 8,
+                 audio_paths: Optional[List[str]] = None,
+                 ffmpeg_binary: str = "ffmpeg",
+                 output_args: Optional[List[str]] = None):
+        """
+        Initialize the FFmpegFrameWriter and start FFmpeg
+
+        Args:
+            output_path: Path of the encoded video
+            frame_size: (width, height) of the frames
+            fps: Frames per second
+            max_in_flight: Maximum frames queued for the pipe
+            audio_paths: Optional audio tracks to mux into the output
+            ffmpeg_binary: FFmpeg executable
+            output_args: Encoder arguments (defaults to H.264 yuv420p)
+        """
+        if shutil.which(ffmpeg_binary) is None:
+            raise RuntimeError(f"FFmpeg executable not found: {ffmpeg_binary}")
+
+        width, height = frame_size
+        self.output_path = output_path
+        self.frame_size = frame_size
+        self.frames_written = 0
+        self.pool = FramePool(max_in_flight + 1, frame_size)
+
+        command = [
+            ffmpeg_binary, "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "rgb24",
+            "-s", f"{width}x{height}", "-r", str(fps),
+            "-i", "-"
+        ]
+        for audio_path in audio_paths or []:
+            command += ["-i", audio_path]
+        command += output_args or ["-c:v", "libx264", "-preset", "veryfast", "-pix_fmt", "yuv420p"]
+        if audio_paths:
+            command += ["-c:a", "aac", "-shortest"]
+        command.append(output_path)
+
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        self._queue: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(maxsize=max_in_flight)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._write_loop, name="ffmpeg-writer", daemon=True)
+        self._thread.start()
+        # FFmpeg blocks once the stderr pipe fills, so it is read continuously; only the tail is kept
+        self._stderr_chunks: "deque[bytes]" = deque()
+        self._stderr_size = 0
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, name="ffmpeg-stderr", daemon=True)
+        self._stderr_thread.start()
+
+    def _write_loop(self):
+        """Write queued frames to FFmpeg and recycle their buffers"""
+        stdin = self._process.stdin
+        while True:
+            buffer = self._queue.get()
+            if buffer is None:
+                break
+            try:
+                if self._error is None:
+                    stdin.write(memoryview(buffer).cast('B'))
+                    self.frames_written += 1
+            except (BrokenPipeError, OSError) as e:
+                self._error = e
+            finally:
+                self.pool.release(buffer)
+
+    def _drain_stderr(self):
+        """Read FFmpeg's error output until it exits, keeping the last STDERR_TAIL_BYTES"""
+        stderr = self._process.stderr
+        try:
+            for chunk in iter(lambda: stderr.read1(4096), b""):
+                self._stderr_chunks.append(chunk)
+                self._stderr_size += len(chunk)
+                while self._stderr_size - len(self._stderr_chunks[0]) >= STDERR_TAIL_BYTES:
+                    self._stderr_size -= len(self._stderr_chunks.popleft())
+        except (OSError, ValueError):
+            pass
+
+    def acquire(self) -> np.ndarray:
+        """Get a buffer to draw the next frame into"""
+        self._raise_if_failed()
+        return self.pool.acquire()
+
+    def write(self, buffer: np.ndarray):
+        """Queue a filled buffer for encoding; blocks while the pipe is full"""
+        self._raise_if_failed()
+        self._queue.put(buffer)
+
+    def _raise_if_failed(self):
+        """Surface an FFmpeg failure to the producer"""
+        if self._error is not None:
+            raise RuntimeError(f"FFmpeg pipe failed: {self._error}: {self._stderr()}")
+
+    def _stderr(self) -> str:
+        """FFmpeg's error output so far, waiting briefly for the rest once it has exited"""
+        if self._process.poll() is not None:
+            self._stderr_thread.join(timeout=5)
+        return b"".join(self._stderr_chunks).decode('utf-8', 'replace').strip()
+
+    def close(self) -> str:
+        """
+        Flush remaining frames and wait for FFmpeg to finish
+
+        Returns:
+            Path of the encoded video
+        """
+        self._queue.put(None)
+        self._thread.join()
+        try:
+            self._process.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+        return_code = self._process.wait()
+        if return_code != 0 or self._error is not None:
+            raise RuntimeError(f"FFmpeg exited with code {return_code}: {self._stderr()}")
+        return self.output_path
+
+    def abort(self):
+        """Stop FFmpeg without finishing the output"""
+        self._process.kill()
+        self._queue.put(None)
+        self._thread.join()
+        self._process.wait()
+
+
+class FrameCompositor:
+    """
+    Composites pans over background images with animated text overlays
+
+    Each script section becomes ``duration * fps`` frames: the section's
+    background slowly pans across the frame, and its text overlay
+    (rasterized once through OverlayCache) slides in during the first
+    ``text_in_seconds``. The background is resized once per section to
+    ``zoom`` times the frame, so every frame is a plain crop copied into
+    the writer's pooled buffer, with no resampling per frame.
+    """
+
+    def __init__(self,
+                 frame_size: Tuple[int, int] = (1920, 1080),
+                 fps: int = 30,
+                 overlay_cache: Optional[OverlayCache] = None,
+                 zoom: float = 1.12,
+                 text_in_seconds: float = 0.6,
+                 max_in_flight: int = 8):
+        """
+        Initialize the FrameCompositor
+
+        Args:
+            frame_size: (width, height) of the output video
+            fps: Frames per second
+            overlay_cache: Shared overlay tile cache
+            zoom: Scale of the background relative to the frame, which sets how far it pans
+            text_in_seconds: Duration of the text slide-in
+            max_in_flight: Maximum frames buffered ahead of FFmpeg
+        """
+        self.frame_size = frame_size
+        self.fps = fps
+        self.overlay_cache = overlay_cache or OverlayCache()
+        self.zoom = zoom
+        self.text_in_seconds = text_in_seconds
+        self.max_in_flight = max_in_flight
+
+    def _load_background(self, image_path: Optional[str]) -> np.ndarray:
+        """Load a background as an RGB array scaled to cover the frame ``zoom`` times over"""
+        width, height = self.frame_size
+        if not image_path or not os.path.exists(image_path):
+            return np.full((height, width, 3), (24, 24, 32), dtype=np.uint8)
+        image = Image.open(image_path).convert("RGB")
+        scale = max(width / image.width, height / image.height) * self.zoom
+        size = (max(width, round(image.width * scale)), max(height, round(image.height * scale)))
+        return np.asarray(image.resize(size, Image.BILINEAR))
+
+    def _pan_offset(self, background: np.ndarray, progress: float, direction: int) -> Tuple[int, int]:
+        """Top-left corner of the frame-sized crop for a point in the pan"""
+        width, height = self.frame_size
+        pan = progress if direction > 0 else 1.0 - progress
+        left = round((background.shape[1] - width) * pan)
+        top = (background.shape[0] - height) // 2
+        return left, top
+
+    def render(self,
+               sections: List[Dict[str, Any]],
+               output_path: str,
+               background_images: Optional[List[str]] = None,
+               visual_style: str = "standard",
+               audio_paths: Optional[List[str]] = None,
+               ffmpeg_binary: str = "ffmpeg") -> str:
+        """
+        Render script sections to a video file
+
+        Args:
+            sections: Script sections with 'text' and 'duration'
+            output_path: Path of the encoded video
+            background_images: Images cycled across sections
+            visual_style: Overlay style preset
+            audio_paths: Optional audio tracks to mux in
+            ffmpeg_binary: FFmpeg executable
+
+        Returns:
+            Path of the encoded video
+        """
+        writer = FFmpegFrameWriter(output_path, self.frame_size, self.fps, self.max_in_flight,
+                                   audio_paths=audio_paths, ffmpeg_binary=ffmpeg_binary)
+        try:
+            for i, section in enumerate(sections):
+                image = background_images[i % len(background_images)] if background_images else None
+                self._render_section(writer, section, image, visual_style, direction=1 if i % 2 == 0 else -1)
+        except BaseException:
+            writer.abort()
+            raise
+        return writer.close()
+
+    def _render_section(self, writer: FFmpegFrameWriter, section: Dict[str, Any],
+                        image_path: Optional[str], visual_style: str, direction: int):
+        """Stream the frames of one section"""
+        background = self._load_background(image_path)
+        tile = self.overlay_cache.get(section.get('text', ''), visual_style, self.frame_size)
+        frame_count = max(1, int(section.get('duration', 10) * self.fps))
+        text_in_frames = max(1, int(self.text_in_seconds * self.fps))
+        slide_distance = self.frame_size[1] // 20
+
+        width, height = self.frame_size
+        for n in range(frame_count):
+            progress = n / max(1, frame_count - 1)
+            buffer = writer.acquire()
+            left, top = self._pan_offset(background, progress, direction)
+            np.copyto(buffer, background[top:top + height, left:left + width])
+
+            x, y = tile.position
+            if n < text_in_frames:
+                y += int(slide_distance * (1.0 - n / text_in_frames))
+            composite(buffer, tile, (x, y))
+            writer.write(buffer)
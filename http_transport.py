@@ -0,0 +1,191 @@
+"""
+HTTP Transport Module for YouTube Automation
+Shared keep-alive HTTP transports for the YouTube clients and the backend
+"""
+
+import threading
+from typing import Any, Tuple
+
+# Seconds before an API request (or a single upload chunk) times out
+DEFAULT_TIMEOUT = 60
+
+# (connect, read) timeouts for requests made through the shared session
+SESSION_TIMEOUT: Tuple[float, float] = (5, 60)
+
+# Connection pool size per host for the shared session
+SESSION_POOL_SIZE = 16
+
+# Idle httplib2 transports kept per timeout for later requests
+HTTP_POOL_SIZE = 16
+
+_pools = {}
+_pools_lock = threading.Lock()
+_session = None
+_session_lock = threading.Lock()
+
+
+def _new_http(timeout: float):
+    """Create an httplib2 transport configured like googleapiclient's build_http"""
+    import httplib2
+
+    http = httplib2.Http(timeout=timeout)
+    # Resumable uploads answer 308 Resume Incomplete; it is not a redirect
+    if 308 in http.redirect_codes:
+        http.redirect_codes = http.redirect_codes - {308}
+    return http
+
+
+class HttpPool:
+    """
+    Pool of httplib2 transports with the same timeout
+
+    httplib2.Http is not thread-safe, so a transport is checked out for one
+    request at a time and returned afterwards. Returned transports keep their
+    open connections (and TLS sessions) for the next request from any thread,
+    and at most ``max_idle`` of them are kept.
+    """
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, max_idle: int = HTTP_POOL_SIZE):
+        """
+        Initialize the HttpPool
+
+        Args:
+            timeout: Socket timeout in seconds
+            max_idle: Idle transports kept for reuse
+        """
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._idle = []
+
+    def checkout(self):
+        """Take an idle transport, or create one"""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return _new_http(self.timeout)
+
+    def checkin(self, http):
+        """Return a transport for reuse, closing it if the pool is full"""
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(http)
+                return
+        http.close()
+
+    def close(self):
+        """Close every idle transport's connections"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for http in idle:
+            http.close()
+
+
+def http_pool(timeout: float = DEFAULT_TIMEOUT) -> HttpPool:
+    """
+    Get the process-wide transport pool for a timeout
+
+    Args:
+        timeout: Socket timeout in seconds
+
+    Returns:
+        HttpPool shared by every client using this timeout
+    """
+    with _pools_lock:
+        pool = _pools.get(timeout)
+        if pool is None:
+            pool = _pools[timeout] = HttpPool(timeout)
+        return pool
+
+
+class SharedHttp:
+    """
+    httplib2-compatible transport that is safe to share between threads
+
+    Each request checks a transport out of ``http_pool()`` and returns it
+    when the response has been read, so one googleapiclient service object
+    can be used from any number of threads and all clients share warm
+    connections without one transport per thread.
+    """
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT):
+        """
+        Initialize the SharedHttp
+
+        Args:
+            timeout: Socket timeout in seconds
+        """
+        self._pool = http_pool(timeout)
+
+    def request(self, *args, **kwargs):
+        http = self._pool.checkout()
+        try:
+            return http.request(*args, **kwargs)
+        except BaseException:
+            # The connection may be half-used; don't hand it to the next request
+            http.close()
+            raise
+        finally:
+            self._pool.checkin(http)
+
+    def close(self):
+        """Close the pooled connections"""
+        self._pool.close()
+
+    def __getattr__(self, name: str) -> Any:
+        # timeout, redirect_codes, connections, follow_redirects...
+        http = self._pool.checkout()
+        try:
+            return getattr(http, name)
+        finally:
+            self._pool.checkin(http)
+
+
+def authorized_http(credentials=None, timeout: float = DEFAULT_TIMEOUT):
+    """
+    Get a shared transport for googleapiclient
+
+    Args:
+        credentials: google-auth credentials to sign requests with, or None
+        timeout: Socket timeout in seconds
+
+    Returns:
+        AuthorizedHttp over a SharedHttp, or a bare SharedHttp without credentials
+    """
+    http = SharedHttp(timeout)
+    if credentials is None:
+        return http
+    import google_auth_httplib2
+    return google_auth_httplib2.AuthorizedHttp(credentials, http=http)
+
+
+def get_session():
+    """
+    Get the process-wide requests session
+
+    The session pools keep-alive connections (``SESSION_POOL_SIZE`` per host)
+    and retries idempotent requests on connection errors. Pass
+    ``timeout=SESSION_TIMEOUT`` (or a tighter value) on every call.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=SESSION_POOL_SIZE,
+                    pool_maxsize=SESSION_POOL_SIZE,
+                    max_retries=Retry(total=3, connect=3, read=0, backoff_factor=0.5,
+                                      allowed_methods=frozenset(["GET", "HEAD", "PUT", "DELETE", "OPTIONS"]))
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
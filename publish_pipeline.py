@@ -0,0 +1,329 @@
+"""
+Publish Pipeline Module for YouTube Automation
+Background queue that uploads videos to YouTube and records the resulting video ids
+"""
+
+import os
+import json
+import time
+import uuid
+import queue
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable
+
+# Job states
+STATUS_QUEUED = "queued"
+STATUS_UPLOADING = "uploading"
+STATUS_PUBLISHED = "published"
+STATUS_FAILED = "failed"
+
+
+def _process_alive(pid: int) -> bool:
+    """Whether a process with this id is running"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class PublishPipeline:
+    """
+    Runs YouTube uploads on worker threads behind a job queue
+
+    ``submit()`` only records a job and queues it, so callers return at once
+    whatever the file size. Workers upload with the client's resumable
+    upload (which resumes an interrupted session) and store the YouTube
+    video id on the job. Every job has an idempotency key: submitting the
+    same key again returns the existing job instead of publishing twice,
+    and only re-queues it if it failed. Jobs are persisted to ``jobs_file``
+    so keys and results survive restarts, and unfinished jobs are queued
+    again on startup; call ``start()`` at startup to resume them.
+
+    Before uploading, a worker claims the job with a marker file next to
+    ``jobs_file`` that names its process. Another process that loaded the
+    same jobs skips a job claimed by a live process, so a job is never
+    uploaded by two processes at once.
+    """
+
+    def __init__(self,
+                 client_factory: Callable[[], Any],
+                 workers: int = 2,
+                 jobs_file: Optional[str] = None,
+                 on_published: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Initialize the PublishPipeline
+
+        Args:
+            client_factory: Callable returning a YouTube client with upload_video
+            workers: Number of upload worker threads
+            jobs_file: Optional JSON file the jobs are persisted to
+            on_published: Optional callback receiving each job once it is published
+        """
+        self.client_factory = client_factory
+        self.workers = workers
+        self.jobs_file = jobs_file
+        self.on_published = on_published
+
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._keys: Dict[str, str] = {}
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """Load persisted jobs and queue the unfinished ones"""
+        if not self.jobs_file or not os.path.exists(self.jobs_file):
+            return
+        try:
+            with open(self.jobs_file, 'r') as f:
+                jobs = json.load(f)
+        except (OSError, ValueError):
+            return
+        for job in jobs:
+            self._jobs[job["id"]] = job
+            self._keys[job["idempotency_key"]] = job["id"]
+            if job["status"] in (STATUS_QUEUED, STATUS_UPLOADING):
+                job["status"] = STATUS_QUEUED
+                self._queue.put(job["id"])
+
+    def _save(self):
+        """Persist all jobs atomically; the caller holds the lock"""
+        if not self.jobs_file:
+            return
+        directory = os.path.dirname(self.jobs_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.jobs_file}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(list(self._jobs.values()), f)
+        os.replace(tmp_path, self.jobs_file)
+
+    def start(self):
+        """
+        Start the worker threads
+
+        Called automatically by submit(); call it directly to resume jobs
+        loaded from jobs_file without submitting new ones. Start the workers
+        after any server fork, as threads don't survive it.
+        """
+        with self._lock:
+            self._start_workers()
+
+    def _start_workers(self):
+        """Start the worker threads if needed; the caller holds the lock"""
+        # Threads copied by a fork are not running in the child
+        if any(thread.is_alive() for thread in self._threads):
+            return
+        self._threads = []
+        for i in range(max(1, self.workers)):
+            thread = threading.Thread(target=self._work_loop, name=f"publish-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self,
+               idempotency_key: str,
+               file_path: Optional[str],
+               title: str,
+               description: str = "",
+               tags: Optional[List[str]] = None,
+               privacy_status: str = "private",
+               metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Queue a video for publishing
+
+        Args:
+            idempotency_key: Key identifying this publish request across retries
+            file_path: Path of the video file
+            title: Video title
+            description: Video description
+            tags: Video tags
+            privacy_status: "private", "unlisted" or "public"
+            metadata: Extra fields stored on the job (e.g. the caller's video id)
+
+        Returns:
+            Copy of the new or existing job
+        """
+        with self._lock:
+            self._start_workers()
+            job_id = self._keys.get(idempotency_key)
+            if job_id is not None:
+                job = self._jobs[job_id]
+                if job["status"] == STATUS_FAILED:
+                    # A retry of a failed publish resumes the same job
+                    job.update({"status": STATUS_QUEUED, "error": None, "updated_at": datetime.now().isoformat()})
+                    self._save()
+                    self._queue.put(job_id)
+                return dict(job)
+
+            now = datetime.now().isoformat()
+            job = {
+                "id": uuid.uuid4().hex,
+                "idempotency_key": idempotency_key,
+                "file_path": file_path,
+                "title": title,
+                "description": description,
+                "tags": tags or [],
+                "privacy_status": privacy_status,
+                "metadata": metadata or {},
+                "status": STATUS_QUEUED,
+                "progress": 0.0,
+                "youtube_video_id": None,
+                "youtube_url": None,
+                "error": None,
+                "attempts": 0,
+                "created_at": now,
+                "updated_at": now
+            }
+            self._jobs[job["id"]] = job
+            self._keys[idempotency_key] = job["id"]
+            self._save()
+        self._queue.put(job["id"])
+        return dict(job)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of a job"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def list_jobs(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List jobs, newest first, optionally filtered by status"""
+        with self._lock:
+            jobs = [dict(job) for job in self._jobs.values() if status is None or job["status"] == status]
+        return sorted(jobs, key=lambda job: job["created_at"], reverse=True)
+
+    def _update(self, job_id: str, save: bool = True, **fields):
+        with self._lock:
+            job = self._jobs[job_id]
+            job.update(fields)
+            job["updated_at"] = datetime.now().isoformat()
+            if save:
+                self._save()
+            return dict(job)
+
+    def _get_client(self):
+        """Create the YouTube client once, shared by all workers"""
+        # Separate lock so authenticating never blocks submit()
+        with self._client_lock:
+            if self._client is None:
+                self._client = self.client_factory()
+            return self._client
+
+    def _work_loop(self):
+        """Upload queued jobs"""
+        while True:
+            job_id = self._queue.get()
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None or job["status"] != STATUS_QUEUED:
+                    continue
+                if not self._claim(job_id):
+                    continue
+                job["status"] = STATUS_UPLOADING
+                job["attempts"] += 1
+                self._save()
+            try:
+                self._publish(dict(job))
+            finally:
+                self._release_claim(job_id)
+
+    def _claim_path(self, job_id: str) -> Optional[str]:
+        if not self.jobs_file:
+            return None
+        return os.path.join(f"{self.jobs_file}.claims", f"{job_id}.claim")
+
+    def _claim(self, job_id: str) -> bool:
+        """Mark a job as being uploaded by this process; False if a live process already has it"""
+        path = self._claim_path(job_id)
+        if path is None:
+            return True
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        for _ in range(2):
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    with open(path, 'r') as f:
+                        owner = int(f.read().strip() or 0)
+                except (OSError, ValueError):
+                    owner = 0
+                if owner and owner != os.getpid() and _process_alive(owner):
+                    return False
+                # Left behind by a process that died mid-upload; take it over
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                continue
+            with os.fdopen(fd, 'w') as f:
+                f.write(str(os.getpid()))
+            return True
+        return False
+
+    def _release_claim(self, job_id: str):
+        path = self._claim_path(job_id)
+        if path and os.path.exists(path):
+            os.remove(path)
+
+    def _publish(self, job: Dict[str, Any]):
+        """Upload one job's video and record the outcome"""
+        job_id = job["id"]
+        last_progress = [0.0]
+
+        def record_progress(uploaded, total):
+            progress = uploaded / total if total else 1.0
+            # Progress is kept in memory; only state changes are written to disk
+            if progress - last_progress[0] >= 0.01 or progress >= 1.0:
+                last_progress[0] = progress
+                self._update(job_id, save=False, progress=progress)
+
+        try:
+            if not job["file_path"] or not os.path.exists(job["file_path"]):
+                raise FileNotFoundError(f"Video file not found: {job['file_path']}")
+            response = self._get_client().upload_video(
+                job["file_path"], job["title"], job["description"],
+                tags=job["tags"], privacy_status=job["privacy_status"],
+                progress_callback=record_progress
+            )
+        except Exception as e:
+            print(f"Publishing job {job_id} failed: {str(e)}")
+            self._update(job_id, status=STATUS_FAILED, error=str(e))
+            return
+
+        video_id = response.get("id")
+        published = self._update(
+            job_id, status=STATUS_PUBLISHED, progress=1.0, youtube_video_id=video_id,
+            youtube_url=f"https://youtube.com/watch?v={video_id}", error=None
+        )
+        if self.on_published:
+            try:
+                self.on_published(published)
+            except Exception as e:
+                print(f"on_published callback for job {job_id} failed: {str(e)}")
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Block until a job is published or failed
+
+        Args:
+            job_id: Job to wait for
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Copy of the job, or None if it is unknown
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None or job["status"] in (STATUS_PUBLISHED, STATUS_FAILED):
+                return job
+            if deadline is not None and time.monotonic() >= deadline:
+                return job
+            time.sleep(0.1)
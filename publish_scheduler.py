@@ -0,0 +1,464 @@
+"""
+Publish Scheduler Module for YouTube Automation
+Daemon that publishes queued videos at the slots of the Workflow Settings publishing schedule
+"""
+
+import os
+import json
+import time
+import uuid
+import heapq
+import itertools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Callable
+
+# Publishing schedules offered on the Workflow Settings page
+SCHEDULE_IMMEDIATE = "Publish immediately"
+SCHEDULE_DAILY = "Daily at specific time"
+SCHEDULE_CUSTOM = "Custom schedule"
+
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Seconds before a slot at which its video is rendered and staged
+DEFAULT_PRESTAGE_LEAD = 30 * 60
+
+# Missed slots published after downtime, at most one per DEFAULT_CATCH_UP_SPACING seconds
+DEFAULT_CATCH_UP_LIMIT = 3
+DEFAULT_CATCH_UP_SPACING = 10 * 60
+
+# Finished publishes kept per channel
+DEFAULT_KEEP_HISTORY = 50
+
+# Publish attempts per video before it is left in the queue as failed
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Item states
+STATUS_QUEUED = "queued"
+STATUS_PUBLISHING = "publishing"
+STATUS_PUBLISHED = "published"
+STATUS_FAILED = "failed"
+
+
+def chain(future: Future, fn: Callable[[Any], Any]) -> Future:
+    """
+    Future resolving to fn(result) once another future is done
+
+    fn runs in the done-callback, on whichever thread completes ``future``,
+    so nothing waits on the first future in between.
+
+    Args:
+        future: Future to follow
+        fn: Callable receiving the result of ``future``
+
+    Returns:
+        Future resolving to the return value of fn, or failing with either error
+    """
+    chained = Future()
+
+    def done(source: Future):
+        if not chained.set_running_or_notify_cancel():
+            return
+        try:
+            chained.set_result(fn(source.result()))
+        except BaseException as e:
+            chained.set_exception(e)
+
+    future.add_done_callback(done)
+    return chained
+
+
+def next_slot(workflow, after: float) -> Optional[float]:
+    """
+    First publish slot of a schedule later than a point in time
+
+    Args:
+        workflow: WorkflowSettings with publishing_schedule, publish_time and publish_days
+        after: Unix time the slot must follow
+
+    Returns:
+        Unix time of the slot (local time of day), ``after`` itself when
+        publishing immediately, or None when the schedule has no slots
+    """
+    if workflow.publishing_schedule == SCHEDULE_DAILY:
+        weekdays = set(range(7))
+    elif workflow.publishing_schedule == SCHEDULE_CUSTOM:
+        weekdays = {WEEKDAYS.index(day) for day in workflow.publish_days if day in WEEKDAYS}
+    else:
+        return after
+    if not weekdays:
+        return None
+
+    try:
+        publish_time = datetime.strptime(workflow.publish_time, "%H:%M").time()
+    except (TypeError, ValueError):
+        publish_time = datetime.strptime("09:00", "%H:%M").time()
+    start = datetime.fromtimestamp(after)
+    for offset in range(8):
+        day = start.date() + timedelta(days=offset)
+        slot = datetime.combine(day, publish_time).timestamp()
+        if day.weekday() in weekdays and slot > after:
+            return slot
+    return None
+
+
+class PublishScheduler:
+    """
+    Publishes each channel's queued videos at its schedule's slots
+
+    Only the next slot of every channel with queued videos is kept, as a
+    pre-stage event at ``slot - prestage_lead`` and a publish event at the
+    slot, in one heap served by a single daemon thread. Firing a slot pushes
+    the channel's following one, so thousands of channels cost two heap
+    entries each and no polling. Rescheduling a channel bumps its
+    generation; outdated heap entries are dropped when they surface.
+
+    ``prestage(item)`` renders and stages the head video ahead of its slot,
+    so ``publish(item)`` starts the upload on time. prestage runs on a
+    small worker pool and may return a Future (e.g. of a queued render)
+    instead of waiting for it; the publish is chained onto the staging with
+    a done-callback, so no thread waits for a render. Uploads run on their
+    own single-thread pool per channel, created on first publish, so a long
+    upload delays neither staging nor other channels. The queue and each
+    channel's next slot are persisted to ``queue_file``. Slots that passed
+    while the scheduler was down are caught up on startup: at most
+    ``catch_up_limit`` per channel, spaced ``catch_up_spacing`` seconds
+    apart across all channels. The rest are skipped. A failed publish stays
+    at the head of its channel's queue and is retried at the next slot, up
+    to ``max_attempts`` times; after that it stays in the queue as failed
+    until it is retried or removed.
+    """
+
+    def __init__(self,
+                 queue_file: str,
+                 prestage: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+                 publish: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+                 schedule_for: Callable[[str], Any],
+                 prestage_lead: float = DEFAULT_PRESTAGE_LEAD,
+                 catch_up_limit: int = DEFAULT_CATCH_UP_LIMIT,
+                 catch_up_spacing: float = DEFAULT_CATCH_UP_SPACING,
+                 keep_history: int = DEFAULT_KEEP_HISTORY,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                 max_workers: int = 2):
+        """
+        Initialize the PublishScheduler and start its daemon thread
+
+        Args:
+            queue_file: JSON file the queues are persisted to
+            prestage: Callable preparing an item before its slot; returns fields to store on it (e.g. "path"),
+                or a Future resolving to them
+            publish: Callable uploading a prestaged item; returns the upload response
+            schedule_for: Callable returning a channel's WorkflowSettings
+            prestage_lead: Seconds before a slot at which prestage runs
+            catch_up_limit: Missed slots caught up per channel after downtime
+            catch_up_spacing: Minimum seconds between caught-up publishes
+            keep_history: Finished publishes kept per channel
+            max_attempts: Publish attempts per video before it is marked failed
+            max_workers: Threads running prestage
+        """
+        self.queue_file = queue_file
+        self.prestage = prestage
+        self.publish = publish
+        self.schedule_for = schedule_for
+        self.prestage_lead = prestage_lead
+        self.catch_up_limit = catch_up_limit
+        self.catch_up_spacing = catch_up_spacing
+        self.keep_history = keep_history
+        self.max_attempts = max_attempts
+
+        self._cond = threading.Condition()
+        self._channels: Dict[str, Dict[str, Any]] = {}
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._generations: Dict[str, int] = {}
+        self._staging: Dict[str, Future] = {}
+        self._catch_up_at = 0.0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="publish-prestage")
+        self._upload_executors: Dict[str, ThreadPoolExecutor] = {}
+        self._load()
+        self._thread = threading.Thread(target=self._timer_loop, name="publish-scheduler", daemon=True)
+        self._thread.start()
+
+    def _load(self):
+        """Load persisted queues and plan every channel, catching up missed slots"""
+        if os.path.exists(self.queue_file):
+            try:
+                with open(self.queue_file, 'r') as f:
+                    self._channels = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Error loading publish queue from {self.queue_file}: {str(e)}")
+        now = time.time()
+        with self._cond:
+            for channel, state in self._channels.items():
+                for item in state["queue"]:
+                    if item["status"] == STATUS_PUBLISHING:
+                        # Interrupted publishes go again; the resumable upload picks up where it stopped
+                        item["status"] = STATUS_QUEUED
+                state["catch_up"] = self._missed_slots(channel, state, now)
+                self._plan(channel, now)
+
+    def _save(self):
+        """Persist the queues atomically; the caller holds the lock"""
+        directory = os.path.dirname(self.queue_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.queue_file}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self._channels, f)
+        os.replace(tmp_path, self.queue_file)
+
+    def _missed_slots(self, channel: str, state: Dict[str, Any], now: float) -> int:
+        """Slots that passed while queued videos waited, capped at catch_up_limit and the queue length"""
+        slot = state.get("next_slot")
+        limit = min(self.catch_up_limit, sum(item["status"] == STATUS_QUEUED for item in state["queue"]))
+        missed = 0
+        schedule = self.schedule_for(channel)
+        while slot is not None and slot <= now and missed < limit:
+            missed += 1
+            following = next_slot(schedule, slot)
+            slot = following if following is not None and following > slot else None
+        return missed
+
+    def _head(self, channel: str) -> Optional[Dict[str, Any]]:
+        """Next queued item of a channel; the caller holds the lock"""
+        for item in self._channels[channel]["queue"]:
+            if item["status"] == STATUS_QUEUED:
+                return item
+        return None
+
+    def _plan(self, channel: str, now: float):
+        """Push a channel's next pre-stage and publish events; the caller holds the lock"""
+        state = self._channels[channel]
+        generation = self._generations.get(channel, 0) + 1
+        self._generations[channel] = generation
+        if self._head(channel) is None:
+            state["next_slot"] = None
+            state["catch_up"] = 0
+            return
+        if state.get("catch_up"):
+            # One global pace for catch-up, so a restart doesn't burst every channel's backlog at once
+            slot = max(now, self._catch_up_at)
+            self._catch_up_at = slot + self.catch_up_spacing
+        else:
+            slot = next_slot(self.schedule_for(channel), max(now, state.get("published_slot") or 0))
+        state["next_slot"] = slot
+        if slot is None:
+            return
+        heapq.heappush(self._heap, (slot - self.prestage_lead, next(self._seq), "prestage", channel, generation))
+        heapq.heappush(self._heap, (slot, next(self._seq), "publish", channel, generation))
+        self._cond.notify_all()
+
+    def _timer_loop(self):
+        """Fire heap events as they come due"""
+        while True:
+            with self._cond:
+                while True:
+                    now = time.time()
+                    if self._heap and self._heap[0][0] <= now:
+                        when, _, kind, channel, generation = heapq.heappop(self._heap)
+                        if generation == self._generations.get(channel):
+                            break
+                        continue
+                    self._cond.wait(timeout=self._heap[0][0] - now if self._heap else None)
+                item = self._head(channel)
+                if item is None:
+                    continue
+                if kind == "prestage":
+                    self._start_prestage(channel, item)
+                    continue
+                slot = self._channels[channel]["next_slot"]
+                item["status"] = STATUS_PUBLISHING
+                item["slot"] = slot
+                staging = self._start_prestage(channel, item)
+                state = self._channels[channel]
+                state["published_slot"] = slot
+                if state.get("catch_up"):
+                    state["catch_up"] -= 1
+                # The next slot is planned now, not when the upload finishes
+                self._plan(channel, time.time())
+                self._save()
+                uploads = self._upload_executor(channel)
+            published = dict(item)
+            staging.add_done_callback(
+                lambda done, channel=channel, published=published, uploads=uploads:
+                    uploads.submit(self._publish_item, channel, published, done))
+
+    def _upload_executor(self, channel: str) -> ThreadPoolExecutor:
+        """The channel's upload pool, one thread per channel; the caller holds the lock"""
+        executor = self._upload_executors.get(channel)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"publish-upload-{channel}")
+            self._upload_executors[channel] = executor
+        return executor
+
+    def _start_prestage(self, channel: str, item: Dict[str, Any]) -> Future:
+        """Start staging an item unless it already is; the caller holds the lock"""
+        future = self._staging.get(item["id"])
+        if future is None:
+            future = Future()
+            self._executor.submit(self._run_prestage, dict(item), future)
+            future.add_done_callback(lambda done: self._staged(channel, item["id"], done))
+            self._staging[item["id"]] = future
+        return future
+
+    def _run_prestage(self, item: Dict[str, Any], future: Future):
+        """Call prestage and resolve the staging future, following a returned Future without waiting on it"""
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self.prestage(item)
+        except Exception as e:
+            future.set_exception(e)
+            return
+        if not isinstance(result, Future):
+            future.set_result(result)
+            return
+
+        def done(staged: Future):
+            try:
+                future.set_result(staged.result())
+            except BaseException as e:
+                future.set_exception(e)
+
+        result.add_done_callback(done)
+
+    def _staged(self, channel: str, item_id: str, future: Future):
+        """Store what prestage returned on the queued item, so a restart doesn't stage it again"""
+        if future.cancelled() or future.exception() is not None:
+            return
+        with self._cond:
+            for item in self._channels.get(channel, {}).get("queue", []):
+                if item["id"] == item_id:
+                    item.update(future.result() or {})
+                    self._save()
+                    return
+
+    def _publish_item(self, channel: str, item: Dict[str, Any], staging: Future):
+        """Upload an item once its staging is done and record the outcome"""
+        try:
+            item.update(staging.result() or {})
+            response = self.publish(item) or {}
+            entry = {"status": STATUS_PUBLISHED, "youtube_id": response.get("id"), "error": None}
+        except Exception as e:
+            print(f"Scheduled publish of {item['title']} failed: {str(e)}")
+            entry = {"status": STATUS_FAILED, "youtube_id": None, "error": str(e)}
+        entry.update({"id": item["id"], "title": item["title"], "slot": item.get("slot"),
+                      "finished_at": datetime.now().isoformat()})
+        with self._cond:
+            self._staging.pop(item["id"], None)
+            state = self._channels.get(channel)
+            if state is None:
+                return
+            queued = next((queued for queued in state["queue"] if queued["id"] == item["id"]), None)
+            if queued is None or entry["status"] == STATUS_PUBLISHED:
+                state["queue"] = [queued for queued in state["queue"] if queued["id"] != item["id"]]
+            else:
+                queued["attempts"] = entry["attempts"] = queued.get("attempts", 0) + 1
+                queued["error"] = entry["error"]
+                if queued["attempts"] < self.max_attempts:
+                    # Back at the head of the queue, so it goes again at the channel's next slot
+                    queued["status"] = STATUS_QUEUED
+                    if state.get("next_slot") is None:
+                        self._plan(channel, time.time())
+                else:
+                    queued["status"] = STATUS_FAILED
+            state.setdefault("history", []).insert(0, entry)
+            del state["history"][self.keep_history:]
+            self._save()
+
+    def enqueue(self, channel: str, title: str, description: str = "", **fields) -> str:
+        """
+        Queue a video for the channel's next free slot
+
+        Args:
+            channel: Channel (or owner) whose schedule publishes it
+            title: Video title
+            description: Video description
+            **fields: Stored on the item for prestage and publish (e.g. script_id, path, tags)
+
+        Returns:
+            Id of the queued item
+        """
+        item = dict(fields, id=uuid.uuid4().hex, channel=channel, title=title, description=description,
+                    status=STATUS_QUEUED, queued_at=datetime.now().isoformat())
+        with self._cond:
+            state = self._channels.setdefault(channel, {"queue": [], "history": [], "next_slot": None})
+            state["queue"].append(item)
+            if state.get("next_slot") is None:
+                self._plan(channel, time.time())
+            self._save()
+        return item["id"]
+
+    def remove(self, channel: str, item_id: str) -> bool:
+        """Take a queued or failed video off the schedule; returns False if it is unknown or publishing"""
+        with self._cond:
+            state = self._channels.get(channel)
+            if state is None:
+                return False
+            for item in state["queue"]:
+                if item["id"] == item_id and item["status"] in (STATUS_QUEUED, STATUS_FAILED):
+                    was_head = item is self._head(channel)
+                    state["queue"].remove(item)
+                    self._staging.pop(item_id, None)
+                    if was_head:
+                        # The next video takes over the slot and is staged in time for it
+                        self._plan(channel, time.time())
+                    self._save()
+                    return True
+        return False
+
+    def retry(self, channel: str, item_id: str) -> bool:
+        """Queue a video that ran out of publish attempts again; returns False if it is not failed"""
+        with self._cond:
+            state = self._channels.get(channel)
+            if state is None:
+                return False
+            for item in state["queue"]:
+                if item["id"] == item_id and item["status"] == STATUS_FAILED:
+                    item.update(status=STATUS_QUEUED, attempts=0, error=None)
+                    if item is self._head(channel):
+                        self._plan(channel, time.time())
+                    self._save()
+                    return True
+        return False
+
+    def reschedule(self, channel: Optional[str] = None):
+        """Re-plan one channel, or all, after its schedule changed"""
+        now = time.time()
+        with self._cond:
+            for name in ([channel] if channel is not None else list(self._channels)):
+                if name in self._channels:
+                    self._plan(name, now)
+            self._save()
+
+    def list_queue(self, channel: str) -> List[Dict[str, Any]]:
+        """
+        Queued videos of a channel in publishing order
+
+        Returns:
+            Copies of the items, each with "slot" set to its projected publish time
+        """
+        with self._cond:
+            state = self._channels.get(channel)
+            if state is None:
+                return []
+            items = [dict(item) for item in state["queue"]]
+            slot = state.get("next_slot")
+        schedule = self.schedule_for(channel)
+        for item in items:
+            if item["status"] == STATUS_FAILED:
+                item["slot"] = None
+            if item["status"] != STATUS_QUEUED:
+                continue
+            item["slot"] = slot
+            if slot is not None:
+                following = next_slot(schedule, slot)
+                slot = following if following is not None and following > slot else None
+        return items
+
+    def history(self, channel: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Finished publishes of a channel, newest first"""
+        with self._cond:
+            state = self._channels.get(channel)
+            return [dict(entry) for entry in (state or {}).get("history", [])[:limit]]
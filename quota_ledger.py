@@ -0,0 +1,326 @@
+"""
+Quota Ledger Module for YouTube Automation
+Tracks YouTube Data API quota usage per Pacific-time day and defers low-priority calls
+"""
+
+import os
+import json
+import heapq
+import itertools
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, Callable
+
+try:
+    from zoneinfo import ZoneInfo
+    PACIFIC = ZoneInfo("America/Los_Angeles")
+except Exception:
+    # No tz database available; fall back to standard time
+    PACIFIC = timezone(timedelta(hours=-8))
+
+DEFAULT_DAILY_QUOTA = 10000
+
+# Estimated unit cost of each YouTube Data API method
+QUOTA_COSTS = {
+    "videos.insert": 1600,
+    "videos.update": 50,
+    "videos.list": 1,
+    "channels.list": 1,
+    "search.list": 100,
+    "thumbnails.set": 50
+}
+
+# Units low-priority calls must leave untouched so uploads always get through
+DEFAULT_UPLOAD_RESERVE = QUOTA_COSTS["videos.insert"]
+
+PRIORITIES = ("high", "low")
+
+
+class QuotaBudgetExceeded(Exception):
+    """Raised when a call would exceed the quota available to its priority"""
+
+    def __init__(self, method: str, cost: int, available: int):
+        super().__init__(
+            f"Not enough YouTube API quota for {method}: needs {cost} units, {available} available"
+        )
+        self.method = method
+        self.cost = cost
+        self.available = available
+
+
+def pacific_day(now: Optional[datetime] = None) -> str:
+    """Get the quota day (YouTube resets quota at midnight Pacific time)"""
+    now = now or datetime.now(timezone.utc)
+    return now.astimezone(PACIFIC).date().isoformat()
+
+
+def next_reset(now: Optional[datetime] = None) -> datetime:
+    """Get the next Pacific midnight as an aware datetime"""
+    now = (now or datetime.now(timezone.utc)).astimezone(PACIFIC)
+    tomorrow = (now + timedelta(days=1)).date()
+    return datetime(tomorrow.year, tomorrow.month, tomorrow.day, tzinfo=PACIFIC)
+
+
+class QuotaLedger:
+    """
+    Persistent record of the quota units spent today
+
+    Every API call is recorded with its estimated unit cost. The ledger is
+    saved to ``ledger_file`` after each change and starts from zero when the
+    Pacific-time date changes. High-priority calls (uploads) may spend the
+    whole budget; low-priority calls must leave ``upload_reserve`` units.
+    ``scheduler()`` returns the one QuotaScheduler deferring calls against
+    this ledger, shared by every client that charges it.
+    """
+
+    def __init__(self,
+                 ledger_file: str,
+                 daily_limit: int = DEFAULT_DAILY_QUOTA,
+                 upload_reserve: int = DEFAULT_UPLOAD_RESERVE):
+        """
+        Initialize the QuotaLedger
+
+        Args:
+            ledger_file: JSON file the ledger is persisted to
+            daily_limit: Daily quota granted to the project
+            upload_reserve: Units low-priority calls may not consume
+        """
+        self.ledger_file = ledger_file
+        self.daily_limit = daily_limit
+        self.upload_reserve = upload_reserve
+        self._lock = threading.Lock()
+        self._data = self._load()
+        self._scheduler: Optional["QuotaScheduler"] = None
+
+    def scheduler(self) -> "QuotaScheduler":
+        """The ledger's QuotaScheduler, created (with its thread) on first use"""
+        with self._lock:
+            if self._scheduler is None:
+                self._scheduler = QuotaScheduler(self)
+            return self._scheduler
+
+    def _empty(self, day: str) -> Dict[str, Any]:
+        return {"day": day, "used": 0, "calls": {}}
+
+    def _load(self) -> Dict[str, Any]:
+        """Load the ledger, discarding a previous day's usage"""
+        today = pacific_day()
+        if os.path.exists(self.ledger_file):
+            try:
+                with open(self.ledger_file, 'r') as f:
+                    data = json.load(f)
+                if data.get("day") == today:
+                    return data
+            except (OSError, ValueError):
+                pass
+        return self._empty(today)
+
+    def _save(self):
+        """Write the ledger atomically"""
+        directory = os.path.dirname(self.ledger_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.ledger_file}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self._data, f)
+        os.replace(tmp_path, self.ledger_file)
+
+    def _roll_over(self):
+        """Start a new day if the Pacific date has changed"""
+        today = pacific_day()
+        if self._data["day"] != today:
+            self._data = self._empty(today)
+
+    def cost(self, method: str) -> int:
+        """Estimated unit cost of an API method"""
+        return QUOTA_COSTS.get(method, 1)
+
+    def used(self) -> int:
+        """Units spent today"""
+        with self._lock:
+            self._roll_over()
+            return self._data["used"]
+
+    def remaining(self, priority: str = "high") -> int:
+        """
+        Units still available today to calls of a priority
+
+        Args:
+            priority: "high" or "low"
+
+        Returns:
+            Remaining units, never negative
+        """
+        with self._lock:
+            self._roll_over()
+            return self._available(priority)
+
+    def _available(self, priority: str) -> int:
+        reserve = self.upload_reserve if priority == "low" else 0
+        return max(0, self.daily_limit - self._data["used"] - reserve)
+
+    def can_afford(self, method: str, priority: str = "high", units: Optional[int] = None) -> bool:
+        """Check whether a call fits the budget of its priority right now"""
+        units = self.cost(method) if units is None else units
+        return units <= self.remaining(priority)
+
+    def reserve(self, method: str, priority: str = "high", units: Optional[int] = None) -> int:
+        """
+        Charge a call against today's budget, refusing it if unaffordable
+
+        Args:
+            method: API method name, e.g. "videos.insert"
+            priority: "high" or "low"
+            units: Cost override
+
+        Returns:
+            Units charged
+
+        Raises:
+            QuotaBudgetExceeded: if the call doesn't fit the priority's budget
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority}")
+        units = self.cost(method) if units is None else units
+        with self._lock:
+            self._roll_over()
+            available = self._available(priority)
+            if units > available:
+                raise QuotaBudgetExceeded(method, units, available)
+            self._charge(method, units)
+        return units
+
+    def record(self, method: str, units: Optional[int] = None):
+        """Record a call that was made without a reservation"""
+        units = self.cost(method) if units is None else units
+        with self._lock:
+            self._roll_over()
+            self._charge(method, units)
+
+    def refund(self, method: str, units: int):
+        """Return units for a reserved call that never reached the API"""
+        with self._lock:
+            self._roll_over()
+            self._data["used"] = max(0, self._data["used"] - units)
+            calls = self._data["calls"].get(method)
+            if calls:
+                calls["count"] = max(0, calls["count"] - 1)
+                calls["units"] = max(0, calls["units"] - units)
+            self._save()
+
+    def _charge(self, method: str, units: int):
+        self._data["used"] += units
+        calls = self._data["calls"].setdefault(method, {"count": 0, "units": 0})
+        calls["count"] += 1
+        calls["units"] += units
+        self._save()
+
+    def summary(self) -> Dict[str, Any]:
+        """Get today's usage, remaining budget and per-method breakdown"""
+        with self._lock:
+            self._roll_over()
+            return {
+                "day": self._data["day"],
+                "daily_limit": self.daily_limit,
+                "used": self._data["used"],
+                "remaining": self._available("high"),
+                "remaining_low_priority": self._available("low"),
+                "calls": {method: dict(calls) for method, calls in self._data["calls"].items()},
+                "resets_at": next_reset().isoformat()
+            }
+
+
+class QuotaScheduler:
+    """
+    Runs API calls within the quota budget, deferring what doesn't fit
+
+    ``submit()`` runs a call immediately when the ledger can afford it.
+    Otherwise the call is queued (high priority first, then submission order)
+    and a background thread retries the queue whenever ``notify()`` is called
+    and after the next Pacific-midnight reset.
+    """
+
+    def __init__(self, ledger: QuotaLedger, poll_interval: float = 300.0):
+        """
+        Initialize the QuotaScheduler
+
+        Args:
+            ledger: Ledger to charge calls against
+            poll_interval: Maximum seconds between retries of deferred calls
+        """
+        self.ledger = ledger
+        self.poll_interval = poll_interval
+        self._cond = threading.Condition()
+        self._deferred = []
+        self._seq = itertools.count()
+        self._thread = threading.Thread(target=self._drain_loop, name="quota-scheduler", daemon=True)
+        self._thread.start()
+
+    def submit(self, method: str, fn: Callable[[], Any], priority: str = "low") -> Future:
+        """
+        Run a call now if affordable, otherwise defer it
+
+        Args:
+            method: API method name used to look up the cost
+            fn: Callable performing the API call
+            priority: "high" or "low"
+
+        Returns:
+            Future resolving to the call's result
+        """
+        future = Future()
+        if not self._try_run(method, fn, priority, future):
+            with self._cond:
+                rank = 0 if priority == "high" else 1
+                heapq.heappush(self._deferred, (rank, next(self._seq), method, fn, priority, future))
+                self._cond.notify_all()
+        return future
+
+    def _try_run(self, method: str, fn: Callable[[], Any], priority: str, future: Future) -> bool:
+        """
+        Run a call if the budget allows; returns False if it must wait
+
+        fn is expected to charge the ledger itself (as the YouTube client does
+        for every request it executes), so only affordability is checked here.
+        """
+        if not self.ledger.can_afford(method, priority):
+            return False
+        if not future.running() and not future.set_running_or_notify_cancel():
+            return True
+        try:
+            future.set_result(fn())
+        except QuotaBudgetExceeded:
+            # Another caller spent the budget first; wait for the next window
+            return False
+        except Exception as e:
+            future.set_exception(e)
+        return True
+
+    def notify(self):
+        """Retry deferred calls (e.g. after the daily limit was raised)"""
+        with self._cond:
+            self._cond.notify_all()
+
+    def pending(self) -> int:
+        """Number of deferred calls"""
+        with self._cond:
+            return len(self._deferred)
+
+    def _drain_loop(self):
+        """Run deferred calls as budget becomes available"""
+        while True:
+            with self._cond:
+                seconds_to_reset = (next_reset() - datetime.now(timezone.utc)).total_seconds()
+                self._cond.wait(timeout=max(1.0, min(self.poll_interval, seconds_to_reset + 1)))
+                queued = list(self._deferred)
+            still_waiting = []
+            for entry in sorted(queued):
+                _, _, method, fn, priority, future = entry
+                if not self._try_run(method, fn, priority, future):
+                    still_waiting.append(entry)
+            with self._cond:
+                # Keep calls submitted while we were draining
+                done = {id(entry) for entry in queued} - {id(entry) for entry in still_waiting}
+                self._deferred = [entry for entry in self._deferred if id(entry) not in done]
+                heapq.heapify(self._deferred)
@@ -0,0 +1,168 @@
+"""
+Render Manifest Module for YouTube Automation
+Records completed render steps so interrupted video jobs can resume
+"""
+
+import os
+import json
+import hashlib
+from typing import Dict, Any, Optional
+from datetime import datetime
+
+MANIFEST_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: str) -> str:
+    """
+    Compute the SHA-256 of a file without loading it into memory
+
+    Args:
+        path: Path of the file to hash
+
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_inputs(*parts: Any) -> str:
+    """
+    Compute a stable hash for the inputs of a render step
+
+    Args:
+        *parts: JSON-serializable values the step output depends on
+
+    Returns:
+        Hex digest identifying the inputs
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class RenderManifest:
+    """
+    On-disk record of the steps completed for one render job
+
+    Each step (segment, audio track, mux) is stored with the hash of its
+    inputs and the hash of the file it produced. A step only counts as done
+    when both still match, so a restarted job skips finished work but redoes
+    anything whose inputs changed or whose output is missing or truncated.
+    """
+
+    def __init__(self, manifest_path: str, job_id: str, job_hash: str):
+        """
+        Initialize the RenderManifest
+
+        Args:
+            manifest_path: Path of the JSON manifest file
+            job_id: Identifier of the render job
+            job_hash: Hash of the job settings; a mismatch discards old progress
+        """
+        self.manifest_path = manifest_path
+        self.job_id = job_id
+        self.job_hash = job_hash
+        self.data = self._load()
+
+    def _new_manifest(self) -> Dict[str, Any]:
+        """Create an empty manifest for this job"""
+        return {
+            "version": MANIFEST_VERSION,
+            "job_id": self.job_id,
+            "job_hash": self.job_hash,
+            "status": "in_progress",
+            "steps": {},
+            "created_at": datetime.now().isoformat(),
+            "updated_at": datetime.now().isoformat()
+        }
+
+    def _load(self) -> Dict[str, Any]:
+        """Load the manifest from disk, starting over if it is unusable"""
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, 'r') as f:
+                    data = json.load(f)
+                if (data.get("version") == MANIFEST_VERSION
+                        and data.get("job_hash") == self.job_hash):
+                    return data
+            except (OSError, ValueError):
+                pass
+        return self._new_manifest()
+
+    def save(self):
+        """Write the manifest atomically so a crash never leaves it half-written"""
+        self.data["updated_at"] = datetime.now().isoformat()
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.manifest_path)
+
+    def reset(self):
+        """Discard all recorded progress for this job"""
+        self.data = self._new_manifest()
+        self.save()
+
+    def is_complete(self, step: str, inputs_hash: str) -> bool:
+        """
+        Check whether a step finished with the same inputs and intact output
+
+        Args:
+            step: Name of the render step
+            inputs_hash: Hash of the inputs the step would be run with
+
+        Returns:
+            True if the recorded output can be reused
+        """
+        record = self.data["steps"].get(step)
+        if not record or record.get("inputs_hash") != inputs_hash:
+            return False
+        output_path = record.get("output_path")
+        if not output_path or not os.path.exists(output_path):
+            return False
+        if os.path.getsize(output_path) != record.get("size"):
+            return False
+        return hash_file(output_path) == record.get("output_hash")
+
+    def get_output_hash(self, step: str) -> Optional[str]:
+        """Get the recorded output hash of a completed step"""
+        record = self.data["steps"].get(step)
+        return record.get("output_hash") if record else None
+
+    def mark_complete(self, step: str, output_path: str, inputs_hash: str) -> str:
+        """
+        Record a finished step and persist the manifest
+
+        Args:
+            step: Name of the render step
+            output_path: File produced by the step
+            inputs_hash: Hash of the inputs the step was run with
+
+        Returns:
+            Hash of the produced file
+        """
+        output_hash = hash_file(output_path)
+        self.data["steps"][step] = {
+            "inputs_hash": inputs_hash,
+            "output_path": output_path,
+            "output_hash": output_hash,
+            "size": os.path.getsize(output_path),
+            "completed_at": datetime.now().isoformat()
+        }
+        self.save()
+        return output_hash
+
+    def mark_finished(self):
+        """Mark the whole job as finished"""
+        self.data["status"] = "finished"
+        self.save()
+
+    @property
+    def completed_steps(self) -> int:
+        """Number of steps recorded as complete"""
+        return len(self.data["steps"])
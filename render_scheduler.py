@@ -0,0 +1,287 @@
+"""
+Render Scheduler Module for YouTube Automation
+Priority scheduling of renders, TTS and uploads with per-resource concurrency caps
+"""
+
+import os
+import time
+import threading
+import itertools
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Callable, Iterable
+
+# Job priorities, lower weight runs first
+PRIORITY_WEIGHTS = {
+    "interactive": 0,
+    "scheduled": 1,
+    "backfill": 2
+}
+
+# Resource classes jobs can claim a slot of
+RESOURCE_CPU = "cpu_encode"
+RESOURCE_DISK = "disk_io"
+RESOURCE_NETWORK = "network_upload"
+
+DEFAULT_LIMITS = {
+    RESOURCE_CPU: max(1, (os.cpu_count() or 2) // 2),
+    RESOURCE_DISK: 2,
+    RESOURCE_NETWORK: 2
+}
+
+
+class _Job:
+    """A queued unit of work"""
+
+    def __init__(self, seq: int, fn: Callable, args: tuple, kwargs: Dict[str, Any],
+                 priority: str, resources: List[str], name: str):
+        self.seq = seq
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.resources = resources
+        self.name = name
+        self.future = Future()
+        self.submitted_at = time.monotonic()
+
+    def effective_weight(self, now: float, aging_seconds: float) -> float:
+        """Priority weight lowered by time spent waiting, so old jobs can't starve"""
+        return PRIORITY_WEIGHTS[self.priority] - (now - self.submitted_at) / aging_seconds
+
+
+class RenderScheduler:
+    """
+    Runs jobs in priority order without oversubscribing shared resources
+
+    Every job declares the resource classes it uses (CPU encode, disk I/O,
+    network upload); at most ``limits[resource]`` jobs hold a class at once.
+    Among runnable jobs the one with the lowest weight goes first
+    (interactive < scheduled < backfill). A job's weight drops by one level
+    for every ``aging_seconds`` it waits, and the resources of the most
+    urgent blocked job are reserved for it, so backfill work still makes
+    progress under a steady stream of interactive requests.
+    """
+
+    def __init__(self,
+                 limits: Optional[Dict[str, int]] = None,
+                 aging_seconds: float = 60.0,
+                 metrics_window: int = 1000):
+        """
+        Initialize the RenderScheduler
+
+        Args:
+            limits: Maximum concurrent jobs per resource class
+            aging_seconds: Waiting time that promotes a job by one priority level
+            metrics_window: Number of recent wait times kept per priority
+        """
+        self.limits = dict(DEFAULT_LIMITS)
+        if limits:
+            self.limits.update(limits)
+        self.aging_seconds = aging_seconds
+
+        self._cond = threading.Condition()
+        self._pending: List[_Job] = []
+        self._in_use = {resource: 0 for resource in self.limits}
+        self._seq = itertools.count()
+        self._shutdown = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=sum(self.limits.values()),
+            thread_name_prefix="render-scheduler"
+        )
+
+        self._wait_times = {priority: deque(maxlen=metrics_window) for priority in PRIORITY_WEIGHTS}
+        self._completed = {priority: 0 for priority in PRIORITY_WEIGHTS}
+        self._failed = {priority: 0 for priority in PRIORITY_WEIGHTS}
+
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="render-dispatcher", daemon=True)
+        self._dispatcher.start()
+
+    def submit(self,
+               fn: Callable,
+               *args,
+               priority: str = "backfill",
+               resources: Iterable[str] = (RESOURCE_CPU,),
+               name: Optional[str] = None,
+               **kwargs) -> Future:
+        """
+        Queue a job
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments for fn
+            priority: "interactive", "scheduled" or "backfill"
+            resources: Resource classes the job holds while running
+            name: Optional label for logging
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future resolving to the return value of fn
+        """
+        if priority not in PRIORITY_WEIGHTS:
+            raise ValueError(f"Unknown priority: {priority}")
+        resources = list(resources)
+        for resource in resources:
+            if resource not in self.limits:
+                raise ValueError(f"Unknown resource class: {resource}")
+
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("Scheduler has been shut down")
+            job = _Job(next(self._seq), fn, args, kwargs, priority, resources,
+                       name or getattr(fn, "__name__", "job"))
+            self._pending.append(job)
+            self._cond.notify_all()
+        return job.future
+
+    def submit_render(self, assembler, script_data: Dict[str, Any], output_path: str,
+                      priority: str = "backfill", **kwargs) -> Future:
+        """
+        Queue a VideoAssembler.create_video call
+
+        Args:
+            assembler: VideoAssembler instance
+            script_data: Script data from ScriptGenerator
+            output_path: Path to save the output video
+            priority: Job priority
+            **kwargs: Passed through to create_video
+
+        Returns:
+            Future resolving to the created video path
+        """
+        return self.submit(assembler.create_video, script_data, output_path,
+                           priority=priority, resources=(RESOURCE_CPU, RESOURCE_DISK),
+                           name=f"render:{os.path.basename(output_path)}", **kwargs)
+
+    def submit_upload(self, youtube_api, file_path: str, title: str, description: str,
+                      priority: str = "scheduled", **kwargs) -> Future:
+        """
+        Queue a YouTube upload
+
+        Args:
+            youtube_api: YouTube client with an upload_video method
+            file_path: Path of the video file
+            title: Video title
+            description: Video description
+            priority: Job priority
+            **kwargs: Passed through to upload_video
+
+        Returns:
+            Future resolving to the upload response
+        """
+        return self.submit(youtube_api.upload_video, file_path, title, description,
+                           priority=priority, resources=(RESOURCE_NETWORK, RESOURCE_DISK),
+                           name=f"upload:{os.path.basename(file_path)}", **kwargs)
+
+    def _fits(self, job: _Job, reserved: Dict[str, int]) -> bool:
+        """Check whether a job's resources are free"""
+        return all(self._in_use[r] + reserved.get(r, 0) < self.limits[r] for r in job.resources)
+
+    def _next_job(self) -> Optional[_Job]:
+        """Pick the next runnable job, reserving resources for the most urgent blocked job"""
+        now = time.monotonic()
+        ordered = sorted(self._pending, key=lambda j: (j.effective_weight(now, self.aging_seconds), j.seq))
+        reserved: Dict[str, int] = {}
+        for job in ordered:
+            if self._fits(job, reserved):
+                return job
+            # Hold back the resources only the first blocked job is waiting for; reserving for every
+            # blocked job would let a long queue claim every slot and stall the dispatcher
+            if not reserved:
+                reserved = {resource: 1 for resource in job.resources}
+        return None
+
+    def _dispatch_loop(self):
+        """Start jobs as resources become available"""
+        with self._cond:
+            while True:
+                if self._shutdown and not self._pending:
+                    # Running jobs keep their threads; no new work is accepted
+                    self._executor.shutdown(wait=False)
+                    return
+                job = self._next_job() if self._pending else None
+                if job is None:
+                    # Wake up periodically so aging can reorder waiting jobs
+                    self._cond.wait(timeout=self.aging_seconds / 4)
+                    continue
+                self._pending.remove(job)
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                for resource in job.resources:
+                    self._in_use[resource] += 1
+                self._wait_times[job.priority].append(time.monotonic() - job.submitted_at)
+                self._executor.submit(self._run, job)
+
+    def _run(self, job: _Job):
+        """Run a job and release its resources"""
+        succeeded = False
+        try:
+            result = job.fn(*job.args, **job.kwargs)
+            succeeded = True
+        except BaseException as e:
+            job.future.set_exception(e)
+        finally:
+            with self._cond:
+                for resource in job.resources:
+                    self._in_use[resource] -= 1
+                if succeeded:
+                    self._completed[job.priority] += 1
+                else:
+                    self._failed[job.priority] += 1
+                self._cond.notify_all()
+        if succeeded:
+            job.future.set_result(result)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get queue depth, resource usage and wait-time statistics
+
+        Returns:
+            Dictionary of metrics keyed by priority and resource class
+        """
+        with self._cond:
+            now = time.monotonic()
+            queue_depth = {priority: 0 for priority in PRIORITY_WEIGHTS}
+            oldest_wait = {priority: 0.0 for priority in PRIORITY_WEIGHTS}
+            for job in self._pending:
+                queue_depth[job.priority] += 1
+                oldest_wait[job.priority] = max(oldest_wait[job.priority], now - job.submitted_at)
+
+            wait_times = {}
+            for priority, samples in self._wait_times.items():
+                ordered = sorted(samples)
+                wait_times[priority] = {
+                    "count": len(ordered),
+                    "avg": sum(ordered) / len(ordered) if ordered else 0.0,
+                    "p95": ordered[int(0.95 * (len(ordered) - 1))] if ordered else 0.0,
+                    "max": ordered[-1] if ordered else 0.0
+                }
+
+            return {
+                "queue_depth": queue_depth,
+                "oldest_wait": oldest_wait,
+                "wait_times": wait_times,
+                "running": dict(self._in_use),
+                "limits": dict(self.limits),
+                "completed": dict(self._completed),
+                "failed": dict(self._failed)
+            }
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False):
+        """
+        Stop accepting jobs and shut down the worker threads
+
+        Args:
+            wait: Block until queued and running jobs finish
+            cancel_pending: Cancel jobs that have not started yet
+        """
+        with self._cond:
+            self._shutdown = True
+            if cancel_pending:
+                for job in self._pending:
+                    job.future.cancel()
+                self._pending.clear()
+            self._cond.notify_all()
+        if wait:
+            self._dispatcher.join()
+            self._executor.shutdown(wait=True)
@@ -7,6 +7,66 @@ import random
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+# Different intro templates based on format
+INTRO_TEMPLATES = {
+    'Conversational': [
+        "Hey there! Did you know that {fact}? That's pretty amazing, right?",
+        "Welcome back to our channel! Today we're exploring an incredible fact: {fact}",
+        "Here's something that might surprise you... {fact}. Let's dive deeper into this!",
+        "I bet you didn't know that {fact}. It's one of those fascinating tidbits that makes life interesting."
+    ],
+    'Educational': [
+        "Today we're exploring an important fact: {fact}. This has significant implications for how we understand our world.",
+        "In this educational video, we'll examine the following fact: {fact}. Let's analyze what this means.",
+        "Welcome to our learning series! Today's fascinating topic centers around this fact: {fact}",
+        "The following information might change your perspective: {fact}. Let's explore the science behind this."
+    ],
+    'Entertaining': [
+        "You won't believe this, but {fact}! Mind-blowing, right?",
+        "Prepare to have your mind blown! {fact} - and that's just the beginning of today's amazing facts!",
+        "This is going to sound crazy, but {fact}! Let's talk about why this is so incredible!",
+        "Wait until you tell your friends this one... {fact}! Their reactions will be priceless!"
+    ]
+}
+
+# Different main content templates
+MAIN_CONTENT_TEMPLATES = {
+    'Conversational': [
+        "Let's think about what this means. {fact} is fascinating because it shows us how complex our world really is. Many people don't realize the implications of this information.",
+        "When you consider that {fact}, it makes you wonder what other amazing things we still don't know about our world. Scientists continue to study this phenomenon.",
+        "I find it incredible that {fact}. It's these kinds of details that make learning about our world so rewarding. There's always something new to discover."
+    ],
+    'Educational': [
+        "To understand why {fact}, we need to examine the underlying principles. This phenomenon occurs because of specific conditions that create this remarkable outcome.",
+        "The fact that {fact} has been verified through multiple studies. Researchers have documented this through careful observation and experimentation.",
+        "When we analyze {fact} more carefully, we can see how this connects to broader patterns in our world. This is consistent with what we know about related phenomena."
+    ],
+    'Entertaining': [
+        "Can you imagine if {fact} wasn't true? Our world would be completely different! This is the kind of mind-blowing information that makes reality stranger than fiction.",
+        "I was shocked when I first learned that {fact}! It's one of those facts that sounds made up but is absolutely true. The universe is full of surprises!",
+        "The next time you're at a party, try telling people that {fact}. Watch their jaws drop! It's the perfect conversation starter."
+    ]
+}
+
+# Different outro templates
+OUTRO_TEMPLATES = {
+    'Conversational': [
+        "Thanks for watching! If you enjoyed learning about {fact}, make sure to like and subscribe for more fascinating content.",
+        "I hope you found this information about {fact} as interesting as I did. See you in the next video!",
+        "Now that you know {fact}, be sure to share this video with someone who would appreciate this knowledge!"
+    ],
+    'Educational': [
+        "Understanding that {fact} helps us build a more complete picture of our world. Join us next time for more educational content.",
+        "We hope this explanation of why {fact} has been informative. Don't forget to subscribe for more in-depth explorations.",
+        "Continue your learning journey with us as we explore more fascinating facts like {fact} in our upcoming videos."
+    ],
+    'Entertaining': [
+        "Wasn't that amazing? Now you can amaze your friends by telling them that {fact}! Don't forget to like and subscribe!",
+        "Mind = blown! {fact} is just one of the incredible facts we share on this channel. Stay tuned for more!",
+        "If you enjoyed learning that {fact}, smash that like button and subscribe for more mind-blowing content!"
+    ]
+}
+
 class ScriptGenerator:
     """
     Generates video scripts from facts
@@ -14,65 +74,10 @@ class ScriptGenerator:
     
     def __init__(self):
         """Initialize the ScriptGenerator"""
-        # Different intro templates based on format
-        self.intro_templates = {
-            'Conversational': [
-                "Hey there! Did you know that {fact}? That's pretty amazing, right?",
-                "Welcome back to our channel! Today we're exploring an incredible fact: {fact}",
-                "Here's something that might surprise you... {fact}. Let's dive deeper into this!",
-                "I bet you didn't know that {fact}. It's one of those fascinating tidbits that makes life interesting."
-            ],
-            'Educational': [
-                "Today we're exploring an important fact: {fact}. This has significant implications for how we understand our world.",
-                "In this educational video, we'll examine the following fact: {fact}. Let's analyze what this means.",
-                "Welcome to our learning series! Today's fascinating topic centers around this fact: {fact}",
-                "The following information might change your perspective: {fact}. Let's explore the science behind this."
-            ],
-            'Entertaining': [
-                "You won't believe this, but {fact}! Mind-blowing, right?",
-                "Prepare to have your mind blown! {fact} - and that's just the beginning of today's amazing facts!",
-                "This is going to sound crazy, but {fact}! Let's talk about why this is so incredible!",
-                "Wait until you tell your friends this one... {fact}! Their reactions will be priceless!"
-            ]
-        }
-        
-        # Different main content templates
-        self.main_content_templates = {
-            'Conversational': [
-                "Let's think about what this means. {fact} is fascinating because it shows us how complex our world really is. Many people don't realize the implications of this information.",
-                "When you consider that {fact}, it makes you wonder what other amazing things we still don't know about our world. Scientists continue to study this phenomenon.",
-                "I find it incredible that {fact}. It's these kinds of details that make learning about our world so rewarding. There's always something new to discover."
-            ],
-            'Educational': [
-                "To understand why {fact}, we need to examine the underlying principles. This phenomenon occurs because of specific conditions that create this remarkable outcome.",
-                "The fact that {fact} has been verified through multiple studies. Researchers have documented this through careful observation and experimentation.",
-                "When we analyze {fact} more carefully, we can see how this connects to broader patterns in our world. This is consistent with what we know about related phenomena."
-            ],
-            'Entertaining': [
-                "Can you imagine if {fact} wasn't true? Our world would be completely different! This is the kind of mind-blowing information that makes reality stranger than fiction.",
-                "I was shocked when I first learned that {fact}! It's one of those facts that sounds made up but is absolutely true. The universe is full of surprises!",
-                "The next time you're at a party, try telling people that {fact}. Watch their jaws drop! It's the perfect conversation starter."
-            ]
-        }
-        
-        # Different outro templates
-        self.outro_templates = {
-            'Conversational': [
-                "Thanks for watching! If you enjoyed learning about {fact}, make sure to like and subscribe for more fascinating content.",
-                "I hope you found this information about {fact} as interesting as I did. See you in the next video!",
-                "Now that you know {fact}, be sure to share this video with someone who would appreciate this knowledge!"
-            ],
-            'Educational': [
-                "Understanding that {fact} helps us build a more complete picture of our world. Join us next time for more educational content.",
-                "We hope this explanation of why {fact} has been informative. Don't forget to subscribe for more in-depth explorations.",
-                "Continue your learning journey with us as we explore more fascinating facts like {fact} in our upcoming videos."
-            ],
-            'Entertaining': [
-                "Wasn't that amazing? Now you can amaze your friends by telling them that {fact}! Don't forget to like and subscribe!",
-                "Mind = blown! {fact} is just one of the incredible facts we share on this channel. Stay tuned for more!",
-                "If you enjoyed learning that {fact}, smash that like button and subscribe for more mind-blowing content!"
-            ]
-        }
+        # Template registries are shared module constants, not rebuilt per instance
+        self.intro_templates = INTRO_TEMPLATES
+        self.main_content_templates = MAIN_CONTENT_TEMPLATES
+        self.outro_templates = OUTRO_TEMPLATES
     
     def generate_script(self, 
                        fact_data: Dict[str, Any],
@@ -160,7 +165,66 @@ class ScriptGenerator:
         }
         
         return script_data
-    
+
+    def create_script_with_sections(self,
+                                    facts: List[Dict[str, Any]],
+                                    title: str,
+                                    include_sources: bool = False,
+                                    format_type: str = "Conversational",
+                                    words_per_second: float = 2.5) -> Dict[str, Any]:
+        """
+        Create a multi-fact script with one section per fact
+
+        Args:
+            facts: Fact dictionaries with "text" and optionally "source"
+            title: Video title
+            include_sources: Mention each fact's source after it
+            format_type: Script format (Conversational, Educational, Entertaining)
+            words_per_second: Narration speed used to estimate durations
+
+        Returns:
+            Script data dictionary
+        """
+        if not facts:
+            raise ValueError("At least one fact is required")
+
+        # Validate format type
+        if format_type not in self.intro_templates:
+            format_type = "Conversational"  # Default to conversational
+
+        def fact_text(fact):
+            return fact.get('text') or fact.get('content', '')
+
+        def section(section_type, text):
+            return {
+                "type": section_type,
+                "text": text,
+                "duration": max(1, round(len(text.split()) / words_per_second))
+            }
+
+        sections = [section("intro", random.choice(self.intro_templates[format_type]).format(fact=fact_text(facts[0]).rstrip('.')))]
+        for i, fact in enumerate(facts, start=1):
+            text = f"Fact number {i}: {fact_text(fact)}"
+            if include_sources and fact.get('source'):
+                text += f" (Source: {fact['source']})"
+            sections.append(section("main", text))
+        sections.append(section("outro", random.choice(self.outro_templates[format_type]).format(fact=fact_text(facts[-1]).rstrip('.'))))
+
+        full_script = "\n\n".join(f"[{item['type'].upper()}]\n{item['text']}" for item in sections)
+
+        return {
+            "id": random.randint(1000, 9999),
+            "title": title,
+            "content": full_script,
+            "full_script": full_script,
+            "format": format_type,
+            "fact_count": len(facts),
+            "facts": facts,
+            "estimated_duration": sum(item["duration"] for item in sections),
+            "sections": sections,
+            "created_at": datetime.now().isoformat()
+        }
+
     def get_available_formats(self) -> List[Dict[str, Any]]:
         """
         Get available script formats
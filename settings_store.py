@@ -0,0 +1,289 @@
+"""
+Settings Store Module for YouTube Automation
+Typed SEO, workflow, component and system settings persisted to settings.json
+"""
+
+import os
+import re
+import json
+import time
+import threading
+from dataclasses import dataclass, field, fields, asdict, replace
+from typing import Dict, Any, Optional, Tuple, Callable
+
+# Video quality presets and the frame size they render at
+VIDEO_QUALITIES = {
+    "Low (480p)": (854, 480),
+    "Medium (720p)": (1280, 720),
+    "High (1080p)": (1920, 1080),
+    "Ultra (4K)": (3840, 2160)
+}
+
+# Narration seconds per fact, used to turn the target video length into a fact count
+SECONDS_PER_FACT = 15
+
+# Choices offered on the Settings page
+PUBLISHING_SCHEDULES = ("Publish immediately", "Daily at specific time", "Custom schedule")
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+FACT_SOURCES = ("Academic Journals", "News Sites", "Wikipedia", "Books", "Scientific Publications")
+MEDIA_SOURCES = ("Pixabay", "Pexels", "Unsplash", "Custom Library", "Generated Images")
+NOTIFICATION_EVENTS = ("Content generation complete", "Video creation complete", "Publishing complete",
+                       "Error alerts", "Performance reports")
+CLEANUP_OPTIONS = ("Remove published videos", "Remove unused media", "Archive old facts", "Compress log files")
+
+# Publish time format, 24-hour HH:MM
+TIME_PATTERN = re.compile(r"^([01][0-9]|2[0-3]):[0-5][0-9]$")
+
+
+@dataclass(frozen=True)
+class SEOSettings:
+    title_template: str = "🤯 {fact_number} Mind-Blowing Facts That Will Amaze You! | Did You Know?"
+    description_template: str = (
+        "Check out these amazing facts that will blow your mind!\n\n"
+        "{facts}\n\n"
+        "Don't forget to like and subscribe for more interesting content.\n\n"
+        "#DidYouKnow #AmazingFacts #Interesting"
+    )
+    tags_template: str = "facts, amazing, did you know, interesting, mind-blowing, knowledge, learn"
+
+
+@dataclass(frozen=True)
+class WorkflowSettings:
+    default_fact_count: int = 10
+    fact_quality: int = 7
+    fact_sources: Tuple[str, ...] = ("News Sites", "Wikipedia", "Scientific Publications")
+    video_quality: str = "High (1080p)"
+    video_length: int = 180
+    media_sources: Tuple[str, ...] = ("Pixabay", "Pexels", "Unsplash")
+    publishing_schedule: str = "Publish immediately"
+    publish_time: str = "09:00"
+    publish_days: Tuple[str, ...] = ("Monday", "Wednesday", "Friday")
+    email_notifications: bool = True
+    email: str = ""
+    notification_events: Tuple[str, ...] = ("Content generation complete", "Publishing complete", "Error alerts")
+
+    @property
+    def resolution(self) -> Tuple[int, int]:
+        """Frame size of the selected video quality"""
+        return VIDEO_QUALITIES.get(self.video_quality, VIDEO_QUALITIES["High (1080p)"])
+
+    @property
+    def facts_per_video(self) -> int:
+        """Facts that fill the target video length, between 3 and 10"""
+        return max(3, min(10, self.video_length // SECONDS_PER_FACT))
+
+
+@dataclass(frozen=True)
+class ComponentSettings:
+    enabled: Dict[str, bool] = field(default_factory=dict)
+
+    def is_enabled(self, name: str) -> bool:
+        """Components are enabled unless switched off"""
+        return self.enabled.get(name, True)
+
+
+@dataclass(frozen=True)
+class SystemSettings:
+    storage_path: str = "/data/youtube_automation"
+    max_storage_gb: int = 10
+    cleanup_options: Tuple[str, ...] = ("Remove published videos", "Remove unused media")
+
+
+@dataclass(frozen=True)
+class Settings:
+    seo: SEOSettings = field(default_factory=SEOSettings)
+    workflow: WorkflowSettings = field(default_factory=WorkflowSettings)
+    components: ComponentSettings = field(default_factory=ComponentSettings)
+    system: SystemSettings = field(default_factory=SystemSettings)
+
+
+# Allowed values per section and field, on top of the field's type
+FIELD_CHECKS: Dict[str, Dict[str, Callable[[Any], bool]]] = {
+    "WorkflowSettings": {
+        "default_fact_count": lambda value: 1 <= value <= 100,
+        "fact_quality": lambda value: 1 <= value <= 10,
+        "fact_sources": lambda value: set(value) <= set(FACT_SOURCES),
+        "video_quality": lambda value: value in VIDEO_QUALITIES,
+        "video_length": lambda value: 30 <= value <= 600 and value % 30 == 0,
+        "media_sources": lambda value: set(value) <= set(MEDIA_SOURCES),
+        "publishing_schedule": lambda value: value in PUBLISHING_SCHEDULES,
+        "publish_time": lambda value: bool(TIME_PATTERN.match(value)),
+        "publish_days": lambda value: set(value) <= set(WEEKDAYS),
+        "notification_events": lambda value: set(value) <= set(NOTIFICATION_EVENTS)
+    },
+    "SystemSettings": {
+        "max_storage_gb": lambda value: 1 <= value <= 100,
+        "cleanup_options": lambda value: set(value) <= set(CLEANUP_OPTIONS)
+    }
+}
+
+
+def _coerce(value: Any, default: Any) -> Any:
+    """
+    Convert a stored value to the type of the field's default
+
+    Raises:
+        ValueError: If the value can't be used for the field
+    """
+    if isinstance(default, bool):
+        if isinstance(value, bool):
+            return value
+    elif isinstance(default, int):
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+    elif isinstance(default, str):
+        if isinstance(value, str):
+            return value
+    elif isinstance(default, tuple):
+        # JSON has no tuples; sequences are stored as lists
+        if isinstance(value, (list, tuple)) and all(isinstance(item, str) for item in value):
+            return tuple(value)
+    elif isinstance(default, dict):
+        if isinstance(value, dict) and all(isinstance(key, str) and isinstance(item, bool)
+                                           for key, item in value.items()):
+            return dict(value)
+    raise ValueError(f"expected {type(default).__name__}, got {value!r}")
+
+
+def _checked_values(section_type, data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Coerce and check a section's stored values
+
+    Returns:
+        Valid values by field name; unknown keys and invalid values are left out
+    """
+    defaults = section_type()
+    checks = FIELD_CHECKS.get(section_type.__name__, {})
+    values = {}
+    for section_field in fields(section_type):
+        if section_field.name not in data:
+            continue
+        try:
+            value = _coerce(data[section_field.name], getattr(defaults, section_field.name))
+            if section_field.name in checks and not checks[section_field.name](value):
+                raise ValueError(f"{value!r} is not allowed")
+        except ValueError as e:
+            print(f"Ignoring setting {section_field.name}: {str(e)}")
+            continue
+        values[section_field.name] = value
+    return values
+
+
+def _section_from_dict(section_type, data: Any):
+    """Build a settings section, keeping defaults for missing, unknown and invalid keys"""
+    if not isinstance(data, dict):
+        return section_type()
+    return section_type(**_checked_values(section_type, data))
+
+
+def settings_from_dict(data: Dict[str, Any]) -> Settings:
+    """Build Settings from parsed settings.json content"""
+    if not isinstance(data, dict):
+        raise ValueError("settings must be a JSON object")
+    return Settings(**{
+        section_field.name: _section_from_dict(section_field.default_factory, data.get(section_field.name))
+        for section_field in fields(Settings)
+    })
+
+
+class SettingsStore:
+    """
+    Settings loaded from a JSON file and cached in memory
+
+    ``get()`` returns the cached, immutable Settings and only re-parses the
+    file when its modification time changes (checked at most every
+    ``check_interval`` seconds), so pipeline stages can read settings on
+    every use. Edits made to the file by hand or by another process are
+    picked up the same way. ``update()`` writes the file atomically. A file
+    that fails to parse, or isn't a JSON object, leaves the last good
+    settings in place; a field with a value of the wrong type or out of
+    range keeps its default.
+    """
+
+    def __init__(self, settings_file: str, check_interval: float = 1.0):
+        """
+        Initialize the SettingsStore
+
+        Args:
+            settings_file: JSON file the settings are stored in
+            check_interval: Minimum seconds between modification time checks
+        """
+        self.settings_file = settings_file
+        self.check_interval = check_interval
+
+        self._lock = threading.Lock()
+        self._settings = Settings()
+        self._mtime_ns: Optional[int] = None
+        self._checked_at = 0.0
+
+    def _mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.settings_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def _reload(self):
+        """Re-parse the file if it changed; the caller holds the lock"""
+        mtime_ns = self._mtime()
+        if mtime_ns == self._mtime_ns:
+            return
+        if mtime_ns is None:
+            self._settings = Settings()
+        else:
+            try:
+                with open(self.settings_file, 'r') as f:
+                    content = f.read()
+                self._settings = settings_from_dict(json.loads(content) if content.strip() else {})
+            except (OSError, ValueError, TypeError, AttributeError) as e:
+                print(f"Error loading settings from {self.settings_file}: {str(e)}")
+        self._mtime_ns = mtime_ns
+
+    def get(self) -> Settings:
+        """Get the current settings"""
+        now = time.monotonic()
+        with self._lock:
+            if self._mtime_ns is None or now - self._checked_at >= self.check_interval:
+                self._checked_at = now
+                self._reload()
+            return self._settings
+
+    def update(self, section: str, **values) -> Settings:
+        """
+        Change fields of one settings section and save the file
+
+        Args:
+            section: "seo", "workflow", "components" or "system"
+            **values: New field values
+
+        Returns:
+            The updated settings
+
+        Raises:
+            ValueError: If a value has the wrong type or is out of range
+        """
+        with self._lock:
+            self._reload()
+            current = getattr(self._settings, section)
+            checked = _checked_values(type(current), values)
+            invalid = set(values) - set(checked)
+            if invalid:
+                raise ValueError(f"Invalid {section} settings: {', '.join(sorted(invalid))}")
+            values = checked
+            settings = replace(self._settings, **{section: replace(current, **values)})
+            self._write(settings)
+            self._settings = settings
+            return settings
+
+    def _write(self, settings: Settings):
+        """Write settings atomically; the caller holds the lock"""
+        directory = os.path.dirname(self.settings_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.settings_file}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(asdict(settings), f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.settings_file)
+        self._mtime_ns = self._mtime()
+        self._checked_at = time.monotonic()
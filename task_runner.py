@@ -0,0 +1,237 @@
+"""
+Task Runner Module for YouTube Automation
+Background execution of long app actions with persisted, per-owner task records
+"""
+
+import os
+import json
+import uuid
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Callable
+
+# Task states
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+
+FINISHED_STATUSES = (STATUS_SUCCEEDED, STATUS_FAILED, STATUS_CANCELLED)
+
+# Finished tasks kept across all owners, so owners that never come back can't grow the file without bound
+DEFAULT_MAX_FINISHED = 1000
+
+# Seconds a finished task is kept after it finished
+DEFAULT_FINISHED_TTL = 7 * 24 * 3600
+
+
+class TaskRunner:
+    """
+    Runs callables on a thread pool and keeps a record of each one
+
+    Every task belongs to an owner (a browser session in the app) and has a
+    kind, a label, a status, a progress fraction with an optional message,
+    and on completion either a JSON-serializable result or an error. Records
+    live in the runner rather than the caller's session, and are persisted
+    to ``tasks_file`` so finished results survive restarts. Tasks that were
+    still queued or running when the process stopped are marked failed on
+    load, as their callables can't be restored. Finished tasks are dropped
+    beyond ``keep_finished`` per owner and ``max_finished`` overall, oldest
+    first, and once they finished more than ``finished_ttl`` seconds ago.
+
+    Task callables receive a ``progress(fraction, message=None)`` function
+    as their first argument.
+    """
+
+    def __init__(self,
+                 tasks_file: Optional[str] = None,
+                 max_workers: int = 4,
+                 keep_finished: int = 100,
+                 max_finished: int = DEFAULT_MAX_FINISHED,
+                 finished_ttl: float = DEFAULT_FINISHED_TTL):
+        """
+        Initialize the TaskRunner
+
+        Args:
+            tasks_file: Optional JSON file the task records are persisted to
+            max_workers: Number of worker threads
+            keep_finished: Finished tasks kept per owner; older ones are dropped
+            max_finished: Finished tasks kept across all owners
+            finished_ttl: Seconds a finished task is kept after it finished
+        """
+        self.tasks_file = tasks_file
+        self.keep_finished = keep_finished
+        self.max_finished = max_finished
+        self.finished_ttl = finished_ttl
+
+        self._lock = threading.Lock()
+        self._tasks: Dict[str, Dict[str, Any]] = {}
+        self._futures: Dict[str, Future] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task-runner")
+        self._load()
+
+    def _load(self):
+        """Load persisted tasks, failing the ones that were interrupted"""
+        if not self.tasks_file or not os.path.exists(self.tasks_file):
+            return
+        try:
+            with open(self.tasks_file, 'r') as f:
+                tasks = json.load(f)
+        except (OSError, ValueError):
+            return
+        for task in tasks:
+            if task["status"] not in FINISHED_STATUSES:
+                task.update({"status": STATUS_FAILED, "error": "Interrupted by a restart"})
+            self._tasks[task["id"]] = task
+        self._prune_expired()
+
+    def _save(self):
+        """Persist all tasks atomically; the caller holds the lock"""
+        if not self.tasks_file:
+            return
+        directory = os.path.dirname(self.tasks_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.tasks_file}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(list(self._tasks.values()), f, default=str)
+        os.replace(tmp_path, self.tasks_file)
+
+    def _prune(self, owner: str):
+        """Drop an owner's oldest finished tasks beyond keep_finished; the caller holds the lock"""
+        finished = sorted(
+            (task for task in self._tasks.values() if task["owner"] == owner and task["status"] in FINISHED_STATUSES),
+            key=lambda task: task["created_at"]
+        )
+        for task in finished[:max(0, len(finished) - self.keep_finished)]:
+            del self._tasks[task["id"]]
+
+    def _prune_expired(self):
+        """Drop finished tasks past finished_ttl, then the oldest beyond max_finished; the caller holds the lock"""
+        cutoff = (datetime.now() - timedelta(seconds=self.finished_ttl)).isoformat()
+        finished = sorted(
+            (task for task in self._tasks.values() if task["status"] in FINISHED_STATUSES),
+            key=lambda task: task["created_at"]
+        )
+        excess = max(0, len(finished) - self.max_finished)
+        for i, task in enumerate(finished):
+            if i < excess or task["updated_at"] < cutoff:
+                del self._tasks[task["id"]]
+
+    def submit(self, owner: str, kind: str, label: str, fn: Callable, *args, **kwargs) -> Dict[str, Any]:
+        """
+        Queue a task
+
+        Args:
+            owner: Owner the task is listed under
+            kind: Kind of task, used by callers to route its result
+            label: Human-readable description
+            fn: Callable run as ``fn(progress, *args, **kwargs)``
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Copy of the new task
+        """
+        now = datetime.now().isoformat()
+        task = {
+            "id": uuid.uuid4().hex,
+            "owner": owner,
+            "kind": kind,
+            "label": label,
+            "status": STATUS_QUEUED,
+            "progress": 0.0,
+            "message": None,
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now
+        }
+        with self._lock:
+            self._tasks[task["id"]] = task
+            self._prune(owner)
+            self._prune_expired()
+            self._save()
+            self._futures[task["id"]] = self._executor.submit(self._run, task["id"], fn, args, kwargs)
+            return dict(task)
+
+    def _update(self, task_id: str, save: bool = True, **fields):
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return
+            task.update(fields)
+            task["updated_at"] = datetime.now().isoformat()
+            if save:
+                self._save()
+
+    def _run(self, task_id: str, fn: Callable, args: tuple, kwargs: Dict[str, Any]):
+        """Run one task and record the outcome"""
+        def progress(fraction: float, message: Optional[str] = None):
+            # Progress is kept in memory; only state changes are written to disk
+            self._update(task_id, save=False, progress=max(0.0, min(1.0, fraction)), message=message)
+
+        self._update(task_id, status=STATUS_RUNNING)
+        try:
+            result = fn(progress, *args, **kwargs)
+        except Exception as e:
+            print(f"Task {task_id} failed: {str(e)}")
+            self._update(task_id, status=STATUS_FAILED, error=str(e))
+        else:
+            self._update(task_id, status=STATUS_SUCCEEDED, progress=1.0, result=result)
+        finally:
+            with self._lock:
+                self._futures.pop(task_id, None)
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of a task"""
+        with self._lock:
+            task = self._tasks.get(task_id)
+            return dict(task) if task else None
+
+    def list_tasks(self, owner: Optional[str] = None, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List tasks, newest first, optionally filtered by owner and status"""
+        with self._lock:
+            tasks = [dict(task) for task in self._tasks.values()
+                     if (owner is None or task["owner"] == owner) and (status is None or task["status"] == status)]
+        return sorted(tasks, key=lambda task: task["created_at"], reverse=True)
+
+    def cancel(self, task_id: str) -> bool:
+        """
+        Cancel a task that has not started yet
+
+        Args:
+            task_id: Task to cancel
+
+        Returns:
+            True if the task was cancelled
+        """
+        with self._lock:
+            future = self._futures.get(task_id)
+            if future is None or not future.cancel():
+                return False
+            self._futures.pop(task_id, None)
+            task = self._tasks[task_id]
+            task.update({"status": STATUS_CANCELLED, "updated_at": datetime.now().isoformat()})
+            self._save()
+            return True
+
+    def clear_finished(self, owner: str) -> int:
+        """
+        Remove an owner's finished tasks
+
+        Args:
+            owner: Owner whose finished tasks are removed
+
+        Returns:
+            Number of tasks removed
+        """
+        with self._lock:
+            finished = [task_id for task_id, task in self._tasks.items()
+                        if task["owner"] == owner and task["status"] in FINISHED_STATUSES]
+            for task_id in finished:
+                del self._tasks[task_id]
+            self._save()
+        return len(finished)
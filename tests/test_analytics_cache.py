@@ -0,0 +1,60 @@
+"""
+AnalyticsCache tests: refreshes racing invalidate() and ordered flushes
+"""
+
+import json
+import threading
+import time
+
+from analytics_cache import AnalyticsCache
+
+
+def make_stale(cache, endpoint, key):
+    cache._entries[cache._cache_key(endpoint, key)]["fetched_at"] -= cache.ttls[endpoint] + 1
+
+
+def test_refresh_started_before_invalidate_is_dropped(tmp_path):
+    cache = AnalyticsCache(str(tmp_path / "cache.json"))
+    cache.get_or_fetch("channel_info", "me", lambda: "old")
+    make_stale(cache, "channel_info", "me")
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_refresh():
+        started.set()
+        release.wait(5)
+        return "refreshed"
+
+    assert cache.get_or_fetch("channel_info", "me", lambda: "unused", slow_refresh) == "old"
+    assert started.wait(5)
+    cache.invalidate("channel_info")
+    release.set()
+
+    for _ in range(200):
+        if not cache._refreshing:
+            break
+        time.sleep(0.01)
+    assert cache.get_or_fetch("channel_info", "me", lambda: "new") == "new"
+
+
+def test_concurrent_flushes_leave_the_latest_snapshot(tmp_path):
+    cache_file = str(tmp_path / "cache.json")
+    cache = AnalyticsCache(cache_file, flush_interval=0)
+
+    def store(n):
+        for i in range(50):
+            cache._store("video_statistics", f"v{n}", i)
+
+    threads = [threading.Thread(target=store, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cache.flush()
+
+    with open(cache_file) as f:
+        entries = json.load(f)["entries"]
+    assert {key: entry["value"] for key, entry in entries.items()} == {
+        f"video_statistics:v{n}": 49 for n in range(4)
+    }
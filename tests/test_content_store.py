@@ -0,0 +1,60 @@
+"""
+ContentStore tests: search with LIKE wildcards in the query, paging and per-task idempotency
+"""
+
+import pytest
+
+from content_store import ContentStore, DEFAULT_PAGE_SIZE
+
+
+@pytest.fixture
+def store():
+    return ContentStore()
+
+
+def add_videos(store, titles, owner="alice"):
+    return [store.add_video(owner, {"path": f"/videos/{i}.mp4", "title": title}) for i, title in enumerate(titles)]
+
+
+def test_wildcards_in_the_search_match_literally(store):
+    add_videos(store, ["100% facts", "1000 facts", "snake_case tips", "snakeXcase tips", "back\\slash"])
+
+    assert [video["title"] for video in store.list_videos("alice", search="100%")] == ["100% facts"]
+    assert [video["title"] for video in store.list_videos("alice", search="e_c")] == ["snake_case tips"]
+    assert [video["title"] for video in store.list_videos("alice", search="k\\s")] == ["back\\slash"]
+    assert store.count_videos("alice", search="%") == 1
+    assert store.count_videos("alice", search="_") == 1
+    assert store.count_videos("alice", search="facts") == 2
+
+
+def test_search_covers_script_text_and_only_the_owner(store):
+    store.add_script("alice", {"title": "Space", "full_script": "Octopuses have 3 hearts"})
+    store.add_script("bob", {"title": "Octopuses", "full_script": ""})
+
+    [summary] = store.list_scripts("alice", search="octopuses")
+    assert summary["title"] == "Space"
+    assert "full_script" not in summary
+    assert store.get_script(summary["id"])["full_script"] == "Octopuses have 3 hearts"
+
+
+def test_pages_split_at_the_limit_newest_first(store):
+    ids = add_videos(store, [f"Video {i}" for i in range(DEFAULT_PAGE_SIZE + 3)])
+    newest_first = ids[::-1]
+
+    first = store.list_videos("alice")
+    second = store.list_videos("alice", offset=DEFAULT_PAGE_SIZE)
+    assert [video["id"] for video in first] == newest_first[:DEFAULT_PAGE_SIZE]
+    assert [video["id"] for video in second] == newest_first[DEFAULT_PAGE_SIZE:]
+    assert store.list_videos("alice", offset=len(ids)) == []
+    assert store.count_videos("alice") == len(ids)
+
+    # A page boundary falling exactly on the last row
+    assert [video["id"] for video in store.list_videos("alice", offset=len(ids) - 1, limit=1)] == [ids[0]]
+
+
+def test_rewriting_a_task_returns_the_stored_row(store):
+    first = store.add_upload("alice", {"id": "yt1", "snippet": {"title": "Clip"}}, task_id="task-1")
+    again = store.add_upload("alice", {"id": "yt1", "snippet": {"title": "Clip"}}, task_id="task-1")
+
+    assert again == first
+    assert store.count_uploads("alice") == 1
@@ -0,0 +1,42 @@
+"""
+Shared transport tests against the local fake YouTube server
+"""
+
+import threading
+
+from http_transport import SharedHttp, HttpPool
+from fake_youtube_server import FakeYouTubeServer
+
+
+def test_parallel_requests_share_pooled_transports():
+    http = SharedHttp(timeout=5)
+    pool = http._pool
+    statuses = []
+    with FakeYouTubeServer() as server:
+        url = f"{server.url}youtube/v3/channels?part=snippet&mine=true"
+
+        def fetch():
+            for _ in range(5):
+                response, _ = http.request(url, "GET")
+                statuses.append(response.status)
+
+        threads = [threading.Thread(target=fetch) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        http.close()
+
+    assert len(statuses) == 40
+    assert len(pool._idle) == 0
+
+
+def test_pool_reuses_and_caps_idle_transports():
+    pool = HttpPool(timeout=5, max_idle=1)
+    first = pool.checkout()
+    second = pool.checkout()
+    assert first is not second
+    pool.checkin(first)
+    pool.checkin(second)
+    assert pool.checkout() is first
+    assert pool.checkout() is not second
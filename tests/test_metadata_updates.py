@@ -0,0 +1,83 @@
+"""
+Batched metadata update tests for YouTubeAPIRefreshToken against the local fake YouTube server
+"""
+
+import pickle
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from youtube_api_implementation import YouTubeAPIRefreshToken
+from quota_ledger import QuotaLedger
+from fake_youtube_server import FakeYouTubeServer
+
+
+@pytest.fixture
+def server():
+    with FakeYouTubeServer() as fake:
+        yield fake
+
+
+@pytest.fixture
+def token_file(tmp_path):
+    path = tmp_path / "token.pickle"
+    with open(path, 'wb') as f:
+        pickle.dump(Credentials(token="fake-token"), f)
+    return str(path)
+
+
+def make_client(server, token_file, quota_ledger=None):
+    api = YouTubeAPIRefreshToken(token_file=token_file, root_url=server.url, quota_ledger=quota_ledger)
+    api.authenticate()
+    return api
+
+
+def test_invalid_changes_are_reported_without_aborting_the_batch(server, token_file):
+    first, second = server.add_videos(2)
+    results = make_client(server, token_file).update_videos_metadata([
+        {"video_id": first, "title": "New title"},
+        {"video_id": second, "titel": "Typo"},
+        {"title": "No id"}
+    ])
+
+    assert [result["status"] for result in results] == ["updated", "invalid", "invalid"]
+    assert "titel" in results[1]["error"]
+    assert server.get_video(first)["snippet"]["title"] == "New title"
+
+
+def test_refused_lookup_is_reported_per_video(server, token_file, tmp_path):
+    video_ids = server.add_videos(3)
+    # Every unit is reserved for uploads, so low-priority lookups are refused
+    ledger = QuotaLedger(str(tmp_path / "ledger.json"), daily_limit=100, upload_reserve=100)
+    results = make_client(server, token_file, ledger).update_videos_metadata(
+        [{"video_id": video_id, "title": "New title"} for video_id in video_ids]
+    )
+
+    assert [result["status"] for result in results] == ["quota_exceeded"] * 3
+    assert all(result["video_id"] == video_id for result, video_id in zip(results, video_ids))
+
+
+def test_duplicate_changes_for_one_video_are_rejected(server, token_file):
+    video_id = server.add_videos(1)[0]
+    results = make_client(server, token_file).update_videos_metadata([
+        {"video_id": video_id, "title": "First"},
+        {"video_id": video_id, "description": "Second"}
+    ])
+
+    assert [result["status"] for result in results] == ["updated", "invalid"]
+    assert "Duplicate" in results[1]["error"]
+    assert server.get_video(video_id)["snippet"]["title"] == "First"
+    assert server.get_video(video_id)["snippet"]["description"] != "Second"
+
+
+def test_empty_values_clear_fields(server, token_file):
+    video_id = server.add_videos(1)[0]
+    api = make_client(server, token_file)
+    api.update_videos_metadata([{"video_id": video_id, "description": "Text", "tags": ["a", "b"]}])
+
+    result = api.update_videos_metadata([{"video_id": video_id, "description": "", "tags": []}])[0]
+
+    assert result["status"] == "updated"
+    snippet = server.get_video(video_id)["snippet"]
+    assert snippet["description"] == ""
+    assert snippet["tags"] == []
@@ -0,0 +1,161 @@
+"""
+PublishPipeline tests: idempotent submission, stale claim recovery and the backend publish endpoint
+"""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from publish_pipeline import PublishPipeline, STATUS_PUBLISHED, STATUS_QUEUED, STATUS_UPLOADING
+
+BACKEND_APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend", "app.py")
+
+
+class FakeClient:
+    """Stands in for YouTubeAPIRefreshToken.upload_video"""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.uploads = []
+        self.lock = threading.Lock()
+
+    def upload_video(self, file_path, title, description, tags=None, privacy_status="private",
+                     progress_callback=None):
+        with self.lock:
+            self.uploads.append(file_path)
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("upload interrupted")
+        if progress_callback:
+            progress_callback(1, 1)
+        return {"id": f"yt-{len(self.uploads)}"}
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"\0" * 1024)
+    return str(path)
+
+
+def dead_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def write_uploading_job(jobs_file, video_file):
+    job = {"id": "job1", "idempotency_key": "key", "file_path": video_file, "title": "Title",
+           "description": "", "tags": [], "privacy_status": "private", "metadata": {},
+           "status": STATUS_UPLOADING, "progress": 0.4, "youtube_video_id": None, "youtube_url": None,
+           "error": None, "attempts": 1, "created_at": "2030-01-01T00:00:00", "updated_at": "2030-01-01T00:00:00"}
+    with open(jobs_file, 'w') as f:
+        json.dump([job], f)
+
+
+def write_claim(jobs_file, job_id, pid):
+    claims_dir = f"{jobs_file}.claims"
+    os.makedirs(claims_dir, exist_ok=True)
+    with open(os.path.join(claims_dir, f"{job_id}.claim"), 'w') as f:
+        f.write(str(pid))
+
+
+def test_resubmitting_a_key_returns_the_same_job(tmp_path, video_file):
+    client = FakeClient()
+    pipeline = PublishPipeline(lambda: client, jobs_file=str(tmp_path / "jobs.json"))
+
+    first = pipeline.submit("key", video_file, "Title")
+    assert pipeline.wait(first["id"], timeout=5)["status"] == STATUS_PUBLISHED
+    second = pipeline.submit("key", video_file, "Title")
+
+    assert second["id"] == first["id"]
+    assert second["status"] == STATUS_PUBLISHED
+    assert client.uploads == [video_file]
+
+
+def test_resubmitting_a_failed_key_retries_the_same_job(tmp_path, video_file):
+    client = FakeClient(failures=1)
+    pipeline = PublishPipeline(lambda: client, jobs_file=str(tmp_path / "jobs.json"))
+
+    job = pipeline.submit("key", video_file, "Title")
+    assert pipeline.wait(job["id"], timeout=5)["error"] == "upload interrupted"
+    retried = pipeline.submit("key", video_file, "Title")
+
+    assert retried["id"] == job["id"]
+    published = pipeline.wait(job["id"], timeout=5)
+    assert published["status"] == STATUS_PUBLISHED
+    assert published["attempts"] == 2
+
+
+def test_claim_left_by_a_dead_process_is_taken_over(tmp_path, video_file):
+    jobs_file = str(tmp_path / "jobs.json")
+    write_uploading_job(jobs_file, video_file)
+    write_claim(jobs_file, "job1", dead_pid())
+
+    client = FakeClient()
+    pipeline = PublishPipeline(lambda: client, jobs_file=jobs_file)
+    assert pipeline.get("job1")["status"] == STATUS_QUEUED
+    pipeline.start()
+
+    assert pipeline.wait("job1", timeout=5)["status"] == STATUS_PUBLISHED
+    assert client.uploads == [video_file]
+    # The claim is released right after the job is recorded
+    claim = f"{jobs_file}.claims/job1.claim"
+    for _ in range(100):
+        if not os.path.exists(claim):
+            break
+        time.sleep(0.01)
+    assert not os.path.exists(claim)
+
+
+def test_claim_held_by_a_live_process_is_skipped(tmp_path, video_file):
+    jobs_file = str(tmp_path / "jobs.json")
+    write_uploading_job(jobs_file, video_file)
+    owner = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        write_claim(jobs_file, "job1", owner.pid)
+        client = FakeClient()
+        pipeline = PublishPipeline(lambda: client, jobs_file=jobs_file)
+        pipeline.start()
+
+        assert pipeline.wait("job1", timeout=0.5)["status"] == STATUS_QUEUED
+        assert client.uploads == []
+    finally:
+        owner.kill()
+        owner.wait()
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    spec = importlib.util.spec_from_file_location("backend_app", BACKEND_APP)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    client = FakeClient()
+    monkeypatch.setattr(module, "PUBLISH_PIPELINE",
+                        PublishPipeline(lambda: client, jobs_file=str(tmp_path / "jobs.json")))
+    return module
+
+
+def test_publish_endpoint_queues_jobs_and_returns_202(backend, video_file):
+    backend.VIDEOS_DB.append({"id": 1, "title": "Title", "file_path": video_file})
+    backend.VIDEOS_DB.append({"id": 2, "title": "Unrendered", "file_path": None})
+    http = backend.app.test_client()
+
+    response = http.post("/api/publish", json={"video_ids": [1]}, headers={"Idempotency-Key": "req"})
+    assert response.status_code == 202
+    [job] = response.get_json()
+    assert job["idempotency_key"] == "req:1"
+    assert job["metadata"] == {"video_id": 1}
+
+    repeated = http.post("/api/publish", json={"video_ids": [1]}, headers={"Idempotency-Key": "req"})
+    assert repeated.status_code == 202
+    assert repeated.get_json()[0]["id"] == job["id"]
+
+    assert http.post("/api/publish", json={"video_ids": [2]}).status_code == 400
+    assert http.post("/api/publish", json={}).status_code == 400
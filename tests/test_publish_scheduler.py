@@ -0,0 +1,137 @@
+"""
+Publish scheduling tests: slot calculation, catch-up pacing, retries and the per-channel batch cap
+"""
+
+import json
+import threading
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import pytest
+
+from channel_registry import ChannelRegistry
+from publish_scheduler import (PublishScheduler, next_slot, SCHEDULE_DAILY, SCHEDULE_CUSTOM,
+                               SCHEDULE_IMMEDIATE, STATUS_FAILED, STATUS_PUBLISHED, STATUS_QUEUED)
+from settings_store import WorkflowSettings
+
+# A Wednesday
+WEDNESDAY = datetime(2030, 1, 2)
+
+
+def at(day: datetime, hour: int, minute: int = 0) -> float:
+    return day.replace(hour=hour, minute=minute).timestamp()
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return
+        time.sleep(0.01)
+    raise AssertionError("Condition not reached in time")
+
+
+def make_item(item_id, channel):
+    return {"id": item_id, "channel": channel, "title": item_id, "description": "",
+            "status": STATUS_QUEUED, "queued_at": datetime.now().isoformat()}
+
+
+def test_next_slot_daily_custom_and_immediate():
+    daily = replace(WorkflowSettings(), publishing_schedule=SCHEDULE_DAILY, publish_time="09:30")
+    assert next_slot(daily, at(WEDNESDAY, 8)) == at(WEDNESDAY, 9, 30)
+    assert next_slot(daily, at(WEDNESDAY, 9, 30)) == at(WEDNESDAY + timedelta(days=1), 9, 30)
+
+    mondays = replace(daily, publishing_schedule=SCHEDULE_CUSTOM, publish_days=("Monday",))
+    assert next_slot(mondays, at(WEDNESDAY, 8)) == at(WEDNESDAY + timedelta(days=5), 9, 30)
+    assert next_slot(replace(mondays, publish_days=()), at(WEDNESDAY, 8)) is None
+
+    bad_time = replace(daily, publish_time="soon")
+    assert next_slot(bad_time, at(WEDNESDAY, 8)) == at(WEDNESDAY, 9)
+
+    immediate = replace(daily, publishing_schedule=SCHEDULE_IMMEDIATE)
+    assert next_slot(immediate, 1234.5) == 1234.5
+
+
+def test_missed_slots_are_caught_up_at_one_global_pace(tmp_path):
+    # A daily slot two hours ago, so the regular next slot is about 22 hours away
+    now = time.time()
+    daily = replace(WorkflowSettings(), publishing_schedule=SCHEDULE_DAILY,
+                    publish_time=datetime.fromtimestamp(now - 7200).strftime("%H:%M"))
+    queue_file = str(tmp_path / "queue.json")
+    five_days_ago = next_slot(daily, now - 5 * 86400)
+    with open(queue_file, 'w') as f:
+        json.dump({channel: {"queue": [make_item(f"{channel}{i}", channel) for i in range(3)],
+                             "history": [], "next_slot": five_days_ago}
+                   for channel in ("a", "b")}, f)
+
+    published = []
+    scheduler = PublishScheduler(queue_file, prestage=lambda item: None,
+                                 publish=lambda item: published.append(item) or {"id": item["id"]},
+                                 schedule_for=lambda channel: daily, prestage_lead=0,
+                                 catch_up_limit=2, catch_up_spacing=0.1)
+    wait_until(lambda: len(scheduler.history("a")) + len(scheduler.history("b")) == 4)
+
+    # Two catch-ups per channel, spaced across both channels
+    slots = sorted(item["slot"] for item in published)
+    assert slots[1:] == pytest.approx([slots[0] + 0.1 * i for i in range(1, 4)])
+    assert sorted(item["id"] for item in published) == ["a0", "a1", "b0", "b1"]
+
+    # The rest wait for the regular schedule
+    for channel in ("a", "b"):
+        [waiting] = scheduler.list_queue(channel)
+        assert waiting["slot"] == next_slot(daily, now)
+
+
+def test_failed_publishes_are_retried_then_kept_as_failed(tmp_path):
+    attempts = []
+
+    def publish(item):
+        attempts.append(item["id"])
+        raise RuntimeError("upload refused")
+
+    immediate = replace(WorkflowSettings(), publishing_schedule=SCHEDULE_IMMEDIATE)
+    scheduler = PublishScheduler(str(tmp_path / "queue.json"), prestage=lambda item: None, publish=publish,
+                                 schedule_for=lambda channel: immediate, prestage_lead=0, max_attempts=2)
+    item_id = scheduler.enqueue("a", "Flaky")
+    wait_until(lambda: len(scheduler.history("a")) == 2)
+
+    [failed] = scheduler.list_queue("a")
+    assert attempts == [item_id, item_id]
+    assert failed["status"] == STATUS_FAILED
+    assert failed["attempts"] == 2
+    assert failed["error"] == "upload refused"
+
+    # Retrying queues it again with a fresh budget
+    scheduler.publish = lambda item: {"id": "yt-1"}
+    assert scheduler.retry("a", item_id)
+    wait_until(lambda: scheduler.history("a")[0]["status"] == STATUS_PUBLISHED)
+    assert scheduler.list_queue("a") == []
+    assert scheduler.history("a")[0]["youtube_id"] == "yt-1"
+
+
+def test_run_batch_caps_calls_per_channel(tmp_path):
+    registry = ChannelRegistry(str(tmp_path / "channels.json"), str(tmp_path / "channels"),
+                               client_factory=lambda channel, cache, ledger: channel["id"])
+    registry.add_channel("busy")
+    registry.add_channel("quiet")
+
+    release = threading.Event()
+    lock = threading.Lock()
+    started = []
+
+    def job(client):
+        with lock:
+            started.append(client)
+        release.wait(5)
+        return client
+
+    futures = registry.run_batch({"busy": [job] * 6, "quiet": [job]}, max_workers=4, per_channel=2)
+    wait_until(lambda: len(started) == 3)
+    # The fourth worker finds "busy" at its cap and waits instead of taking a third call
+    time.sleep(0.1)
+    assert sorted(started) == ["busy", "busy", "quiet"]
+
+    release.set()
+    assert [future.result(timeout=5) for future in futures["busy"]] == ["busy"] * 6
+    assert futures["quiet"][0].result(timeout=5) == "quiet"
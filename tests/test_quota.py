@@ -0,0 +1,88 @@
+"""
+Quota ledger reserve and deferral tests, including deferred metadata updates against the local fake YouTube server
+"""
+
+import pickle
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from quota_ledger import QuotaLedger, QuotaBudgetExceeded
+from youtube_api_implementation import YouTubeAPIRefreshToken
+from fake_youtube_server import FakeYouTubeServer
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return QuotaLedger(str(tmp_path / "ledger.json"), daily_limit=200, upload_reserve=150)
+
+
+@pytest.fixture
+def server():
+    with FakeYouTubeServer() as fake:
+        yield fake
+
+
+@pytest.fixture
+def token_file(tmp_path):
+    path = tmp_path / "token.pickle"
+    with open(path, 'wb') as f:
+        pickle.dump(Credentials(token="fake-token"), f)
+    return str(path)
+
+
+def test_low_priority_calls_leave_the_upload_reserve(ledger):
+    ledger.reserve("videos.update", "low")
+    with pytest.raises(QuotaBudgetExceeded):
+        ledger.reserve("videos.list", "low")
+
+    # Uploads may spend the reserve
+    assert ledger.remaining("high") == 150
+    ledger.reserve("videos.list", "high")
+    assert ledger.remaining("low") == 0
+
+
+def test_refused_call_is_deferred_until_the_budget_allows_it(ledger):
+    ledger.reserve("videos.update", "low")
+    scheduler = ledger.scheduler()
+
+    def call():
+        ledger.reserve("videos.list", "low")
+        return "ran"
+
+    future = scheduler.submit("videos.list", call)
+    assert not future.done()
+    assert scheduler.pending() == 1
+
+    ledger.daily_limit = 300
+    scheduler.notify()
+
+    assert future.result(timeout=5) == "ran"
+    assert scheduler.pending() == 0
+
+
+def test_clients_share_one_scheduler_started_on_first_use(ledger):
+    first = YouTubeAPIRefreshToken(quota_ledger=ledger)
+    second = YouTubeAPIRefreshToken(quota_ledger=ledger)
+    assert ledger._scheduler is None
+
+    assert first.quota_scheduler is second.quota_scheduler
+    assert ledger._scheduler is not None
+
+
+def test_deferred_metadata_update_runs_once_quota_allows(server, token_file, ledger):
+    video_id = server.add_videos(1)[0]
+    api = YouTubeAPIRefreshToken(token_file=token_file, root_url=server.url, quota_ledger=ledger)
+    api.authenticate()
+    # Leave room for the lookup but not for the update
+    ledger.reserve("videos.list", "high", units=ledger.remaining("low") - 1)
+
+    result = api.update_videos_metadata([{"video_id": video_id, "title": "Later"}], defer=True)[0]
+    assert result["status"] == "deferred"
+    assert server.get_video(video_id)["snippet"]["title"] != "Later"
+
+    ledger.daily_limit += 100
+    ledger.scheduler().notify()
+
+    assert result["future"].result(timeout=5)["status"] == "updated"
+    assert server.get_video(video_id)["snippet"]["title"] == "Later"
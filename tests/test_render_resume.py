@@ -0,0 +1,81 @@
+"""
+Render resume tests for VideoAssembler and RenderManifest
+"""
+
+import os
+
+import pytest
+
+from video_assembly import VideoAssembler
+
+SCRIPT = {
+    "title": "Resume test",
+    "full_script": "Three facts",
+    "estimated_duration": 30,
+    "sections": [{"type": "fact", "text": f"Fact {i}", "duration": 10} for i in range(3)]
+}
+
+
+RENDER_SEGMENT = VideoAssembler._render_segment
+
+
+class Killed(Exception):
+    """Stands in for the process dying mid-render"""
+
+
+@pytest.fixture
+def assembler(tmp_path):
+    return VideoAssembler(output_dir=str(tmp_path / "output"), assets_dir=str(tmp_path / "assets"))
+
+
+def record_segments(monkeypatch, fail_at=None):
+    rendered = []
+
+    def render_segment(self, section, image, visual_style, path):
+        if section["text"] == fail_at:
+            raise Killed()
+        rendered.append(section["text"])
+        RENDER_SEGMENT(self, section, image, visual_style, path)
+
+    monkeypatch.setattr(VideoAssembler, "_render_segment", render_segment)
+    return rendered
+
+
+def test_resumed_render_skips_finished_segments(assembler, monkeypatch, tmp_path):
+    output_path = str(tmp_path / "output" / "video.mp4")
+    first = record_segments(monkeypatch, fail_at="Fact 1")
+    with pytest.raises(Killed):
+        assembler.create_video(SCRIPT, output_path, text_to_speech=False)
+    assert first == ["Fact 0"]
+    assert not os.path.exists(output_path)
+
+    second = record_segments(monkeypatch)
+    assembler.create_video(SCRIPT, output_path, text_to_speech=False)
+
+    assert second == ["Fact 1", "Fact 2"]
+    assert os.path.exists(output_path)
+    # The work directory goes once the output is in place
+    assert os.listdir(os.path.join(assembler.output_dir, ".render")) == []
+
+
+def test_changed_section_is_rendered_again(assembler, monkeypatch, tmp_path):
+    output_path = str(tmp_path / "output" / "video.mp4")
+    record_segments(monkeypatch, fail_at="Fact 2")
+    with pytest.raises(Killed):
+        assembler.create_video(SCRIPT, output_path, text_to_speech=False)
+
+    changed = dict(SCRIPT, sections=[dict(SCRIPT["sections"][0], text="Fact 0 revised")] + SCRIPT["sections"][1:])
+    rendered = record_segments(monkeypatch)
+    assembler.create_video(changed, output_path, text_to_speech=False)
+
+    # Different inputs are a different job, so nothing from the first run is reused
+    assert rendered == ["Fact 0 revised", "Fact 1", "Fact 2"]
+
+
+def test_same_inputs_to_different_outputs_use_separate_work_dirs(assembler, monkeypatch, tmp_path):
+    record_segments(monkeypatch, fail_at="Fact 1")
+    for name in ("a.mp4", "b.mp4"):
+        with pytest.raises(Killed):
+            assembler.create_video(SCRIPT, str(tmp_path / "output" / name), text_to_speech=False)
+
+    assert len(os.listdir(os.path.join(assembler.output_dir, ".render"))) == 2
@@ -0,0 +1,181 @@
+"""
+Resumable upload tests for YouTubeAPIRefreshToken against the local fake YouTube server
+"""
+
+import os
+import pickle
+
+import pytest
+from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
+
+import youtube_api_implementation
+from youtube_api_implementation import YouTubeAPIRefreshToken, RETRIABLE_EXCEPTIONS, UPLOAD_CHUNK_ALIGNMENT
+from fake_youtube_server import FakeYouTubeServer
+
+CHUNK_SIZE = UPLOAD_CHUNK_ALIGNMENT
+FILE_SIZE = 4 * CHUNK_SIZE
+
+
+class Interrupted(Exception):
+    """Stands in for a process dying mid-upload"""
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(youtube_api_implementation.time, "sleep", lambda seconds: None)
+
+
+@pytest.fixture
+def server():
+    with FakeYouTubeServer() as fake:
+        yield fake
+
+
+@pytest.fixture
+def token_file(tmp_path):
+    path = tmp_path / "token.pickle"
+    with open(path, 'wb') as f:
+        pickle.dump(Credentials(token="fake-token"), f)
+    return str(path)
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(os.urandom(FILE_SIZE))
+    return str(path)
+
+
+def make_client(server, token_file):
+    api = YouTubeAPIRefreshToken(token_file=token_file, root_url=server.url)
+    api.authenticate()
+    return api
+
+
+def test_upload_sends_every_chunk_once_and_reports_progress(server, token_file, video_file):
+    progress = []
+    response = make_client(server, token_file).upload_video(
+        video_file, "Title", "Description", chunk_size=CHUNK_SIZE,
+        progress_callback=lambda uploaded, total: progress.append((uploaded, total))
+    )
+
+    stats = server.stats()
+    assert server.get_video(response["id"])["snippet"]["title"] == "Title"
+    assert stats["upload_chunks"] == 4
+    assert stats["upload_bytes"] == FILE_SIZE
+    assert progress == [(CHUNK_SIZE * i, FILE_SIZE) for i in (1, 2, 3, 4)]
+    assert not os.path.exists(f"{video_file}.upload-session.json")
+
+
+def test_failed_chunks_are_retried(server, token_file, video_file):
+    retries = []
+
+    def fail_after_first_chunk(uploaded, total):
+        if uploaded == CHUNK_SIZE:
+            server.fail_next(2, status=503)
+
+    response = make_client(server, token_file).upload_video(
+        video_file, "Title", "Description", chunk_size=CHUNK_SIZE,
+        progress_callback=fail_after_first_chunk,
+        retry_callback=lambda retry, max_retries, error, delay: retries.append(retry)
+    )
+
+    stats = server.stats()
+    assert response["id"]
+    assert retries == [1, 2]
+    assert stats["upload_bytes"] == FILE_SIZE
+    assert stats["calls"]["videos.insert"] == 1
+
+
+def test_retries_give_up_after_max_retries(server, token_file, video_file):
+    server.fail_next(3, status=503)
+    with pytest.raises(HttpError) as error:
+        make_client(server, token_file).upload_video(video_file, "Title", "Description",
+                                                     chunk_size=CHUNK_SIZE, max_retries=2)
+    assert error.value.resp.status == 503
+
+
+def test_client_errors_are_not_retried(server, token_file, video_file):
+    server.fail_next(1, status=400)
+    retries = []
+    with pytest.raises(HttpError) as error:
+        make_client(server, token_file).upload_video(
+            video_file, "Title", "Description", chunk_size=CHUNK_SIZE,
+            retry_callback=lambda *args: retries.append(args)
+        )
+    assert error.value.resp.status == 400
+    assert retries == []
+
+
+def test_local_file_errors_are_not_retried(server, token_file, tmp_path):
+    assert not issubclass(FileNotFoundError, RETRIABLE_EXCEPTIONS)
+    assert not issubclass(PermissionError, RETRIABLE_EXCEPTIONS)
+    with pytest.raises(FileNotFoundError):
+        make_client(server, token_file).upload_video(str(tmp_path / "missing.mp4"), "Title", "Description")
+
+
+def test_interrupted_upload_resumes_from_committed_offset(server, token_file, video_file):
+    def interrupt_after_two_chunks(uploaded, total):
+        if uploaded == 2 * CHUNK_SIZE:
+            raise Interrupted()
+
+    with pytest.raises(Interrupted):
+        make_client(server, token_file).upload_video(video_file, "Title", "Description", chunk_size=CHUNK_SIZE,
+                                                     progress_callback=interrupt_after_two_chunks)
+    assert os.path.exists(f"{video_file}.upload-session.json")
+
+    # A new client, as after a restart, continues the saved session
+    progress = []
+    response = make_client(server, token_file).upload_video(
+        video_file, "Title", "Description", chunk_size=CHUNK_SIZE,
+        progress_callback=lambda uploaded, total: progress.append(uploaded)
+    )
+
+    stats = server.stats()
+    assert response["id"]
+    assert stats["calls"]["videos.insert"] == 1
+    assert stats["upload_bytes"] == FILE_SIZE
+    assert progress == [3 * CHUNK_SIZE, 4 * CHUNK_SIZE]
+    assert not os.path.exists(f"{video_file}.upload-session.json")
+
+
+def test_resume_query_is_retried(server, token_file, video_file):
+    def interrupt_after_first_chunk(uploaded, total):
+        if uploaded == CHUNK_SIZE:
+            raise Interrupted()
+
+    with pytest.raises(Interrupted):
+        make_client(server, token_file).upload_video(video_file, "Title", "Description", chunk_size=CHUNK_SIZE,
+                                                     progress_callback=interrupt_after_first_chunk)
+
+    server.fail_next(1, status=503)
+    retries = []
+    response = make_client(server, token_file).upload_video(
+        video_file, "Title", "Description", chunk_size=CHUNK_SIZE,
+        retry_callback=lambda retry, max_retries, error, delay: retries.append(retry)
+    )
+
+    assert response["id"]
+    assert retries == [1]
+    assert server.stats()["upload_bytes"] == FILE_SIZE
+
+
+def test_expired_session_starts_a_fresh_upload(server, token_file, video_file):
+    def interrupt_after_first_chunk(uploaded, total):
+        if uploaded == CHUNK_SIZE:
+            raise Interrupted()
+
+    with pytest.raises(Interrupted):
+        make_client(server, token_file).upload_video(video_file, "Title", "Description", chunk_size=CHUNK_SIZE,
+                                                     progress_callback=interrupt_after_first_chunk)
+    # The server forgets the session, as YouTube does after about a week
+    server._sessions.clear()
+
+    response = make_client(server, token_file).upload_video(video_file, "Title", "Description",
+                                                            chunk_size=CHUNK_SIZE)
+
+    stats = server.stats()
+    assert response["id"]
+    assert stats["calls"]["videos.insert"] == 2
+    assert stats["uploads_completed"] == 1
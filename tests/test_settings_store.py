@@ -0,0 +1,90 @@
+"""
+SettingsStore tests: update() validation and reloading the file when its modification time changes
+"""
+
+import json
+import os
+
+import pytest
+
+from settings_store import SettingsStore
+
+
+@pytest.fixture
+def settings_file(tmp_path):
+    return str(tmp_path / "settings.json")
+
+
+def write_settings(path, data, mtime_ns):
+    with open(path, 'w') as f:
+        json.dump(data, f)
+    # Set the time explicitly; back-to-back writes can share a coarse filesystem timestamp
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.mark.parametrize("values", [
+    {"video_length": 45},
+    {"video_length": "180"},
+    {"fact_quality": 11},
+    {"publish_time": "25:00"},
+    {"publish_days": ["Funday"]},
+    {"publishing_schedule": "Whenever"},
+    {"not_a_field": 1},
+])
+def test_update_rejects_invalid_values_and_keeps_the_file(settings_file, values):
+    store = SettingsStore(settings_file)
+    store.update("workflow", video_length=240)
+
+    with pytest.raises(ValueError, match="Invalid workflow settings"):
+        store.update("workflow", default_fact_count=20, **values)
+
+    # Nothing from the rejected update is applied, not even the valid field
+    assert store.get().workflow.default_fact_count == 10
+    with open(settings_file) as f:
+        assert json.load(f)["workflow"]["video_length"] == 240
+
+
+def test_update_saves_and_coerces_values(settings_file):
+    store = SettingsStore(settings_file)
+    settings = store.update("workflow", publish_days=["Monday"], default_fact_count=12.0)
+
+    assert settings.workflow.publish_days == ("Monday",)
+    assert settings.workflow.default_fact_count == 12
+    assert SettingsStore(settings_file).get().workflow.publish_days == ("Monday",)
+
+
+def test_changes_to_the_file_are_reloaded_by_mtime(settings_file):
+    store = SettingsStore(settings_file, check_interval=0)
+    write_settings(settings_file, {"workflow": {"video_length": 300}}, 1_000_000_000_000_000_000)
+    assert store.get().workflow.video_length == 300
+
+    # Same mtime: the file isn't parsed again
+    write_settings(settings_file, {"workflow": {"video_length": 120}}, 1_000_000_000_000_000_000)
+    assert store.get().workflow.video_length == 300
+
+    write_settings(settings_file, {"workflow": {"video_length": 120, "fact_quality": 99}},
+                   2_000_000_000_000_000_000)
+    workflow = store.get().workflow
+    assert workflow.video_length == 120
+    # An out-of-range value in the file keeps the field's default
+    assert workflow.fact_quality == 7
+
+
+def test_unparseable_file_keeps_the_last_good_settings(settings_file):
+    store = SettingsStore(settings_file, check_interval=0)
+    write_settings(settings_file, {"system": {"max_storage_gb": 50}}, 1_000_000_000_000_000_000)
+    assert store.get().system.max_storage_gb == 50
+
+    with open(settings_file, 'w') as f:
+        f.write("{not json")
+    os.utime(settings_file, ns=(2_000_000_000_000_000_000, 2_000_000_000_000_000_000))
+    assert store.get().system.max_storage_gb == 50
+
+
+def test_check_interval_limits_mtime_checks(settings_file):
+    store = SettingsStore(settings_file, check_interval=3600)
+    write_settings(settings_file, {"workflow": {"video_length": 300}}, 1_000_000_000_000_000_000)
+    assert store.get().workflow.video_length == 300
+
+    write_settings(settings_file, {"workflow": {"video_length": 120}}, 2_000_000_000_000_000_000)
+    assert store.get().workflow.video_length == 300
@@ -0,0 +1,84 @@
+"""
+TaskRunner tests: persistence across restarts, pruning and cancellation
+"""
+
+import json
+import time
+import threading
+
+from task_runner import TaskRunner, STATUS_FAILED, STATUS_SUCCEEDED, STATUS_CANCELLED, STATUS_QUEUED
+
+
+def wait_for(runner, task_id, status):
+    for _ in range(200):
+        task = runner.get(task_id)
+        if task and task["status"] == status:
+            return task
+        time.sleep(0.01)
+    raise AssertionError(f"Task {task_id} never reached {status}")
+
+
+def write_tasks(path, tasks):
+    with open(path, 'w') as f:
+        json.dump(tasks, f)
+
+
+def make_task(task_id, owner, status, created_at, updated_at=None):
+    return {"id": task_id, "owner": owner, "kind": "test", "label": task_id, "status": status,
+            "progress": 0.0, "message": None, "result": None, "error": None,
+            "created_at": created_at, "updated_at": updated_at or created_at}
+
+
+def test_interrupted_tasks_are_failed_on_load(tmp_path):
+    tasks_file = str(tmp_path / "tasks.json")
+    now = "2099-01-01T00:00:00"
+    write_tasks(tasks_file, [make_task("queued", "a", "queued", now),
+                             make_task("running", "a", "running", now),
+                             make_task("done", "a", STATUS_SUCCEEDED, now)])
+
+    runner = TaskRunner(tasks_file)
+
+    assert runner.get("queued")["status"] == STATUS_FAILED
+    assert runner.get("running")["error"] == "Interrupted by a restart"
+    assert runner.get("done")["status"] == STATUS_SUCCEEDED
+
+
+def test_finished_tasks_are_pruned_per_owner(tmp_path):
+    runner = TaskRunner(str(tmp_path / "tasks.json"), keep_finished=2)
+    ids = []
+    for i in range(4):
+        ids.append(runner.submit("a", "test", f"task {i}", lambda progress: i)["id"])
+        wait_for(runner, ids[-1], STATUS_SUCCEEDED)
+    other = runner.submit("b", "test", "other", lambda progress: None)["id"]
+    wait_for(runner, other, STATUS_SUCCEEDED)
+
+    # The newest submit prunes before its own task finishes, so two finished plus it remain
+    assert [task["id"] for task in runner.list_tasks("a")] == ids[:0:-1]
+    assert runner.get(other) is not None
+
+
+def test_finished_tasks_are_capped_across_owners_and_expire(tmp_path):
+    tasks_file = str(tmp_path / "tasks.json")
+    write_tasks(tasks_file, [make_task("old", "a", STATUS_SUCCEEDED, "2000-01-01T00:00:00")]
+                + [make_task(f"t{i}", f"owner{i}", STATUS_SUCCEEDED, f"2099-01-01T00:00:0{i}") for i in range(5)])
+
+    runner = TaskRunner(tasks_file, max_finished=3)
+
+    assert runner.get("old") is None
+    assert sorted(task["id"] for task in runner.list_tasks()) == ["t2", "t3", "t4"]
+
+
+def test_cancel_only_affects_tasks_that_have_not_started(tmp_path):
+    runner = TaskRunner(str(tmp_path / "tasks.json"), max_workers=1)
+    release = threading.Event()
+    running = runner.submit("a", "test", "blocking", lambda progress: release.wait(5))
+    queued = runner.submit("a", "test", "queued", lambda progress: None)
+    wait_for(runner, running["id"], "running")
+
+    assert runner.get(queued["id"])["status"] == STATUS_QUEUED
+    assert runner.cancel(queued["id"])
+    assert not runner.cancel(running["id"])
+    release.set()
+
+    wait_for(runner, running["id"], STATUS_SUCCEEDED)
+    assert runner.get(queued["id"])["status"] == STATUS_CANCELLED
@@ -0,0 +1,36 @@
+"""
+Overlay cache tests: reloaded tiles map the saved planes and composite like fresh ones
+"""
+
+import numpy as np
+
+from text_overlay import OverlayCache, composite
+
+FRAME_SIZE = (320, 180)
+
+
+def test_reloaded_tile_is_a_memory_mapped_view(tmp_path):
+    fresh = OverlayCache(str(tmp_path)).get("Did you know?", "standard", FRAME_SIZE)
+    reloaded = OverlayCache(str(tmp_path)).get("Did you know?", "standard", FRAME_SIZE)
+
+    assert isinstance(reloaded.planes, np.memmap)
+    assert np.shares_memory(reloaded.premultiplied, reloaded.planes)
+    assert np.shares_memory(reloaded.inverse_alpha, reloaded.planes)
+    assert reloaded.position == fresh.position
+
+    frame = np.full((FRAME_SIZE[1], FRAME_SIZE[0], 3), 90, dtype=np.uint8)
+    assert np.array_equal(composite(frame.copy(), fresh), composite(frame.copy(), reloaded))
+
+
+def test_composite_matches_straight_alpha_blend():
+    tile = OverlayCache().get("Hello", "vibrant", FRAME_SIZE)
+    frame = np.random.default_rng(0).integers(0, 256, (FRAME_SIZE[1], FRAME_SIZE[0], 3), dtype=np.uint8)
+    result = composite(frame.copy(), tile)
+
+    x, y = tile.position
+    width, height = tile.size
+    alpha = 255 - tile.inverse_alpha.astype(np.float64)
+    colour = np.divide(tile.premultiplied, alpha, out=np.zeros(tile.premultiplied.shape), where=alpha > 0)
+    region = frame[y:y + height, x:x + width].astype(np.float64)
+    expected = (colour * alpha + region * (255 - alpha)) / 255
+    assert np.abs(result[y:y + height, x:x + width] - expected).max() <= 1
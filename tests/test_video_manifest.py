@@ -0,0 +1,32 @@
+"""
+VideoManifest tests: lookups across reopen and fsync of the last batch
+"""
+
+import time
+
+from video_manifest import VideoManifest
+
+
+def test_last_batch_is_synced_after_appends_stop(tmp_path):
+    manifest = VideoManifest(str(tmp_path), fsync_every=100, fsync_interval=0.05)
+    manifest.append({"video_id": "a", "title": "A"})
+    assert manifest._pending == 1
+
+    for _ in range(100):
+        if manifest._pending == 0:
+            break
+        time.sleep(0.01)
+    assert manifest._pending == 0
+    manifest.close()
+
+
+def test_records_survive_close_and_reopen(tmp_path):
+    manifest = VideoManifest(str(tmp_path), fsync_every=100, fsync_interval=60)
+    manifest.append({"video_id": "a", "title": "A"})
+    manifest.append({"video_id": "a", "title": "A2"})
+    manifest.close()
+
+    reopened = VideoManifest(str(tmp_path))
+    assert reopened.get("a")["title"] == "A2"
+    assert len(reopened) == 1
+    reopened.close()
@@ -0,0 +1,321 @@
+"""
+Text Overlay Module for YouTube Automation
+Rasterizes text overlays once per (text, style, size) and composites cached tiles onto frames
+"""
+
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+# Overlay presets for the styles offered by VideoAssembler.get_available_styles
+STYLE_PRESETS: Dict[str, Dict[str, Any]] = {
+    "standard": {
+        "font_scale": 0.055,
+        "text_color": (255, 255, 255, 255),
+        "stroke_color": (0, 0, 0, 255),
+        "stroke_ratio": 0.06,
+        "box_color": (0, 0, 0, 140),
+        "max_width_ratio": 0.8,
+        "position": "bottom"
+    },
+    "minimal": {
+        "font_scale": 0.045,
+        "text_color": (255, 255, 255, 255),
+        "stroke_color": None,
+        "stroke_ratio": 0.0,
+        "box_color": None,
+        "max_width_ratio": 0.7,
+        "position": "center"
+    },
+    "vibrant": {
+        "font_scale": 0.07,
+        "text_color": (255, 221, 0, 255),
+        "stroke_color": (180, 0, 90, 255),
+        "stroke_ratio": 0.1,
+        "box_color": None,
+        "max_width_ratio": 0.85,
+        "position": "center"
+    },
+    "educational": {
+        "font_scale": 0.05,
+        "text_color": (20, 20, 20, 255),
+        "stroke_color": None,
+        "stroke_ratio": 0.0,
+        "box_color": (255, 255, 255, 220),
+        "max_width_ratio": 0.75,
+        "position": "top"
+    }
+}
+
+FONT_CANDIDATES = [
+    "DejaVuSans-Bold.ttf",
+    "Arial Bold.ttf",
+    "arialbd.ttf",
+    "LiberationSans-Bold.ttf"
+]
+
+
+class OverlayTile:
+    """
+    A rasterized overlay ready for compositing
+
+    Holds a single uint16 ``planes`` array: three premultiplied colour planes
+    followed by the inverse alpha plane, so compositing a frame is two
+    integer multiplies and an add. The cache file stores the same layout,
+    so a reloaded tile is a view of the memory map rather than a copy.
+    """
+
+    def __init__(self, planes: np.ndarray, position: Tuple[int, int]):
+        self.planes = planes
+        self.position = position
+        self.premultiplied = planes[..., :3]
+        self.inverse_alpha = planes[..., 3:]
+
+    @classmethod
+    def from_rgba(cls, rgba: np.ndarray, position: Tuple[int, int]) -> "OverlayTile":
+        """Build a tile from straight-alpha RGBA pixels"""
+        planes = np.empty(rgba.shape[:2] + (4,), dtype=np.uint16)
+        alpha = rgba[..., 3:4]
+        np.multiply(rgba[..., :3], alpha, out=planes[..., :3], dtype=np.uint16)
+        np.subtract(255, alpha, out=planes[..., 3:], dtype=np.uint16)
+        return cls(planes, position)
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Tile (width, height)"""
+        return self.planes.shape[1], self.planes.shape[0]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the tile"""
+        return self.planes.nbytes
+
+
+class OverlayCache:
+    """
+    Cache of rasterized text overlay tiles
+
+    Glyphs for a given (text, style, frame size) are drawn once with Pillow;
+    every later frame reuses the tile. Tiles live in an in-memory LRU bounded
+    by ``max_bytes`` and, if ``cache_dir`` is given, their compositing planes
+    are also saved as ``.npy`` files that are memory-mapped on reload, so they
+    survive restarts and are shared between render processes.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the OverlayCache
+
+        Args:
+            cache_dir: Optional directory for memory-mapped tile files
+            max_bytes: Memory budget for in-memory tiles
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._tiles: "OrderedDict[str, OverlayTile]" = OrderedDict()
+        self._bytes = 0
+        self._fonts: Dict[int, Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _key(self, text: str, style: str, frame_size: Tuple[int, int]) -> str:
+        """Build the cache key for an overlay"""
+        raw = f"{style}\x00{frame_size[0]}x{frame_size[1]}\x00{text}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def _font(self, size: int):
+        """Load the overlay font at a pixel size, falling back to Pillow's default"""
+        font = self._fonts.get(size)
+        if font is None:
+            for candidate in FONT_CANDIDATES:
+                try:
+                    font = ImageFont.truetype(candidate, size)
+                    break
+                except OSError:
+                    continue
+            else:
+                try:
+                    font = ImageFont.load_default(size=size)
+                except TypeError:
+                    # Pillow < 10.1 has no sized default font
+                    font = ImageFont.load_default()
+            self._fonts[size] = font
+        return font
+
+    def _wrap(self, draw, text: str, font, max_width: int) -> List[str]:
+        """Break text into lines that fit max_width"""
+        lines = []
+        for paragraph in text.splitlines() or [""]:
+            line = ""
+            for word in paragraph.split():
+                candidate = f"{line} {word}".strip()
+                if line and draw.textlength(candidate, font=font) > max_width:
+                    lines.append(line)
+                    line = word
+                else:
+                    line = candidate
+            lines.append(line)
+        return lines
+
+    def rasterize(self, text: str, style: str, frame_size: Tuple[int, int]) -> OverlayTile:
+        """
+        Draw a text overlay into a new RGBA tile
+
+        Args:
+            text: Overlay text
+            style: Style preset name
+            frame_size: (width, height) of the frames the tile is composited onto
+
+        Returns:
+            Rasterized tile positioned for the frame
+        """
+        preset = STYLE_PRESETS.get(style, STYLE_PRESETS["standard"])
+        frame_width, frame_height = frame_size
+        font_size = max(12, int(frame_height * preset["font_scale"]))
+        font = self._font(font_size)
+        stroke_width = int(font_size * preset["stroke_ratio"])
+        padding = font_size // 2
+
+        measure = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+        lines = self._wrap(measure, text, font, int(frame_width * preset["max_width_ratio"]))
+        line_height = int(font_size * 1.25) + 2 * stroke_width
+        text_width = max(int(measure.textlength(line, font=font)) for line in lines) + 2 * stroke_width
+        width = min(frame_width, text_width + 2 * padding)
+        height = min(frame_height, line_height * len(lines) + 2 * padding)
+
+        image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        if preset["box_color"]:
+            draw.rounded_rectangle((0, 0, width - 1, height - 1), radius=padding // 2, fill=preset["box_color"])
+        y = padding
+        for line in lines:
+            x = (width - int(draw.textlength(line, font=font))) // 2
+            draw.text((x, y), line, font=font, fill=preset["text_color"],
+                      stroke_width=stroke_width, stroke_fill=preset["stroke_color"])
+            y += line_height
+
+        x = (frame_width - width) // 2
+        if preset["position"] == "top":
+            y = int(frame_height * 0.08)
+        elif preset["position"] == "bottom":
+            y = frame_height - height - int(frame_height * 0.08)
+        else:
+            y = (frame_height - height) // 2
+        return OverlayTile.from_rgba(np.asarray(image, dtype=np.uint8), (x, max(0, y)))
+
+    def get(self, text: str, style: str, frame_size: Tuple[int, int]) -> OverlayTile:
+        """
+        Get the overlay tile for a text, rasterizing it on first use
+
+        Args:
+            text: Overlay text
+            style: Style preset name
+            frame_size: (width, height) of the target frames
+
+        Returns:
+            Cached or newly rasterized tile
+        """
+        key = self._key(text, style, frame_size)
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._tiles.move_to_end(key)
+                self.hits += 1
+                return tile
+            self.misses += 1
+
+        tile = self._load(key)
+        if tile is None:
+            tile = self.rasterize(text, style, frame_size)
+            self._save(key, tile)
+
+        with self._lock:
+            if key not in self._tiles:
+                self._tiles[key] = tile
+                self._bytes += tile.nbytes
+                while self._bytes > self.max_bytes and len(self._tiles) > 1:
+                    _, evicted = self._tiles.popitem(last=False)
+                    self._bytes -= evicted.nbytes
+        return tile
+
+    def _tile_path(self, key: str) -> str:
+        """Get the path of a memory-mapped tile file"""
+        return os.path.join(self.cache_dir, f"{key}.planes.npy")
+
+    def _load(self, key: str) -> Optional[OverlayTile]:
+        """Load a tile saved by an earlier run"""
+        if not self.cache_dir:
+            return None
+        path = self._tile_path(key)
+        position_path = f"{path}.pos"
+        if not os.path.exists(path) or not os.path.exists(position_path):
+            return None
+        try:
+            planes = np.load(path, mmap_mode='r')
+            with open(position_path, 'r') as f:
+                x, y = (int(v) for v in f.read().split(','))
+        except (OSError, ValueError):
+            return None
+        if planes.dtype != np.uint16 or planes.ndim != 3 or planes.shape[2] != 4:
+            return None
+        return OverlayTile(planes, (x, y))
+
+    def _save(self, key: str, tile: OverlayTile):
+        """Persist a tile for reuse across runs"""
+        if not self.cache_dir:
+            return
+        path = self._tile_path(key)
+        tmp_path = f"{path}.tmp.npy"
+        np.save(tmp_path, tile.planes)
+        os.replace(tmp_path, path)
+        with open(f"{path}.pos", 'w') as f:
+            f.write(f"{tile.position[0]},{tile.position[1]}")
+
+    def clear(self):
+        """Drop all in-memory tiles"""
+        with self._lock:
+            self._tiles.clear()
+            self._bytes = 0
+
+
+def composite(frame: np.ndarray, tile: OverlayTile, position: Optional[Tuple[int, int]] = None) -> np.ndarray:
+    """
+    Alpha-blend an overlay tile onto an RGB frame in place
+
+    Args:
+        frame: uint8 array of shape (height, width, 3)
+        tile: Overlay tile from OverlayCache
+        position: Top-left corner; defaults to the tile's preset position
+
+    Returns:
+        The same frame array
+    """
+    x, y = position if position is not None else tile.position
+    tile_width, tile_height = tile.size
+    frame_height, frame_width = frame.shape[:2]
+
+    # Clip the tile to the frame
+    x0, y0 = max(0, x), max(0, y)
+    x1, y1 = min(frame_width, x + tile_width), min(frame_height, y + tile_height)
+    if x0 >= x1 or y0 >= y1:
+        return frame
+    tx0, ty0 = x0 - x, y0 - y
+    tx1, ty1 = tx0 + (x1 - x0), ty0 + (y1 - y0)
+
+    region = frame[y0:y1, x0:x1]
+    blended = region * tile.inverse_alpha[ty0:ty1, tx0:tx1]
+    blended += tile.premultiplied[ty0:ty1, tx0:tx1]
+    # Divide by 255 with rounding: (v + 128 + ((v + 128) >> 8)) >> 8
+    blended += 128
+    blended += blended >> 8
+    region[...] = blended >> 8
+    return frame
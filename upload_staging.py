@@ -0,0 +1,148 @@
+"""
+Upload Staging Module for YouTube Automation
+Streams user-supplied video files to disk once, named by content hash
+"""
+
+import os
+import time
+import uuid
+import hashlib
+import threading
+from typing import BinaryIO, Dict, Optional
+
+# Bytes copied per read; bounds memory used while staging
+STAGING_CHUNK_SIZE = 1024 * 1024
+
+# Sidecar touched when a staged file is reused. The staged file's own mtime is left alone,
+# because it is part of the resumable upload session key
+LAST_USED_SUFFIX = ".last-used"
+UPLOAD_SESSION_SUFFIX = ".upload-session.json"
+
+
+class UploadStaging:
+    """
+    Managed directory of staged upload files
+
+    ``stage()`` copies a file-like object to disk in ``STAGING_CHUNK_SIZE``
+    chunks while hashing it, then names the file after its SHA-256. The
+    same content is therefore stored once, however often it is staged, and
+    keeps the same path and mtime. The resumable uploader's session file
+    sits next to it, so an interrupted upload of the same video resumes.
+
+    Each ``stage()`` takes a reference to the file and ``release()`` drops
+    it; the file is deleted when the last reference is released. Files whose
+    references were lost (e.g. across a restart) are left to ``cleanup()``.
+    """
+
+    def __init__(self, staging_dir: str, max_age: float = 24 * 3600):
+        """
+        Initialize the UploadStaging
+
+        Args:
+            staging_dir: Directory for staged files
+            max_age: Seconds after which cleanup() removes a staged file
+        """
+        self.staging_dir = staging_dir
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._refs: Dict[str, int] = {}
+
+    def stage(self, source: BinaryIO, filename: str) -> str:
+        """
+        Stream a file-like object into the staging area
+
+        Args:
+            source: Readable binary file object, read from its start
+            filename: Original file name (its extension is kept)
+
+        Returns:
+            Path of the staged file
+        """
+        os.makedirs(self.staging_dir, exist_ok=True)
+        extension = os.path.splitext(filename)[1].lower()
+        tmp_path = os.path.join(self.staging_dir, f".{uuid.uuid4().hex}.part")
+        digest = hashlib.sha256()
+        if hasattr(source, "seek"):
+            source.seek(0)
+        try:
+            with open(tmp_path, 'wb') as f:
+                while True:
+                    chunk = source.read(STAGING_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    f.write(chunk)
+            path = os.path.join(self.staging_dir, f"{digest.hexdigest()[:32]}{extension}")
+            with self._lock:
+                if os.path.exists(path):
+                    # Already staged; mark it used so cleanup keeps it
+                    os.remove(tmp_path)
+                    with open(f"{path}{LAST_USED_SUFFIX}", 'a'):
+                        pass
+                    os.utime(f"{path}{LAST_USED_SUFFIX}")
+                else:
+                    os.replace(tmp_path, path)
+                self._refs[path] = self._refs.get(path, 0) + 1
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return path
+
+    def release(self, path: str):
+        """
+        Drop a reference to a staged file
+
+        The file, its upload session and its last-used marker are removed
+        once no other stage() of the same content holds it.
+        """
+        with self._lock:
+            refs = self._refs.get(path, 0)
+            if refs > 1:
+                self._refs[path] = refs - 1
+                return
+            self._refs.pop(path, None)
+            if refs == 0:
+                # Not staged by this instance; another one may still use it
+                return
+            self._remove(path)
+
+    def _remove(self, path: str):
+        """Remove a staged file with its sidecars"""
+        for candidate in (path, f"{path}{UPLOAD_SESSION_SUFFIX}", f"{path}{LAST_USED_SUFFIX}"):
+            if os.path.exists(candidate):
+                os.remove(candidate)
+
+    def cleanup(self, max_age: Optional[float] = None) -> int:
+        """
+        Remove staged files older than max_age
+
+        Args:
+            max_age: Age in seconds; defaults to the instance's max_age
+
+        Returns:
+            Number of files removed
+        """
+        if not os.path.isdir(self.staging_dir):
+            return 0
+        cutoff = time.time() - (self.max_age if max_age is None else max_age)
+        removed = 0
+        for name in os.listdir(self.staging_dir):
+            if name.endswith(LAST_USED_SUFFIX) or name.endswith(UPLOAD_SESSION_SUFFIX):
+                # Sidecars go with their staged file
+                continue
+            path = os.path.join(self.staging_dir, name)
+            try:
+                if not os.path.isfile(path):
+                    continue
+                last_used = os.path.getmtime(path)
+                if os.path.exists(f"{path}{LAST_USED_SUFFIX}"):
+                    last_used = max(last_used, os.path.getmtime(f"{path}{LAST_USED_SUFFIX}"))
+                with self._lock:
+                    if last_used >= cutoff or self._refs.get(path):
+                        continue
+                    self._remove(path)
+                removed += 1
+            except OSError:
+                continue
+        return removed
@@ -5,25 +5,74 @@ Creates videos from scripts and assets
 
 import os
 import json
-from typing import Dict, Any, List, Optional
+import shutil
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import random
 
+from render_manifest import RenderManifest, hash_inputs
+from video_manifest import VideoManifest
+
+# Visual styles offered for videos
+VIDEO_STYLES = [
+    {
+        "name": "standard",
+        "description": "Clean, professional look with subtle animations"
+    },
+    {
+        "name": "minimal",
+        "description": "Simple, text-focused design with minimal distractions"
+    },
+    {
+        "name": "vibrant",
+        "description": "Colorful, energetic style with bold text and animations"
+    },
+    {
+        "name": "educational",
+        "description": "Focused on clarity with diagrams and explanatory elements"
+    }
+]
+
+# Tracks listed when the music folder is empty
+PLACEHOLDER_MUSIC = [
+    {
+        "name": "Upbeat",
+        "path": "placeholder_upbeat.mp3",
+        "description": "Energetic and positive background music"
+    },
+    {
+        "name": "Calm",
+        "path": "placeholder_calm.mp3",
+        "description": "Relaxing and peaceful background music"
+    },
+    {
+        "name": "Mysterious",
+        "path": "placeholder_mysterious.mp3",
+        "description": "Intriguing and curious background music"
+    }
+]
+
 class VideoAssembler:
     """
     Assembles videos from scripts and assets
     """
     
-    def __init__(self, output_dir: str = "output", assets_dir: str = "assets"):
+    def __init__(self, output_dir: str = "output", assets_dir: str = "assets",
+                 manifest: Optional[VideoManifest] = None):
         """
         Initialize the VideoAssembler
         
         Args:
             output_dir: Directory to save output videos
             assets_dir: Directory containing assets (images, music)
+            manifest: Optional VideoManifest; when set, script and metadata are
+                appended to it instead of written as per-video files
         """
         self.output_dir = output_dir
         self.assets_dir = assets_dir
+        self.manifest = manifest
+        self._overlay_cache = None
+        self._music_catalog = None
         
         # Create directories if they don't exist
         os.makedirs(output_dir, exist_ok=True)
@@ -50,36 +99,220 @@ class VideoAssembler:
             text_to_speech: Whether to generate speech from text
             visual_style: Visual style preset ("standard", "minimal", "vibrant")
             **kwargs: Additional video settings to override defaults
+                (resume=False discards any saved render progress,
+                resolution=(width, height) sets the output frame size)
             
         Returns:
             Path to the created video file
         """
+        record = self._build_record(script_data, output_path, background_images,
+                                    background_music, visual_style, kwargs.get('resolution'))
+        if self.manifest is not None:
+            # Manifest mode: one compact record instead of two files per video
+            self.manifest.append(record)
+        else:
+            script_file_path, metadata_file_path = self._write_record_files(record, output_path)
+        
+        # Render segments, audio tracks and the final mux, resuming finished steps
+        self._render(script_data, output_path, background_images, background_music,
+                     text_to_speech, visual_style, resume=kwargs.get('resume', True))
+        
+        if self.manifest is not None:
+            print(f"Video metadata and script recorded in manifest: {record['video_id']}")
+        else:
+            print(f"Video metadata and script created at: {metadata_file_path} and {script_file_path}")
+        print(f"Video placeholder created at: {output_path}")
+        print("Note: For actual video generation, implement MoviePy or FFmpeg integration")
+        
+        return output_path
+    
+    def _build_record(self,
+                      script_data: Dict[str, Any],
+                      output_path: str,
+                      background_images: Optional[List[str]],
+                      background_music: Optional[str],
+                      visual_style: str,
+                      resolution: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+        """Build the script and metadata record for a video"""
+        return {
+            "video_id": os.path.splitext(os.path.basename(output_path))[0],
+            "video_path": output_path,
+            "title": script_data.get('title', 'Untitled Video'),
+            "full_script": script_data.get('full_script', script_data.get('content', 'No script content')),
+            "sections": script_data.get('sections', []),
+            "style": visual_style,
+            "resolution": list(resolution or (1920, 1080)),
+            "background_music": background_music,
+            "background_images": background_images,
+            "estimated_duration": script_data.get('estimated_duration', 60),
+            "creation_timestamp": datetime.now().isoformat()
+        }
+    
+    def _write_record_files(self, record: Dict[str, Any], output_path: str):
+        """
+        Write the human-readable script and metadata files for a video record
+        
+        Returns:
+            Tuple of (script file path, metadata file path)
+        """
         # Create a more detailed text file with the script content
         script_file_path = output_path.replace('.mp4', '_script.txt')
         with open(script_file_path, 'w') as f:
-            f.write(f"Video Script: {script_data.get('title', 'Untitled Video')}\n\n")
-            f.write(f"Duration: {script_data.get('estimated_duration', 60)} seconds\n\n")
+            f.write(f"Video Script: {record['title']}\n\n")
+            f.write(f"Duration: {record['estimated_duration']} seconds\n\n")
             f.write("Full Script:\n\n")
-            f.write(script_data.get('full_script', script_data.get('content', 'No script content')))
+            f.write(record['full_script'])
             f.write("\n\nSections:\n")
-            for section in script_data.get('sections', []):
+            for section in record['sections']:
                 f.write(f"- {section.get('type', 'SECTION').upper()} ({section.get('duration', 10)}s): {section.get('text', '')[:100]}...\n")
         
         # Create a JSON file with video metadata for future processing
         metadata_file_path = output_path.replace('.mp4', '_metadata.json')
         with open(metadata_file_path, 'w') as f:
             json.dump({
-                "title": script_data.get('title', 'Untitled Video'),
-                "sections": script_data.get('sections', []),
-                "style": visual_style,
-                "background_music": background_music,
-                "background_images": background_images,
-                "estimated_duration": script_data.get('estimated_duration', 60),
-                "creation_timestamp": datetime.now().isoformat()
+                "title": record['title'],
+                "sections": record['sections'],
+                "style": record['style'],
+                "resolution": record.get('resolution'),
+                "background_music": record['background_music'],
+                "background_images": record['background_images'],
+                "estimated_duration": record['estimated_duration'],
+                "creation_timestamp": record['creation_timestamp']
             }, f, indent=2)
         
+        return script_file_path, metadata_file_path
+    
+    def export_video_files(self, video_id: str, output_path: Optional[str] = None):
+        """
+        Export the script and metadata files for a video stored in the manifest
+        
+        Args:
+            video_id: Id of the video in the manifest
+            output_path: Video path the files are named after (defaults to the
+                path recorded in the manifest)
+            
+        Returns:
+            Tuple of (script file path, metadata file path)
+        """
+        if self.manifest is None:
+            raise ValueError("Manifest mode is not enabled for this VideoAssembler")
+        record = self.manifest.get(video_id)
+        if record is None:
+            raise ValueError(f"Video not found in manifest: {video_id}")
+        return self._write_record_files(record, output_path or record['video_path'])
+    
+    def _render(self,
+                script_data: Dict[str, Any],
+                output_path: str,
+                background_images: Optional[List[str]],
+                background_music: Optional[str],
+                text_to_speech: bool,
+                visual_style: str,
+                resume: bool = True) -> RenderManifest:
+        """
+        Run the render steps for a video, skipping steps a previous run finished
+        
+        Progress is kept in a per-job manifest under ``<output_dir>/.render/<job_id>``,
+        where the job id hashes the render inputs and the output path, so videos
+        sharing a file name never share progress and two renders of the same
+        inputs to different files never share (or delete) a work directory. Every step records the hash of its inputs
+        and of its output, and the mux inputs include the segment and audio hashes,
+        so a changed or damaged segment is re-rendered and the final video re-muxed.
+        The work directory is deleted once the output file is in place.
+        
+        Returns:
+            The manifest of the finished job
+        """
+        sections = script_data.get('sections', [])
+        job_hash = hash_inputs(script_data.get('full_script', script_data.get('content', '')),
+                               sections, background_images, background_music,
+                               text_to_speech, visual_style)
+        job_id = hash_inputs(job_hash, os.path.abspath(output_path))[:16]
+        work_dir = os.path.join(self.output_dir, ".render", job_id)
+        os.makedirs(work_dir, exist_ok=True)
+        
+        manifest = RenderManifest(os.path.join(work_dir, "manifest.json"), job_id, job_hash)
+        if not resume:
+            manifest.reset()
+        
+        def run_step(step, step_path, inputs_hash, render_fn):
+            if manifest.is_complete(step, inputs_hash):
+                return manifest.get_output_hash(step)
+            render_fn(step_path)
+            return manifest.mark_complete(step, step_path, inputs_hash)
+        
+        # Video segments, one per script section
+        segment_paths = []
+        segment_hashes = []
+        for i, section in enumerate(sections):
+            image = background_images[i % len(background_images)] if background_images else None
+            step_path = os.path.join(work_dir, f"segment_{i:03d}.part")
+            inputs_hash = hash_inputs(section, image, visual_style)
+            segment_hashes.append(run_step(
+                f"segment_{i:03d}", step_path, inputs_hash,
+                lambda path, section=section, image=image: self._render_segment(section, image, visual_style, path)
+            ))
+            segment_paths.append(step_path)
+        
+        # Audio tracks
+        audio_paths = []
+        audio_hashes = []
+        if text_to_speech:
+            step_path = os.path.join(work_dir, "narration.part")
+            audio_hashes.append(run_step(
+                "audio_narration", step_path, hash_inputs(sections),
+                lambda path: self._render_narration(sections, path)
+            ))
+            audio_paths.append(step_path)
+        if background_music:
+            step_path = os.path.join(work_dir, "music.part")
+            audio_hashes.append(run_step(
+                "audio_music", step_path,
+                hash_inputs(background_music, script_data.get('estimated_duration', 60)),
+                lambda path: self._render_music(background_music, script_data.get('estimated_duration', 60), path)
+            ))
+            audio_paths.append(step_path)
+        
+        # Final mux of segments and audio into the output file
+        mux_inputs = hash_inputs(segment_hashes, audio_hashes, os.path.abspath(output_path))
+        if not manifest.is_complete("mux", mux_inputs):
+            self._mux(script_data, segment_paths, audio_paths, visual_style, output_path)
+            manifest.mark_complete("mux", output_path, mux_inputs)
+        
+        manifest.mark_finished()
+        # The output is committed; intermediate segments and audio are no longer needed
+        shutil.rmtree(work_dir, ignore_errors=True)
+        return manifest
+    
+    def _render_segment(self, section: Dict[str, Any], image: Optional[str], visual_style: str, path: str):
+        """Render the video segment for one script section"""
+        with open(path, 'w') as f:
+            f.write(f"Segment: {section.get('type', 'section')} ({section.get('duration', 10)}s)\n")
+            f.write(f"Style: {visual_style}\n")
+            f.write(f"Background: {image or 'none'}\n")
+            f.write(f"Text: {section.get('text', '')}\n")
+    
+    def _render_narration(self, sections: List[Dict[str, Any]], path: str):
+        """Render the text-to-speech narration track"""
+        with open(path, 'w') as f:
+            for section in sections:
+                f.write(f"[{section.get('type', 'section')}] {section.get('text', '')}\n")
+    
+    def _render_music(self, background_music: str, duration: int, path: str):
+        """Trim or loop the background music track to the video duration"""
+        with open(path, 'w') as f:
+            f.write(f"Music: {background_music} ({duration}s)\n")
+    
+    def _mux(self,
+             script_data: Dict[str, Any],
+             segment_paths: List[str],
+             audio_paths: List[str],
+             visual_style: str,
+             output_path: str):
+        """Combine the rendered segments and audio tracks into the output video"""
+        tmp_path = f"{output_path}.part"
         # Create a placeholder video file with a note about actual implementation
-        with open(output_path, 'w') as f:
+        with open(tmp_path, 'w') as f:
             f.write(f"This is a placeholder for a video file: {script_data.get('title', 'Untitled')}\n")
             f.write("In a production environment, this would be an actual MP4 video created with:\n")
             f.write("1. Text-to-speech audio generation for narration\n")
@@ -88,12 +321,40 @@ class VideoAssembler:
             f.write("4. Background music\n")
             f.write("5. Intro and outro animations\n")
             f.write(f"\nStyle: {visual_style}\n")
+            f.write(f"Segments: {len(segment_paths)}, audio tracks: {len(audio_paths)}\n")
+        # Only a complete file ever appears at output_path
+        os.replace(tmp_path, output_path)
+    
+    def get_overlay_cache(self):
+        """
+        Get the shared text overlay tile cache for this assembler
         
-        print(f"Video metadata and script created at: {metadata_file_path} and {script_file_path}")
-        print(f"Video placeholder created at: {output_path}")
-        print("Note: For actual video generation, implement MoviePy or FFmpeg integration")
+        Returns:
+            OverlayCache storing tiles under ``<output_dir>/.render/overlays``
+        """
+        if self._overlay_cache is None:
+            from text_overlay import OverlayCache
+            self._overlay_cache = OverlayCache(os.path.join(self.output_dir, ".render", "overlays"))
+        return self._overlay_cache
+    
+    def get_frame_compositor(self, frame_size=(1920, 1080), fps: int = 30, **kwargs):
+        """
+        Create a compositor that streams frames into FFmpeg for this assembler
         
-        return output_path
+        ``_render`` still writes placeholder segments and does not call it;
+        it is meant for callers rendering real frames.
+        
+        Args:
+            frame_size: (width, height) of the output video
+            fps: Frames per second
+            **kwargs: Additional FrameCompositor settings
+            
+        Returns:
+            FrameCompositor sharing this assembler's overlay cache
+        """
+        from frame_compositor import FrameCompositor
+        return FrameCompositor(frame_size=frame_size, fps=fps,
+                               overlay_cache=self.get_overlay_cache(), **kwargs)
     
     def get_available_styles(self) -> List[Dict[str, Any]]:
         """
@@ -102,60 +363,38 @@ class VideoAssembler:
         Returns:
             List of style dictionaries with name and description
         """
-        return [
-            {
-                "name": "standard",
-                "description": "Clean, professional look with subtle animations"
-            },
-            {
-                "name": "minimal",
-                "description": "Simple, text-focused design with minimal distractions"
-            },
-            {
-                "name": "vibrant",
-                "description": "Colorful, energetic style with bold text and animations"
-            },
-            {
-                "name": "educational",
-                "description": "Focused on clarity with diagrams and explanatory elements"
-            }
-        ]
+        return [dict(style) for style in VIDEO_STYLES]
     
     def get_available_background_music(self) -> List[Dict[str, Any]]:
         """
         Get available background music tracks
         
+        The folder listing is memoized and only re-read when the music
+        folder's modification time changes (a file added or removed).
+        
         Returns:
             List of music dictionaries with name and path
         """
         music_dir = os.path.join(self.assets_dir, "music")
-        music_files = [f for f in os.listdir(music_dir) if f.endswith(('.mp3', '.wav'))] if os.path.exists(music_dir) else []
+        try:
+            version = os.stat(music_dir).st_mtime_ns
+        except OSError:
+            version = None
         
-        # If no music files found, return placeholder data
-        if not music_files:
-            return [
+        if self._music_catalog is None or self._music_catalog[0] != version:
+            music_files = sorted(f for f in os.listdir(music_dir) if f.endswith(('.mp3', '.wav'))) if version is not None else []
+            tracks = [
                 {
-                    "name": "Upbeat",
-                    "path": "placeholder_upbeat.mp3",
-                    "description": "Energetic and positive background music"
-                },
-                {
-                    "name": "Calm",
-                    "path": "placeholder_calm.mp3",
-                    "description": "Relaxing and peaceful background music"
-                },
-                {
-                    "name": "Mysterious",
-                    "path": "placeholder_mysterious.mp3",
-                    "description": "Intriguing and curious background music"
-                }
+                    "name": os.path.splitext(f)[0],
+                    "path": os.path.join(music_dir, f),
+                    "description": f"Background music: {os.path.splitext(f)[0]}"
+                } for f in music_files
             ]
+            # If no music files found, return placeholder data
+            self._music_catalog = (version, tracks or PLACEHOLDER_MUSIC)
         
-        # Return actual music files
-        return [
-            {
-                "name": os.path.splitext(f)[0],
-                "path": os.path.join(music_dir, f),
-                "description": f"Background music: {os.path.splitext(f)[0]}"
-            } for f in music_files
-        ]
+        return [dict(track) for track in self._music_catalog[1]]
+    
+    def invalidate_asset_catalog(self):
+        """Forget memoized asset listings so the next call re-reads the folders"""
+        self._music_catalog = None
@@ -0,0 +1,268 @@
+"""
+Video Manifest Module for YouTube Automation
+Append-only JSONL log of video records with an offset index for lookups
+"""
+
+import os
+import json
+import atexit
+import time
+import threading
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+
+SEGMENT_PREFIX = "manifest-"
+DATA_SUFFIX = ".jsonl"
+INDEX_SUFFIX = ".idx"
+
+
+class VideoManifest:
+    """
+    Stores one compact JSON record per video in segmented, append-only files
+
+    Records are appended to ``manifest-NNNNNN.jsonl`` segments that roll over
+    at ``segment_max_bytes``. Each segment has a sidecar ``.idx`` file of
+    ``video_id<TAB>offset<TAB>length`` lines, so a record can be read back with a
+    single seek instead of scanning the log. Writes are fsynced in batches
+    (every ``fsync_every`` records or ``fsync_interval`` seconds, whichever
+    comes first). A timer syncs the last batch when appends stop, and the
+    manifest is closed at exit; call ``flush()`` to force durability sooner.
+    """
+
+    def __init__(self,
+                 manifest_dir: str,
+                 segment_max_bytes: int = 64 * 1024 * 1024,
+                 fsync_every: int = 32,
+                 fsync_interval: float = 1.0):
+        """
+        Initialize the VideoManifest
+
+        Args:
+            manifest_dir: Directory holding the manifest segments
+            segment_max_bytes: Size at which a new segment is started
+            fsync_every: Number of appends between fsyncs
+            fsync_interval: Maximum seconds between fsyncs
+        """
+        self.manifest_dir = manifest_dir
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+
+        self._lock = threading.Lock()
+        self._index: Dict[str, Tuple[int, int, int]] = {}
+        self._segment_number = 0
+        self._data_file = None
+        self._index_file = None
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._sync_timer = None
+
+        os.makedirs(manifest_dir, exist_ok=True)
+        self._load_index()
+        atexit.register(self.close)
+
+    def _segment_path(self, number: int, suffix: str) -> str:
+        """Get the path of a segment data or index file"""
+        return os.path.join(self.manifest_dir, f"{SEGMENT_PREFIX}{number:06d}{suffix}")
+
+    def _segment_numbers(self) -> List[int]:
+        """List existing segment numbers in order"""
+        numbers = []
+        for name in os.listdir(self.manifest_dir):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(DATA_SUFFIX):
+                try:
+                    numbers.append(int(name[len(SEGMENT_PREFIX):-len(DATA_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(numbers)
+
+    def _load_index(self):
+        """Load the offset index, rebuilding any part the last run didn't persist"""
+        numbers = self._segment_numbers()
+        for number in numbers:
+            data_path = self._segment_path(number, DATA_SUFFIX)
+            index_path = self._segment_path(number, INDEX_SUFFIX)
+            data_size = os.path.getsize(data_path)
+            indexed_end = 0
+            valid_index_bytes = 0
+            if os.path.exists(index_path):
+                with open(index_path, 'rb') as f:
+                    for line in f:
+                        parts = line.decode('utf-8', 'replace').rstrip('\n').split('\t')
+                        if not line.endswith(b'\n') or len(parts) != 3:
+                            # Torn write from a crash; the data scan below recovers it
+                            break
+                        video_id, offset, length = parts[0], int(parts[1]), int(parts[2])
+                        if offset + length > data_size:
+                            # Index entry for a record that never reached the data file
+                            break
+                        self._index[video_id] = (number, offset, length)
+                        indexed_end = max(indexed_end, offset + length)
+                        valid_index_bytes += len(line)
+                if os.path.getsize(index_path) > valid_index_bytes:
+                    with open(index_path, 'r+b') as f:
+                        f.truncate(valid_index_bytes)
+
+            if data_size > indexed_end:
+                self._reindex_tail(number, indexed_end)
+
+        self._segment_number = numbers[-1] if numbers else 1
+
+    def _reindex_tail(self, number: int, start: int):
+        """Index records written after the last persisted index entry"""
+        data_path = self._segment_path(number, DATA_SUFFIX)
+        valid_end = start
+        entries = []
+        with open(data_path, 'rb') as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                entries.append((str(record.get("video_id")), offset, len(line)))
+                offset += len(line)
+                valid_end = offset
+
+        # Drop a partially written last record so new appends start on a clean line
+        if os.path.getsize(data_path) > valid_end:
+            with open(data_path, 'r+b') as f:
+                f.truncate(valid_end)
+
+        with open(self._segment_path(number, INDEX_SUFFIX), 'a') as f:
+            for video_id, offset, length in entries:
+                self._index[video_id] = (number, offset, length)
+                f.write(f"{video_id}\t{offset}\t{length}\n")
+
+    def _open_segment(self):
+        """Open the active segment for appending, rolling over when it is full"""
+        data_path = self._segment_path(self._segment_number, DATA_SUFFIX)
+        if os.path.exists(data_path) and os.path.getsize(data_path) >= self.segment_max_bytes:
+            self._segment_number += 1
+            data_path = self._segment_path(self._segment_number, DATA_SUFFIX)
+        self._data_file = open(data_path, 'ab')
+        self._index_file = open(self._segment_path(self._segment_number, INDEX_SUFFIX), 'a')
+
+    def _close_segment(self):
+        """Sync and close the active segment files"""
+        if self._data_file:
+            self._sync()
+            self._data_file.close()
+            self._index_file.close()
+            self._data_file = None
+            self._index_file = None
+
+    def _sync(self):
+        """Flush and fsync pending appends"""
+        if self._sync_timer is not None:
+            self._sync_timer.cancel()
+            self._sync_timer = None
+        self._data_file.flush()
+        os.fsync(self._data_file.fileno())
+        self._index_file.flush()
+        os.fsync(self._index_file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def append(self, record: Dict[str, Any]) -> str:
+        """
+        Append a video record to the manifest
+
+        Args:
+            record: Record dictionary; must contain a 'video_id'
+
+        Returns:
+            The video id of the appended record
+        """
+        video_id = record.get("video_id")
+        if not video_id:
+            raise ValueError("Manifest records require a 'video_id'")
+        video_id = str(video_id)
+        if '\t' in video_id or '\n' in video_id:
+            raise ValueError(f"Invalid video id: {video_id!r}")
+
+        line = (json.dumps(record, separators=(',', ':'), default=str) + '\n').encode('utf-8')
+
+        with self._lock:
+            if self._data_file is None:
+                self._open_segment()
+            elif self._data_file.tell() >= self.segment_max_bytes:
+                self._close_segment()
+                self._open_segment()
+
+            offset = self._data_file.tell()
+            self._data_file.write(line)
+            self._index_file.write(f"{video_id}\t{offset}\t{len(line)}\n")
+            self._index[video_id] = (self._segment_number, offset, len(line))
+
+            self._pending += 1
+            if (self._pending >= self.fsync_every
+                    or time.monotonic() - self._last_sync >= self.fsync_interval):
+                self._sync()
+            elif self._sync_timer is None:
+                self._sync_timer = threading.Timer(self.fsync_interval, self._sync_pending)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+
+        return video_id
+
+    def _sync_pending(self):
+        """Timer callback: fsync appends left over when appends stopped"""
+        with self._lock:
+            self._sync_timer = None
+            if self._data_file is not None and self._pending:
+                self._sync()
+
+    def get(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the latest record for a video
+
+        Args:
+            video_id: Video id to look up
+
+        Returns:
+            Record dictionary, or None if the video is not in the manifest
+        """
+        with self._lock:
+            location = self._index.get(str(video_id))
+            if location is None:
+                return None
+            number, offset, length = location
+            if self._data_file is not None and number == self._segment_number:
+                self._data_file.flush()
+
+        with open(self._segment_path(number, DATA_SUFFIX), 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
+
+    def __contains__(self, video_id: str) -> bool:
+        return str(video_id) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def video_ids(self) -> List[str]:
+        """Get the ids of all videos in the manifest"""
+        with self._lock:
+            return list(self._index)
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over all records in append order, including superseded ones"""
+        self.flush()
+        for number in self._segment_numbers():
+            with open(self._segment_path(number, DATA_SUFFIX), 'rb') as f:
+                for line in f:
+                    yield json.loads(line)
+
+    def flush(self):
+        """Force pending appends to disk"""
+        with self._lock:
+            if self._data_file is not None:
+                self._sync()
+
+    def close(self):
+        """Flush and close the manifest"""
+        with self._lock:
+            self._close_segment()
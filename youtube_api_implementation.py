@@ -5,30 +5,234 @@ that doesn't require browser interaction after initial setup.
 """
 
 import os
+import time
+import random
+import socket
 import pickle
 import json
+import hashlib
+import mimetypes
+import threading
+import http.client
+from datetime import datetime, timezone
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import httplib2
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
+from quota_ledger import QuotaBudgetExceeded
+from http_transport import authorized_http
 
 # Scopes required for YouTube API - using minimal scopes to reduce risk of account shutdown
 SCOPES = [
     'https://www.googleapis.com/auth/youtube.upload',  # For uploading videos
-    'https://www.googleapis.com/auth/youtube.readonly'  # For reading channel info
+    'https://www.googleapis.com/auth/youtube.readonly',  # For reading channel info
+    'https://www.googleapis.com/auth/youtube.force-ssl'  # For updating video metadata
 ]
 
+# Resumable upload tuning
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024  # Must be a multiple of 256 KiB
+UPLOAD_CHUNK_ALIGNMENT = 256 * 1024
+# Bytes read per bandwidth-limiter draw, so a throttled chunk is paced in small steps
+THROTTLED_READ_SIZE = 64 * 1024
+MAX_UPLOAD_RETRIES = 10
+MAX_RETRY_BACKOFF = 64
+RETRIABLE_STATUS_CODES = (500, 502, 503, 504)
+# Network failures only; local file errors (also OSError) are not retried
+RETRIABLE_EXCEPTIONS = (httplib2.HttpLib2Error, ConnectionError, socket.timeout, http.client.NotConnected,
+                        http.client.IncompleteRead, http.client.ImproperConnectionState,
+                        http.client.CannotSendRequest, http.client.CannotSendHeader,
+                        http.client.ResponseNotReady, http.client.BadStatusLine)
+# Maximum ids accepted by a single videos().list call
+VIDEOS_LIST_MAX_IDS = 50
+# Fields update_videos_metadata accepts besides video_id
+METADATA_FIELDS = ("title", "description", "tags", "category_id", "privacy_status")
+# Upload session URIs stay valid for about a week; expired ones return 404/410
+EXPIRED_SESSION_STATUS_CODES = (404, 410)
+# Refresh access tokens this many seconds before they expire
+TOKEN_REFRESH_MARGIN = 300
+TOKEN_REFRESH_RETRY = 60
+
+# Process-wide state shared by every client instance
+_discovery_document = None
+_credentials_lock = threading.Lock()
+_credentials_cache = {}
+_refresh_timers = {}
+
+def get_discovery_document(root_url=None):
+    """
+    Get the YouTube v3 discovery document bundled with googleapiclient
+    
+    The document is parsed once per process and never fetched over the
+    network. Pass root_url to point the client at another server, such as
+    a local test server.
+    """
+    global _discovery_document
+    if _discovery_document is None:
+        document = get_static_doc('youtube', 'v3')
+        if document is None:
+            return None
+        _discovery_document = json.loads(document)
+    if not root_url:
+        return _discovery_document
+    root_url = root_url.rstrip('/') + '/'
+    document = dict(_discovery_document)
+    document['rootUrl'] = root_url
+    document['mtlsRootUrl'] = root_url
+    document['baseUrl'] = root_url + document['servicePath']
+    return document
+
+def build_youtube_client(credentials=None, root_url=None, http=None):
+    """
+    Build a YouTube v3 service object from the cached discovery document
+    
+    Unless http is given, requests go over the shared keep-alive transport
+    from http_transport, so the service object may be used from any thread.
+    """
+    if http is None:
+        http = authorized_http(credentials)
+    document = get_discovery_document(root_url)
+    if document is None:
+        # Older googleapiclient releases don't bundle discovery documents
+        return build('youtube', 'v3', http=http)
+    return build_from_document(document, http=http)
+
+def _save_credentials(token_file, credentials):
+    """Write credentials to the token pickle atomically"""
+    tmp_path = f"{token_file}.tmp"
+    with open(tmp_path, 'wb') as token:
+        pickle.dump(credentials, token)
+    os.replace(tmp_path, token_file)
+
+def _remember_credentials(token_file, credentials):
+    """Keep credentials in memory and refresh them in the background before they expire"""
+    key = os.path.abspath(token_file)
+    with _credentials_lock:
+        # Already cached with its timer armed; the timer re-arms itself after every refresh
+        if _credentials_cache.get(key) is credentials and key in _refresh_timers:
+            return
+        _credentials_cache[key] = credentials
+    _schedule_refresh(key, credentials)
+
+def _schedule_refresh(key, credentials, delay=None, min_delay=0):
+    """Start a timer that refreshes credentials just before expiry, and no sooner than min_delay"""
+    if not credentials.refresh_token or credentials.expiry is None:
+        return
+    if delay is None:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        delay = (credentials.expiry - now).total_seconds() - TOKEN_REFRESH_MARGIN
+    timer = threading.Timer(max(min_delay, delay), _refresh_credentials, args=(key, credentials))
+    timer.daemon = True
+    with _credentials_lock:
+        previous = _refresh_timers.get(key)
+        if previous is not None:
+            previous.cancel()
+        _refresh_timers[key] = timer
+    timer.start()
+
+def _refresh_credentials(key, credentials):
+    """Refresh credentials on the timer thread so requests never wait on it"""
+    with _credentials_lock:
+        if _credentials_cache.get(key) is not credentials:
+            return
+    try:
+        credentials.refresh(Request())
+        _save_credentials(key, credentials)
+    except Exception as e:
+        print(f"Background token refresh failed: {str(e)}")
+        _schedule_refresh(key, credentials, delay=TOKEN_REFRESH_RETRY)
+        return
+    # Tokens living less than TOKEN_REFRESH_MARGIN would otherwise be refreshed back to back
+    _schedule_refresh(key, credentials, min_delay=TOKEN_REFRESH_RETRY)
+
+class BandwidthLimiter:
+    """Token bucket shared by concurrent uploads to cap their combined rate"""
+    
+    def __init__(self, bytes_per_second, burst_bytes=None):
+        self.rate = float(bytes_per_second)
+        self.capacity = float(burst_bytes or bytes_per_second)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+        
+    def consume(self, num_bytes):
+        """Block until num_bytes may be sent"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= num_bytes or self.tokens >= self.capacity:
+                    self.tokens -= num_bytes
+                    return
+                wait = (min(num_bytes, self.capacity) - self.tokens) / self.rate
+            time.sleep(wait)
+
+class _ThrottledReader:
+    """File wrapper that draws from a BandwidthLimiter every THROTTLED_READ_SIZE bytes"""
+    
+    def __init__(self, fd, limiter):
+        self.fd = fd
+        self.limiter = limiter
+        
+    def read(self, size=-1):
+        # Paced sub-reads, so one chunk doesn't take a second's worth of tokens in a single draw
+        parts = []
+        while size < 0 or size > 0:
+            step = THROTTLED_READ_SIZE if size < 0 else min(size, THROTTLED_READ_SIZE)
+            data = self.fd.read(step)
+            if not data:
+                break
+            self.limiter.consume(len(data))
+            parts.append(data)
+            if size > 0:
+                size -= len(data)
+        return b"".join(parts)
+        
+    def seek(self, offset, whence=os.SEEK_SET):
+        return self.fd.seek(offset, whence)
+        
+    def tell(self):
+        return self.fd.tell()
+        
+    def close(self):
+        self.fd.close()
+
 class YouTubeAPIRefreshToken:
     """YouTube API wrapper using refresh token authentication"""
     
-    def __init__(self, client_secrets_file=None, token_file='youtube_token.pickle'):
-        """Initialize the YouTube API client"""
+    def __init__(self, client_secrets_file=None, token_file='youtube_token.pickle', cache=None,
+                 quota_ledger=None, root_url=None):
+        """
+        Initialize the YouTube API client
+        
+        Pass an AnalyticsCache as cache to serve channel and video statistics
+        from a persistent TTL cache instead of calling the API every time.
+        Pass a QuotaLedger as quota_ledger to charge every call against the
+        daily quota; low-priority reads and metadata updates are then refused
+        once only the upload reserve is left, except background cache
+        refreshes and updates passed defer=True, which wait in the ledger's
+        QuotaScheduler until the budget allows them.
+        Pass root_url to send requests to another server (e.g. a local
+        test server) instead of www.googleapis.com.
+        """
         self.client_secrets_file = client_secrets_file
         self.token_file = token_file
         self.credentials = None
         self.youtube = None
+        self.cache = cache
+        self.quota_ledger = quota_ledger
+        self.root_url = root_url
+    
+    @property
+    def quota_scheduler(self):
+        """The ledger's QuotaScheduler, shared by every client of the ledger and started on first use"""
+        return self.quota_ledger.scheduler() if self.quota_ledger is not None else None
         
     def authenticate_with_browser(self):
         """
@@ -46,8 +250,8 @@ class YouTubeAPIRefreshToken:
         credentials = flow.run_local_server(port=8501)
         
         # Save credentials to file
-        with open(self.token_file, 'wb') as token:
-            pickle.dump(credentials, token)
+        _save_credentials(self.token_file, credentials)
+        _remember_credentials(self.token_file, credentials)
             
         self.credentials = credentials
         return credentials
@@ -56,36 +260,35 @@ class YouTubeAPIRefreshToken:
         """
         Authenticate with YouTube API using saved refresh token
         This can be done without browser interaction
+        
+        Credentials are loaded from the token file once per process and then
+        reused by every client; a background timer refreshes them before
+        they expire. Expired credentials with a refresh token are refreshed
+        by that timer right away (or by the transport on the first request,
+        whichever comes first), so authenticate() never waits on it.
         """
-        credentials = None
+        with _credentials_lock:
+            credentials = _credentials_cache.get(os.path.abspath(self.token_file))
         
         # Check if token file exists
-        if os.path.exists(self.token_file):
+        if credentials is None and os.path.exists(self.token_file):
             with open(self.token_file, 'rb') as token:
                 credentials = pickle.load(token)
                 
-        # If no valid credentials available, need initial browser auth
-        if not credentials or not credentials.valid:
-            if credentials and credentials.expired and credentials.refresh_token:
-                # If we have a refresh token, use it to get a new access token
-                credentials.refresh(Request())
-                
-                # Save refreshed credentials
-                with open(self.token_file, 'wb') as token:
-                    pickle.dump(credentials, token)
-            else:
-                # If no refresh token, need browser auth
-                if not self.client_secrets_file:
-                    raise ValueError(
-                        "No valid credentials found. Run authenticate_with_browser() first "
-                        "with a client_secrets_file to get a refresh token."
-                    )
-                credentials = self.authenticate_with_browser()
-                
+        # Without a refresh token, need initial browser auth
+        if not credentials or not (credentials.valid or credentials.refresh_token):
+            if not self.client_secrets_file:
+                raise ValueError(
+                    "No valid credentials found. Run authenticate_with_browser() first "
+                    "with a client_secrets_file to get a refresh token."
+                )
+            credentials = self.authenticate_with_browser()
+        
+        _remember_credentials(self.token_file, credentials)
         self.credentials = credentials
         
         # Build the YouTube API client
-        self.youtube = build('youtube', 'v3', credentials=credentials)
+        self.youtube = build_youtube_client(credentials, self.root_url)
         return self.youtube
         
     def get_channel_info(self):
@@ -93,19 +296,40 @@ class YouTubeAPIRefreshToken:
         if not self.youtube:
             self.authenticate()
             
+        if self.cache is not None:
+            return self.cache.get_or_fetch(
+                "channel_info", "mine", self._fetch_channel_info
+            )
+        return self._fetch_channel_info()
+        
+    def _fetch_channel_info(self, http=None):
+        """Fetch channel information from the API"""
         request = self.youtube.channels().list(
             part="snippet,contentDetails,statistics",
             mine=True
         )
-        response = request.execute()
+        response = self._execute(request, "channels.list", "high", http=http)
         
         if response.get('items'):
             return response['items'][0]
         return None
         
     def upload_video(self, file_path, title, description, tags=None, category_id="22", 
-                    privacy_status="private", notify_subscribers=True):
-        """Upload a video to YouTube"""
+                    privacy_status="private", notify_subscribers=True, chunk_size=DEFAULT_CHUNK_SIZE,
+                    progress_callback=None, max_retries=MAX_UPLOAD_RETRIES, session_file=None,
+                    bandwidth_limiter=None, retry_callback=None):
+        """
+        Upload a video to YouTube in resumable chunks
+        
+        Each chunk is retried with exponential backoff on 5xx responses and
+        connection errors. The upload session URI is saved next to the video
+        (or to session_file) so a new process can continue an interrupted upload.
+        progress_callback(bytes_uploaded, total_bytes) is called after every chunk
+        and retry_callback(retry, max_retries, error, delay) before every retry.
+        Pass bandwidth_limiter to share a rate cap with other uploads; chunks
+        are then capped at about one second of the limiter's rate, so each
+        request goes out at the capped pace instead of in large bursts.
+        """
         if not self.youtube:
             self.authenticate()
             
@@ -129,52 +353,349 @@ class YouTubeAPIRefreshToken:
             "notifySubscribers": notify_subscribers
         }
         
-        # Create the media upload object
-        media = MediaFileUpload(file_path, resumable=True)
+        session_file = session_file or f"{file_path}.upload-session.json"
+        session_key = self._upload_session_key(file_path, body)
+        if bandwidth_limiter:
+            chunk_size = min(chunk_size, int(bandwidth_limiter.rate))
+        chunk_size = max(UPLOAD_CHUNK_ALIGNMENT, chunk_size // UPLOAD_CHUNK_ALIGNMENT * UPLOAD_CHUNK_ALIGNMENT)
+        
+        total_bytes = os.path.getsize(file_path)
+        request = self._build_upload_request(file_path, body, chunk_size, bandwidth_limiter)
+        resumable_uri = self._load_upload_session(session_file, session_key)
+        response = None
+        if resumable_uri:
+            # Ask the server how much it already has before sending more data
+            retry = 0
+            while True:
+                try:
+                    response = self._resume_upload(request, resumable_uri, total_bytes)
+                    break
+                except HttpError as e:
+                    if e.resp.status in EXPIRED_SESSION_STATUS_CODES:
+                        # Saved session expired; start a fresh upload
+                        self._clear_upload_session(session_file)
+                        resumable_uri = None
+                        break
+                    if e.resp.status not in RETRIABLE_STATUS_CODES:
+                        self._close_upload_request(request)
+                        raise
+                    error = e
+                except RETRIABLE_EXCEPTIONS as e:
+                    error = e
+                try:
+                    retry = self._backoff_upload(retry, max_retries, error, retry_callback)
+                except BaseException:
+                    self._close_upload_request(request)
+                    raise
+        # Resumed sessions were charged for when they started
+        charged = not resumable_uri and self._reserve_upload_quota()
+        
+        retry = 0
+        try:
+            while response is None:
+                try:
+                    # After a failed chunk, next_chunk asks the server for its committed offset first
+                    status, response = request.next_chunk()
+                    retry = 0
+                except HttpError as e:
+                    status_code = e.resp.status
+                    if resumable_uri and status_code in EXPIRED_SESSION_STATUS_CODES:
+                        # Saved session expired; start a fresh upload
+                        self._clear_upload_session(session_file)
+                        self._close_upload_request(request)
+                        request = self._build_upload_request(file_path, body, chunk_size, bandwidth_limiter)
+                        resumable_uri = None
+                        charged = self._reserve_upload_quota()
+                        continue
+                    if status_code not in RETRIABLE_STATUS_CODES:
+                        raise
+                    retry = self._backoff_upload(retry, max_retries, e, retry_callback)
+                    continue
+                except RETRIABLE_EXCEPTIONS as e:
+                    retry = self._backoff_upload(retry, max_retries, e, retry_callback)
+                    continue
+                
+                if request.resumable_uri and request.resumable_uri != resumable_uri:
+                    resumable_uri = request.resumable_uri
+                    self._save_upload_session(session_file, session_key, resumable_uri)
+                
+                if progress_callback:
+                    uploaded = total_bytes if response is not None else request.resumable_progress
+                    progress_callback(uploaded, total_bytes)
+        except BaseException:
+            if charged and not resumable_uri:
+                # The API never started this upload, so it cost no quota
+                self.quota_ledger.refund("videos.insert", self.quota_ledger.cost("videos.insert"))
+            raise
+        finally:
+            self._close_upload_request(request)
+        
+        self._clear_upload_session(session_file)
+        self.invalidate_cache()
+        return response
+    
+    def upload_videos(self, batch, max_parallel=3, max_bytes_per_second=None, progress_callback=None):
+        """
+        Upload several videos concurrently
+        
+        Args:
+            batch: List of dicts of upload_video keyword arguments
+                (file_path, title, description, tags, ...)
+            max_parallel: Maximum number of simultaneous uploads
+            max_bytes_per_second: Optional cap on combined upload bandwidth
+            progress_callback: Optional callable(index, bytes_uploaded, total_bytes)
+            
+        Returns:
+            List of result dicts in batch order, each with file_path, status
+            ("uploaded" or "failed"), response and error
+        """
+        if not self.youtube:
+            self.authenticate()
+        
+        limiter = BandwidthLimiter(max_bytes_per_second) if max_bytes_per_second else None
         
-        # Execute the upload request
-        request = self.youtube.videos().insert(
+        # The service's shared transport checks a pooled connection out for each request
+        def upload_one(index, item):
+            item_progress = None
+            if progress_callback:
+                item_progress = lambda uploaded, total: progress_callback(index, uploaded, total)
+            try:
+                response = self.upload_video(bandwidth_limiter=limiter,
+                                             progress_callback=item_progress, **item)
+                return {"file_path": item.get("file_path"), "status": "uploaded",
+                        "response": response, "error": None}
+            except Exception as e:
+                return {"file_path": item.get("file_path"), "status": "failed",
+                        "response": None, "error": str(e)}
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_parallel), thread_name_prefix="youtube-upload") as executor:
+            futures = [executor.submit(upload_one, i, item) for i, item in enumerate(batch)]
+            return [future.result() for future in futures]
+    
+    def _reserve_upload_quota(self):
+        """Charge a new upload against the quota; returns whether anything was charged"""
+        if self.quota_ledger is None:
+            return False
+        self.quota_ledger.reserve("videos.insert", "high")
+        return True
+    
+    def _build_upload_request(self, file_path, body, chunk_size, bandwidth_limiter=None):
+        """Create a resumable videos().insert request for a file"""
+        if bandwidth_limiter:
+            mimetype = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+            media = MediaIoBaseUpload(_ThrottledReader(open(file_path, 'rb'), bandwidth_limiter),
+                                      mimetype, chunksize=chunk_size, resumable=True)
+        else:
+            media = MediaFileUpload(file_path, chunksize=chunk_size, resumable=True)
+        return self.youtube.videos().insert(
             part=",".join(body.keys()),
             body=body,
             media_body=media
         )
+    
+    def _close_upload_request(self, request):
+        """Close the file handle held by an upload request"""
+        stream = request.resumable.stream() if request.resumable else None
+        if stream is not None:
+            stream.close()
+    
+    def _resume_upload(self, request, resumable_uri, total_bytes):
+        """
+        Point a request at a saved upload session, continuing from the server's committed offset
         
-        # Upload the video
-        response = request.execute()
-        return response
+        Returns:
+            The videos.insert response if the server already has the whole file, else None
+        """
+        resp, content = request.http.request(resumable_uri, "PUT",
+                                     headers={"Content-Range": f"bytes */{total_bytes}", "Content-Length": "0"})
+        if resp.status in (200, 201):
+            return request.postproc(resp, content)
+        if resp.status != 308:
+            raise HttpError(resp, content, uri=resumable_uri)
+        request.resumable_uri = resumable_uri
+        # "Range: bytes=0-N" means N + 1 bytes are committed; no Range means none
+        committed = resp.get("range")
+        request.resumable_progress = int(committed.split("-")[1]) + 1 if committed else 0
+        return None
+    
+    def _backoff_upload(self, retry, max_retries, error, retry_callback=None):
+        """Sleep before retrying a failed chunk; returns the new retry count"""
+        retry += 1
+        if retry > max_retries:
+            raise error
+        delay = min(MAX_RETRY_BACKOFF, 2 ** retry) * random.uniform(0.5, 1.0)
+        if retry_callback:
+            retry_callback(retry, max_retries, error, delay)
+        time.sleep(delay)
+        return retry
+    
+    def _upload_session_key(self, file_path, body):
+        """Identify an upload by file identity and metadata so stale sessions aren't reused"""
+        stat = os.stat(file_path)
+        raw = json.dumps([os.path.abspath(file_path), stat.st_size, stat.st_mtime, body], sort_keys=True)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+    
+    def _load_upload_session(self, session_file, session_key):
+        """Get a saved resumable session URI for this upload, if any"""
+        if not os.path.exists(session_file):
+            return None
+        try:
+            with open(session_file, 'r') as f:
+                session = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if session.get("key") != session_key:
+            return None
+        return session.get("resumable_uri")
+    
+    def _save_upload_session(self, session_file, session_key, resumable_uri):
+        """Persist the resumable session URI so another process can resume"""
+        tmp_path = f"{session_file}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"key": session_key, "resumable_uri": resumable_uri, "saved_at": time.time()}, f)
+        os.replace(tmp_path, session_file)
+    
+    def _clear_upload_session(self, session_file):
+        """Remove a saved upload session"""
+        if os.path.exists(session_file):
+            os.remove(session_file)
         
     def get_video_analytics(self, video_id):
         """Get analytics for a specific video"""
         if not self.youtube:
             self.authenticate()
             
+        if self.cache is not None:
+            return self.get_videos_statistics([video_id]).get(video_id)
+            
         # Get basic video statistics
         request = self.youtube.videos().list(
             part="statistics",
             id=video_id
         )
-        response = request.execute()
+        response = self._execute(request, "videos.list", "low")
         
         if response.get('items'):
             return response['items'][0]['statistics']
         return None
         
+    def get_videos_statistics(self, video_ids):
+        """
+        Get statistics for many videos in as few calls as possible
+        
+        Ids are sent 50 per videos().list call, so 500 videos
+        cost 10 requests instead of 500. Returns a dict mapping video id to its
+        statistics; ids YouTube doesn't return (deleted, private) are omitted.
+        With a cache, only missing or expired ids are requested.
+        """
+        if not self.youtube:
+            self.authenticate()
+            
+        # De-duplicate while keeping order
+        ids = list(dict.fromkeys(video_id for video_id in video_ids if video_id))
+        if self.cache is not None:
+            return self.cache.get_or_fetch_many(
+                "video_statistics", ids, self._fetch_videos_statistics,
+                self._deferrable("videos.list", self._fetch_videos_statistics)
+            )
+        return self._fetch_videos_statistics(ids)
+        
+    def _fetch_videos_statistics(self, ids, http=None):
+        """Fetch statistics for a list of video ids from the API"""
+        statistics = {}
+        for start in range(0, len(ids), VIDEOS_LIST_MAX_IDS):
+            request = self.youtube.videos().list(
+                part="statistics",
+                id=",".join(ids[start:start + VIDEOS_LIST_MAX_IDS])
+            )
+            response = self._execute(request, "videos.list", "low", http=http)
+            for item in response.get('items', []):
+                statistics[item['id']] = item.get('statistics', {})
+        return statistics
+        
     def get_channel_analytics(self):
         """Get analytics for the authenticated user's channel"""
         if not self.youtube:
             self.authenticate()
             
-        # Get channel statistics
+        if self.cache is not None:
+            return self.cache.get_or_fetch(
+                "channel_analytics", "mine", self._fetch_channel_analytics,
+                self._deferrable("channels.list", self._fetch_channel_analytics)
+            )
+        return self._fetch_channel_analytics()
+        
+    def _fetch_channel_analytics(self, http=None):
+        """Fetch channel statistics from the API"""
         request = self.youtube.channels().list(
             part="statistics",
             mine=True
         )
-        response = request.execute()
+        response = self._execute(request, "channels.list", "low", http=http)
         
         if response.get('items'):
             return response['items'][0]['statistics']
         return None
         
+    def _execute(self, request, method, priority="high", http=None):
+        """
+        Execute an API request, charging its quota cost first
+        
+        Raises QuotaBudgetExceeded instead of calling the API when the
+        request's priority has no budget left.
+        """
+        if self.quota_ledger is not None:
+            self.quota_ledger.reserve(method, priority)
+        return request.execute(http=http)
+        
+    def _deferrable(self, method, fetch_fn):
+        """
+        Wrap a low-priority fetch so it waits for quota instead of failing
+        
+        Used for background cache refreshes, whose callers already have a
+        (stale) value: with a ledger, the fetch goes through schedule() and
+        the refresh thread waits until the budget allows it.
+        """
+        if self.quota_ledger is None:
+            return fetch_fn
+        return lambda *args: self.schedule(method, lambda: fetch_fn(*args)).result()
+        
+    def schedule(self, method, fn, priority="low"):
+        """
+        Run a client call within the quota budget, deferring it if needed
+        
+        Args:
+            method: API method whose cost decides affordability, e.g. "videos.update"
+            fn: Callable making the call, e.g. lambda: api.update_video_metadata(...)
+            priority: "high" or "low"
+            
+        Returns:
+            Future resolving to fn's result once it has run
+        """
+        if self.quota_ledger is None:
+            raise ValueError("Quota scheduling requires a quota_ledger")
+        return self.quota_scheduler.submit(method, fn, priority)
+        
+    def get_remaining_quota(self, priority="high"):
+        """Get the quota units still available today, or None without a ledger"""
+        if self.quota_ledger is None:
+            return None
+        return self.quota_ledger.remaining(priority)
+        
+    def invalidate_cache(self, video_id=None):
+        """
+        Drop cached channel data, and a video's statistics if video_id is given
+        
+        Called after our own uploads and metadata updates so the next read
+        reflects them.
+        """
+        if self.cache is None:
+            return
+        self.cache.invalidate("channel_info")
+        self.cache.invalidate("channel_analytics")
+        if video_id:
+            self.cache.invalidate("video_statistics", video_id)
+        
     def update_video_metadata(self, video_id, title=None, description=None, tags=None, 
                              category_id=None, privacy_status=None):
         """Update metadata for an existing video"""
@@ -186,53 +707,200 @@ class YouTubeAPIRefreshToken:
             part="snippet,status",
             id=video_id
         )
-        response = request.execute()
+        response = self._execute(request, "videos.list", "low")
         
         if not response.get('items'):
             raise ValueError(f"Video not found with ID: {video_id}")
             
         video = response['items'][0]
-        snippet = video['snippet']
-        status = video['status']
-        
-        # Update fields if provided
-        if title:
-            snippet['title'] = title
-        if description:
-            snippet['description'] = description
-        if tags:
-            snippet['tags'] = tags
-        if category_id:
-            snippet['categoryId'] = category_id
-        if privacy_status:
-            status['privacyStatus'] = privacy_status
+        self._apply_metadata_changes(video, title=title, description=description, tags=tags,
+                                     category_id=category_id, privacy_status=privacy_status)
             
         # Update the video
         request = self.youtube.videos().update(
             part="snippet,status",
             body={
                 "id": video_id,
-                "snippet": snippet,
-                "status": status
+                "snippet": video['snippet'],
+                "status": video['status']
             }
         )
         
-        response = request.execute()
+        response = self._execute(request, "videos.update", "low")
+        self.invalidate_cache(video_id)
         return response
+        
+    def update_videos_metadata(self, changes, max_parallel=4, defer=False):
+        """
+        Update metadata for many videos
+        
+        Current snippets are fetched 50 ids per videos().list call and
+        compared locally; only videos whose metadata actually changes are
+        updated, concurrently. Every change is validated first, and a bad
+        change, a lookup refused by the quota ledger or a failed lookup or
+        update is reported for the videos it affects instead of aborting
+        the batch. With defer=True, changes the quota ledger refuses are
+        queued on the quota scheduler instead and run once the budget allows.
+        
+        Args:
+            changes: List of dicts with video_id and any of title, description,
+                tags, category_id and privacy_status
+            max_parallel: Maximum number of simultaneous update calls
+            defer: Queue changes refused for quota until the budget allows them
+            
+        Returns:
+            List of result dicts in input order, each with video_id, status
+            ("updated", "unchanged", "invalid", "not_found", "quota_exceeded",
+            "deferred" or "failed"), response and error; deferred results also
+            have a "future" resolving to the change's final result dict
+        """
+        if not self.youtube:
+            self.authenticate()
+        
+        results = [None] * len(changes)
+        seen = set()
+        for index, change in enumerate(changes):
+            video_id = change.get('video_id') if isinstance(change, dict) else None
+            if not video_id or not isinstance(video_id, str):
+                results[index] = {"video_id": video_id, "status": "invalid", "response": None,
+                                  "error": "Each change needs a video_id"}
+                continue
+            # Two changes to one video would edit the same fetched resource in concurrent updates
+            if video_id in seen:
+                results[index] = {"video_id": video_id, "status": "invalid", "response": None,
+                                  "error": f"Duplicate change for video {video_id}; combine its fields into one change"}
+                continue
+            seen.add(video_id)
+            unknown = sorted(set(change) - set(METADATA_FIELDS) - {'video_id'})
+            if unknown:
+                results[index] = {"video_id": video_id, "status": "invalid", "response": None,
+                                  "error": f"Unknown metadata fields: {', '.join(unknown)}"}
+        
+        ids = list(dict.fromkeys(change['video_id'] for index, change in enumerate(changes)
+                                 if results[index] is None))
+        videos = {}
+        lookup_errors = {}
+        for start in range(0, len(ids), VIDEOS_LIST_MAX_IDS):
+            batch_ids = ids[start:start + VIDEOS_LIST_MAX_IDS]
+            request = self.youtube.videos().list(
+                part="snippet,status",
+                id=",".join(batch_ids)
+            )
+            try:
+                response = self._execute(request, "videos.list", "low")
+            except QuotaBudgetExceeded as e:
+                lookup_errors.update((video_id, ("quota_exceeded", str(e))) for video_id in batch_ids)
+                continue
+            except Exception as e:
+                lookup_errors.update((video_id, ("failed", str(e))) for video_id in batch_ids)
+                continue
+            for item in response.get('items', []):
+                videos[item['id']] = item
+        
+        updates = []
+        for index, change in enumerate(changes):
+            if results[index] is not None:
+                continue
+            video_id = change['video_id']
+            if video_id in lookup_errors:
+                status, error = lookup_errors[video_id]
+                results[index] = {"video_id": video_id, "status": status, "response": None, "error": error}
+                continue
+            video = videos.get(video_id)
+            if video is None:
+                results[index] = {"video_id": video_id, "status": "not_found", "response": None,
+                                  "error": f"Video not found with ID: {video_id}"}
+                continue
+            fields = {key: value for key, value in change.items() if key != 'video_id'}
+            parts = self._apply_metadata_changes(video, **fields)
+            if not parts:
+                results[index] = {"video_id": video_id, "status": "unchanged", "response": None, "error": None}
+                continue
+            updates.append((index, video, parts))
+        
+        def update_one(video, parts):
+            body = {"id": video['id']}
+            for part in parts:
+                body[part] = video[part]
+            request = self.youtube.videos().update(part=",".join(parts), body=body)
+            try:
+                response = self._execute(request, "videos.update", "low")
+            except QuotaBudgetExceeded as e:
+                return {"video_id": video['id'], "status": "quota_exceeded", "response": None, "error": str(e)}
+            except Exception as e:
+                return {"video_id": video['id'], "status": "failed", "response": None, "error": str(e)}
+            self.invalidate_cache(video['id'])
+            return {"video_id": video['id'], "status": "updated", "response": response, "error": None}
+        
+        if updates:
+            with ThreadPoolExecutor(max_workers=max(1, max_parallel),
+                                    thread_name_prefix="youtube-update") as executor:
+                futures = [(index, executor.submit(update_one, video, parts)) for index, video, parts in updates]
+                for index, future in futures:
+                    results[index] = future.result()
+        
+        if defer and self.quota_ledger is not None:
+            for index, result in enumerate(results):
+                if result["status"] == "quota_exceeded":
+                    future = self.schedule("videos.update",
+                                           lambda change=changes[index]: self._update_when_affordable(change))
+                    results[index] = dict(result, status="deferred", future=future)
+        return results
+    
+    def _update_when_affordable(self, change):
+        """Apply one deferred metadata change, raising QuotaBudgetExceeded so the scheduler waits again if refused"""
+        result = self.update_videos_metadata([change])[0]
+        if result["status"] == "quota_exceeded":
+            raise QuotaBudgetExceeded("videos.update", self.quota_ledger.cost("videos.update"),
+                                      self.quota_ledger.remaining("low"))
+        return result
+        
+    def _apply_metadata_changes(self, video, title=None, description=None, tags=None,
+                                category_id=None, privacy_status=None):
+        """
+        Apply changed fields to a videos().list item; returns the parts that changed
+        
+        None leaves a field as it is; any other value, including an empty
+        description or tag list, replaces it.
+        """
+        snippet = video['snippet']
+        status = video['status']
+        parts = []
+        
+        new_snippet = {
+            "title": title,
+            "description": description,
+            "tags": tags,
+            "categoryId": category_id
+        }
+        for key, value in new_snippet.items():
+            if value is not None and snippet.get(key) != value:
+                snippet[key] = value
+                if "snippet" not in parts:
+                    parts.append("snippet")
+        if privacy_status is not None and status.get('privacyStatus') != privacy_status:
+            status['privacyStatus'] = privacy_status
+            parts.append("status")
+        return parts
 
 # Example usage
-def setup_youtube_api(client_secrets_file=None, token_file='youtube_token.pickle'):
+def setup_youtube_api(client_secrets_file=None, token_file='youtube_token.pickle', cache=None,
+                      quota_ledger=None, root_url=None):
     """
     Set up YouTube API with refresh token authentication
     
     Args:
         client_secrets_file: Path to client secrets JSON file (only needed for initial setup)
         token_file: Path to save/load the token pickle file
+        cache: Optional AnalyticsCache for channel and video statistics
+        quota_ledger: Optional QuotaLedger tracking daily API quota
+        root_url: Optional API root URL overriding https://www.googleapis.com/
         
     Returns:
         YouTubeAPIRefreshToken instance
     """
-    api = YouTubeAPIRefreshToken(client_secrets_file, token_file)
+    api = YouTubeAPIRefreshToken(client_secrets_file, token_file, cache=cache, quota_ledger=quota_ledger,
+                                 root_url=root_url)
     
     try:
         # Try to authenticate with existing token
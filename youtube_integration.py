@@ -7,10 +7,9 @@ import sys
 import pickle
 from pathlib import Path
 import google_auth_oauthlib.flow
-import googleapiclient.discovery
-import googleapiclient.errors
 from google.auth.transport.requests import Request
 from googleapiclient.http import MediaFileUpload
+from youtube_api_implementation import build_youtube_client
 
 # Scopes required for YouTube API
 # If modifying these scopes, delete the file token.pickle
@@ -21,14 +20,23 @@ SCOPES = [
     'https://www.googleapis.com/auth/youtube.force-ssl'
 ]
 
+# Maximum ids accepted by a single videos().list call
+VIDEOS_LIST_MAX_IDS = 50
+
 class YouTubeAPI:
     """YouTube API wrapper for content automation"""
     
-    def __init__(self, client_id=None, client_secret=None, redirect_uri=None):
-        """Initialize the YouTube API client"""
+    def __init__(self, client_id=None, client_secret=None, redirect_uri=None, root_url=None):
+        """
+        Initialize the YouTube API client
+        
+        Pass root_url to send requests to another server (e.g. a local
+        test server) instead of www.googleapis.com.
+        """
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
+        self.root_url = root_url
         self.credentials = None
         self.youtube = None
         
@@ -74,8 +82,7 @@ class YouTubeAPI:
         self.credentials = credentials
         
         # Build the YouTube API client
-        self.youtube = googleapiclient.discovery.build(
-            'youtube', 'v3', credentials=credentials)
+        self.youtube = build_youtube_client(credentials, self.root_url)
             
         return self.youtube
         
@@ -150,6 +157,30 @@ class YouTubeAPI:
             return response['items'][0]['statistics']
         return None
         
+    def get_videos_statistics(self, video_ids):
+        """
+        Get statistics for many videos in as few calls as possible
+        
+        Ids are sent 50 per videos().list call, so 500 videos
+        cost 10 requests instead of 500. Returns a dict mapping video id to its
+        statistics; ids YouTube doesn't return (deleted, private) are omitted.
+        """
+        if not self.youtube:
+            raise ValueError("YouTube API client not authenticated. Call authenticate() first.")
+            
+        # De-duplicate while keeping order
+        ids = list(dict.fromkeys(video_id for video_id in video_ids if video_id))
+        statistics = {}
+        for start in range(0, len(ids), VIDEOS_LIST_MAX_IDS):
+            request = self.youtube.videos().list(
+                part="statistics",
+                id=",".join(ids[start:start + VIDEOS_LIST_MAX_IDS])
+            )
+            response = request.execute()
+            for item in response.get('items', []):
+                statistics[item['id']] = item.get('statistics', {})
+        return statistics
+        
     def get_channel_analytics(self):
         """Get analytics for the authenticated user's channel"""
         if not self.youtube: